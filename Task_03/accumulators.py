@@ -0,0 +1,367 @@
+import rational
+from rational import Rational
+from complex import Complex
+
+# Порог длины знаменателя (в битах), после которого накопленная дробь сокращается.
+# После сокращения порог удваивается относительно длины несократимого знаменателя,
+# поэтому длинные несократимые значения не сокращаются на каждой операции.
+_REDUCE_BITS = 1024
+
+
+def _fraction(value):
+    """
+    Числитель и знаменатель числа (Rational, int, float) или None для чисел других типов.
+    Вещественные числа переводятся в дробь так же, как в конструкторе Rational.
+    """
+
+    if isinstance(value, Rational):
+        return value.numerator, value.denominator
+    if isinstance(value, int):
+        return value, 1
+    if isinstance(value, float):
+        value = Rational(value)
+        return value.numerator, value.denominator
+    return None
+
+
+def _triple(value):
+    """
+    Несокращенная тройка (a, b, d) – число (a + bi) / d – для числа (Complex, Rational, int, float)
+    или None для чисел других типов.
+    """
+
+    if isinstance(value, Complex):
+        real, imaginary = value.real, value.imaginary
+        if real.denominator == imaginary.denominator:
+            return real.numerator, imaginary.numerator, real.denominator
+        return (real.numerator * imaginary.denominator, imaginary.numerator * real.denominator,
+                real.denominator * imaginary.denominator)
+    fraction = _fraction(value)
+    if fraction is None:
+        return None
+    return fraction[0], 0, fraction[1]
+
+
+class RationalAccumulator:
+    """
+    Изменяемый накопитель рационального числа для циклов вида total += x, total *= x.
+    В отличие от операторов Rational, не создает новый объект на каждой операции:
+    числитель и знаменатель хранятся как целые числа и изменяются на месте,
+    а дробь сокращается лишь изредка – когда знаменатель становится длиннее порога или когда читается значение.
+
+    Пример:
+        total = RationalAccumulator()
+        for x, y in zip(left, right):
+            total.add_product(x, y)
+        result = total.value
+    """
+
+    __slots__ = ('_numerator', '_denominator', '_reduce_bits', '_limit')
+
+    def __init__(self, value=0, reduce_bits=_REDUCE_BITS):
+        """
+        :param value: Начальное значение (Rational, int или float).
+        :param reduce_bits: Длина знаменателя в битах, после которой дробь сокращается (натуральное число).
+        """
+
+        fraction = _fraction(value)
+        if fraction is None:
+            raise TypeError("RationalAccumulator accepts only Rational, int and float values.")
+        if reduce_bits < 1:
+            raise ValueError("reduce_bits should be at least 1.")
+        self._numerator, self._denominator = fraction
+        self._reduce_bits = reduce_bits
+        self._limit = reduce_bits
+
+    def _reduce(self):
+        """
+        Сокращает накопленную дробь и пересчитывает порог следующего сокращения.
+        """
+
+        gcd_value = rational._gcd(self._numerator, self._denominator)
+        if gcd_value != 1:
+            self._numerator //= gcd_value
+            self._denominator //= gcd_value
+        self._limit = max(self._reduce_bits, 2 * self._denominator.bit_length())
+
+    @property
+    def value(self):
+        """
+        Накопленное значение – новый неизменяемый объект класса Rational
+        (с учетом текущего контекста арифметики, см. rational.localcontext).
+        Накопитель при этом хранит сокращенную дробь.
+        """
+
+        self._reduce()
+        return Rational._from_coprime(self._numerator, self._denominator)
+
+    def add_product(self, left, right):
+        """
+        Прибавляет произведение двух чисел, не создавая промежуточный объект: total += left * right.
+
+        :param left: Первый множитель (Rational, int или float).
+        :param right: Второй множитель (Rational, int или float).
+        :return: Этот же накопитель.
+        """
+
+        first, second = _fraction(left), _fraction(right)
+        if first is None or second is None:
+            raise TypeError("RationalAccumulator accepts only Rational, int and float values.")
+        self._add(first[0] * second[0], first[1] * second[1])
+        return self
+
+    def _add(self, numerator, denominator):
+        if denominator == self._denominator:
+            self._numerator += numerator
+        elif self._denominator % denominator == 0:
+            # Знаменатель слагаемого делит накопленный знаменатель (в частности, целое слагаемое)
+            self._numerator += numerator * (self._denominator // denominator)
+        else:
+            self._numerator = self._numerator * denominator + numerator * self._denominator
+            self._denominator *= denominator
+            if self._denominator.bit_length() > self._limit:
+                self._reduce()
+
+    def __iadd__(self, other):
+        """
+        Прибавляет число к накопленному значению на месте.
+
+        :param other: Число (Rational, int или float).
+        :return: Этот же накопитель.
+        """
+
+        fraction = _fraction(other)
+        if fraction is None:
+            return NotImplemented
+        self._add(*fraction)
+        return self
+
+    def __isub__(self, other):
+        """
+        Вычитает число из накопленного значения на месте.
+
+        :param other: Число (Rational, int или float).
+        :return: Этот же накопитель.
+        """
+
+        fraction = _fraction(other)
+        if fraction is None:
+            return NotImplemented
+        self._add(-fraction[0], fraction[1])
+        return self
+
+    def __imul__(self, other):
+        """
+        Умножает накопленное значение на число на месте.
+
+        :param other: Число (Rational, int или float).
+        :return: Этот же накопитель.
+        """
+
+        fraction = _fraction(other)
+        if fraction is None:
+            return NotImplemented
+        self._numerator *= fraction[0]
+        if fraction[1] != 1:
+            self._denominator *= fraction[1]
+            if self._denominator.bit_length() > self._limit:
+                self._reduce()
+        return self
+
+    def __itruediv__(self, other):
+        """
+        Делит накопленное значение на число на месте.
+
+        :param other: Число (Rational, int или float), отличное от нуля.
+        :return: Этот же накопитель.
+        """
+
+        fraction = _fraction(other)
+        if fraction is None:
+            return NotImplemented
+        numerator, denominator = fraction
+        if numerator == 0:
+            raise ZeroDivisionError("Cannot divide by zero")
+        if numerator < 0:
+            numerator, denominator = -numerator, -denominator
+        self._numerator *= denominator
+        self._denominator *= numerator
+        if self._denominator.bit_length() > self._limit:
+            self._reduce()
+        return self
+
+    def __float__(self):
+        return float(self.value)
+
+    def __repr__(self):
+        return f"RationalAccumulator({self.value!r})"
+
+
+class ComplexAccumulator:
+    """
+    Изменяемый накопитель комплексного числа (см. RationalAccumulator).
+    Значение хранится несокращенной тройкой целых чисел (a, b, d) – числом (a + bi) / d с общим знаменателем,
+    поэтому сложение и умножение не создают объектов Rational и Complex, а сокращение выполняется
+    лишь изредка – когда знаменатель становится длиннее порога или когда читается значение.
+    """
+
+    __slots__ = ('_real', '_imaginary', '_denominator', '_reduce_bits', '_limit')
+
+    def __init__(self, value=0, reduce_bits=_REDUCE_BITS):
+        """
+        :param value: Начальное значение (Complex, Rational, int или float).
+        :param reduce_bits: Длина знаменателя в битах, после которой числа сокращаются (натуральное число).
+        """
+
+        triple = _triple(value)
+        if triple is None:
+            raise TypeError("ComplexAccumulator accepts only Complex, Rational, int and float values.")
+        if reduce_bits < 1:
+            raise ValueError("reduce_bits should be at least 1.")
+        self._real, self._imaginary, self._denominator = triple
+        self._reduce_bits = reduce_bits
+        self._limit = reduce_bits
+
+    def _reduce(self):
+        """
+        Сокращает тройку на общий делитель и пересчитывает порог следующего сокращения.
+        """
+
+        gcd_value = rational._gcd(self._real, self._imaginary, self._denominator)
+        if gcd_value != 1:
+            self._real //= gcd_value
+            self._imaginary //= gcd_value
+            self._denominator //= gcd_value
+        self._limit = max(self._reduce_bits, 2 * self._denominator.bit_length())
+
+    def _check_limit(self):
+        if self._denominator.bit_length() > self._limit:
+            self._reduce()
+
+    @property
+    def value(self):
+        """
+        Накопленное значение – новый неизменяемый объект класса Complex
+        (части сокращаются по отдельности с учетом текущего контекста арифметики).
+        """
+
+        self._reduce()
+        return Complex._from_parts(Rational._from_normalized(*Rational.reducedfraction(self._real, self._denominator)),
+                                   Rational._from_normalized(*Rational.reducedfraction(self._imaginary,
+                                                                                       self._denominator)))
+
+    def _add(self, real, imaginary, denominator):
+        if denominator == self._denominator:
+            self._real += real
+            self._imaginary += imaginary
+        elif self._denominator % denominator == 0:
+            factor = self._denominator // denominator
+            self._real += real * factor
+            self._imaginary += imaginary * factor
+        else:
+            self._real = self._real * denominator + real * self._denominator
+            self._imaginary = self._imaginary * denominator + imaginary * self._denominator
+            self._denominator *= denominator
+            self._check_limit()
+
+    def _multiply(self, real, imaginary, denominator):
+        if imaginary == 0:
+            self._real *= real
+            self._imaginary *= real
+        else:
+            # Умножение по методу Гаусса: три умножения вместо четырех
+            k1 = real * (self._real + self._imaginary)
+            k2 = self._real * (imaginary - real)
+            k3 = self._imaginary * (real + imaginary)
+            self._real, self._imaginary = k1 - k3, k1 + k2
+        if denominator != 1:
+            self._denominator *= denominator
+            self._check_limit()
+
+    def add_product(self, left, right):
+        """
+        Прибавляет произведение двух чисел, не создавая промежуточный объект: total += left * right.
+
+        :param left: Первый множитель (Complex, Rational, int или float).
+        :param right: Второй множитель (Complex, Rational, int или float).
+        :return: Этот же накопитель.
+        """
+
+        first, second = _triple(left), _triple(right)
+        if first is None or second is None:
+            raise TypeError("ComplexAccumulator accepts only Complex, Rational, int and float values.")
+        a, b, d = first
+        c, e, f = second
+        self._add(a * c - b * e, a * e + b * c, d * f)
+        return self
+
+    def __iadd__(self, other):
+        """
+        Прибавляет число к накопленному значению на месте.
+
+        :param other: Число (Complex, Rational, int или float).
+        :return: Этот же накопитель.
+        """
+
+        triple = _triple(other)
+        if triple is None:
+            return NotImplemented
+        self._add(*triple)
+        return self
+
+    def __isub__(self, other):
+        """
+        Вычитает число из накопленного значения на месте.
+
+        :param other: Число (Complex, Rational, int или float).
+        :return: Этот же накопитель.
+        """
+
+        triple = _triple(other)
+        if triple is None:
+            return NotImplemented
+        self._add(-triple[0], -triple[1], triple[2])
+        return self
+
+    def __imul__(self, other):
+        """
+        Умножает накопленное значение на число на месте.
+
+        :param other: Число (Complex, Rational, int или float).
+        :return: Этот же накопитель.
+        """
+
+        triple = _triple(other)
+        if triple is None:
+            return NotImplemented
+        self._multiply(*triple)
+        return self
+
+    def __itruediv__(self, other):
+        """
+        Делит накопленное значение на число на месте:
+        (a + bi)/d / ((c + ei)/f) = (a + bi)(c - ei) * f / (d * (c^2 + e^2)).
+
+        :param other: Число (Complex, Rational, int или float), отличное от нуля.
+        :return: Этот же накопитель.
+        """
+
+        triple = _triple(other)
+        if triple is None:
+            return NotImplemented
+        c, e, f = triple
+        if c == 0 and e == 0:
+            raise ZeroDivisionError("Cannot divide by zero.")
+        if e == 0:
+            if c < 0:
+                c, f = -c, -f
+            self._multiply(f, 0, c)
+        else:
+            self._multiply(c * f, -e * f, c * c + e * e)
+        return self
+
+    def __complex__(self):
+        return complex(self.value)
+
+    def __repr__(self):
+        return f"ComplexAccumulator({self.value!r})"
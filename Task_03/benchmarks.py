@@ -0,0 +1,330 @@
+"""
+Замеры производительности классов Rational и Complex.
+
+Запуск:
+    python benchmarks.py run --output baseline.json        – замерить все сценарии и сохранить результаты в JSON
+    python benchmarks.py compare baseline.json new.json    – сравнить два замера и сообщить о замедлениях
+    python benchmarks.py layout                            – сравнить раскладки объектов в памяти
+
+Операнды генерируются генератором случайных чисел с фиксированным зерном,
+поэтому все замеры выполняются на одних и тех же данных.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+from rational import Rational
+from complex import Complex
+from complex_array import ComplexArray
+import codec
+from accumulators import RationalAccumulator
+from convolution import convolve
+
+# Зерно генератора операндов
+SEED = 20240101
+
+# Длины операндов (в десятичных цифрах): от машинного слова до нескольких тысяч цифр
+SIZES = (9, 100, 1000, 5000)
+
+# Порог замедления по умолчанию: 10%
+DEFAULT_THRESHOLD = 0.1
+
+
+class _DictRational:
+    """
+    Прежняя раскладка Rational: числитель и знаменатель хранятся в словаре экземпляра (__dict__).
+    Используется только для сравнения расхода памяти.
+    """
+
+    def __init__(self, numerator, denominator):
+        self.__numerator = numerator
+        self.__denominator = denominator
+
+
+class _DictComplex:
+    """
+    Прежняя раскладка Complex: коэффициенты хранятся в словаре экземпляра (__dict__).
+    Используется только для сравнения расхода памяти.
+    """
+
+    def __init__(self, real, imaginary):
+        self.real = real
+        self.imaginary = imaginary
+
+
+def bytes_per_object(factory, count=10000):
+    """
+    Измеряет средний объем памяти, выделяемой при создании одного объекта.
+    Аргументы конструктора создаются заранее, поэтому учитываются только сами объекты.
+
+    :param factory: Функция одного аргумента (целого числа), создающая объект.
+    :param count: Количество создаваемых объектов.
+    :return: Число типа float – количество байт на один объект.
+    """
+
+    arguments = list(range(1, count + 1))
+    objects = [None] * count
+    tracemalloc.start()
+    for index, argument in enumerate(arguments):
+        objects[index] = factory(argument)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / count
+
+
+def operations_per_second(statement, number=100000, **namespace):
+    """
+    Измеряет пропускную способность выражения (лучший результат из трех замеров).
+
+    :param statement: Строка с выражением, которое нужно замерить.
+    :param number: Количество выполнений выражения в одном замере.
+    :param namespace: Переменные, доступные выражению.
+    :return: Число типа float – количество выполнений в секунду.
+    """
+
+    best = min(timeit.repeat(statement, globals=namespace, number=number, repeat=3))
+    return number / best
+
+
+def compare_layout():
+    """
+    Сравнивает компактную раскладку на слотах с прежней раскладкой на словарях
+    и проверяющий конструктор с внутренним конструктором для уже сокращенных дробей.
+
+    :return: Словарь с результатами замеров.
+    """
+
+    half = Rational(1, 2)
+    third = Rational(1, 3)
+    results = {
+        "Rational bytes/object (__slots__)": bytes_per_object(lambda n: Rational._from_normalized(n, 1)),
+        "Rational bytes/object (__dict__)": bytes_per_object(lambda n: _DictRational(n, 1)),
+        "Complex bytes/object (__slots__)": bytes_per_object(lambda n: Complex._from_parts(half, third)),
+        "Complex bytes/object (__dict__)": bytes_per_object(lambda n: _DictComplex(half, third)),
+        "Rational(n, d) ops/s": operations_per_second("Rational(3, 4)", Rational=Rational),
+        "Rational._from_normalized ops/s": operations_per_second("Rational._from_normalized(3, 4)", Rational=Rational),
+        "Rational + Rational ops/s": operations_per_second("a + b", a=half, b=third),
+        "Complex * Complex ops/s": operations_per_second("a * b", a=Complex(half, third), b=Complex(third, half),
+                                                         number=20000),
+    }
+    return results
+
+
+def _rational(generator, digits):
+    """
+    Создает рациональное число, числитель и знаменатель которого содержат заданное количество цифр.
+    """
+
+    low, high = 10 ** (digits - 1), 10 ** digits
+    return Rational(generator.randrange(low, high), generator.randrange(low, high))
+
+
+def _inplace(operator):
+    """
+    Создает функцию, применяющую оператор с присваиванием к паре операндов.
+    """
+
+    def apply(a, b):
+        value = a
+        if operator == "+=":
+            value += b
+        elif operator == "-=":
+            value -= b
+        elif operator == "*=":
+            value *= b
+        else:
+            value /= b
+        return value
+
+    return apply
+
+
+def _accumulate(terms):
+    total = RationalAccumulator()
+    for term in terms:
+        total += term
+    return total.value
+
+
+def benchmark_cases(sizes=SIZES):
+    """
+    Формирует набор сценариев замеров.
+
+    :param sizes: Длины операндов в десятичных цифрах.
+    :return: Словарь {имя сценария: функция без аргументов, выполняющая одну операцию}.
+    """
+
+    generator = random.Random(SEED)
+    terms = [Rational(generator.randrange(1, 10 ** 6), generator.randrange(1, 10 ** 3)) for _ in range(1000)]
+    sequence = [Complex(a, b) for a, b in zip(terms, reversed(terms))]
+    array = ComplexArray(sequence)
+    cases = {
+        "Rational(float)": lambda: Rational(2.3333),
+        "Rational.sum[1000 terms]": lambda terms=terms: Rational.sum(terms),
+        "Rational.prod[1000 terms]": lambda terms=terms: Rational.prod(terms),
+        "RationalAccumulator +=[1000 terms]": lambda terms=terms: _accumulate(terms),
+        "convolve(Complex)[1000 terms]": lambda sequence=sequence: convolve(sequence, sequence),
+        "ComplexArray.__mul__[1000 terms]": lambda array=array: array * array[::-1],
+        "sorted(Rational)[1000 terms]": lambda terms=terms: sorted(terms),
+        "sorted(Rational.sort_key)[1000 terms]": lambda terms=terms: sorted(terms, key=Rational.sort_key),
+    }
+    for digits in sizes:
+        a, b, c, d = (_rational(generator, digits) for _ in range(4))
+        z, w = Complex(a, b), Complex(c, d)
+        numerator, denominator = a.numerator, a.denominator
+        big_numerator, big_denominator = a.numerator * b.numerator, a.denominator * b.denominator
+        suffix = f"[{digits}]"
+
+        cases["Rational(int, int)" + suffix] = lambda n=numerator, m=denominator: Rational(n, m)
+        cases["Rational.__add__" + suffix] = lambda a=a, b=b: a + b
+        cases["Rational.__sub__" + suffix] = lambda a=a, b=b: a - b
+        cases["Rational.__mul__" + suffix] = lambda a=a, b=b: a * b
+        cases["Rational.__truediv__" + suffix] = lambda a=a, b=b: a / b
+        cases["Rational.add_int" + suffix] = lambda a=a, k=numerator: a + k
+        cases["Rational.mul_int" + suffix] = lambda a=a, k=numerator: a * k
+        cases["Rational.radd_int" + suffix] = lambda a=a, k=numerator: k + a
+        for operator, name in (("+=", "__iadd__"), ("-=", "__isub__"), ("*=", "__imul__"), ("/=", "__itruediv__")):
+            cases[f"Rational.{name}" + suffix] = lambda a=a, b=b, apply=_inplace(operator): apply(a, b)
+        cases["Rational.__lt__" + suffix] = lambda a=a, b=b: a < b
+        cases["Rational.reducedfraction" + suffix] = \
+            lambda n=big_numerator, m=big_denominator: Rational.reducedfraction(n, m)
+        cases["Rational.reducedfraction(max_denominator)" + suffix] = \
+            lambda n=big_numerator, m=big_denominator: Rational.reducedfraction(n, m, max_denominator=10 ** 6)
+        cases["codec.encode" + suffix] = lambda z=z: codec.encode(z)
+        cases["codec.decode" + suffix] = lambda data=bytes(codec.encode(z)): codec.decode(data)
+        cases["codec.decode(trusted)" + suffix] = lambda data=bytes(codec.encode(z)): codec.decode(data, trusted=True)
+        cases["Complex.__mul__" + suffix] = lambda z=z, w=w: z * w
+        cases["Complex.mul_int" + suffix] = lambda z=z, k=numerator: z * k
+        cases["Complex.__truediv__" + suffix] = lambda z=z, w=w: z / w
+        cases["Complex.__abs__" + suffix] = lambda z=z: abs(z)
+        cases["Complex.arg" + suffix] = lambda z=z: z.arg()
+        cases["Complex.power(8)" + suffix] = lambda z=z: z.power(8)
+    return cases
+
+
+def time_case(function, min_time=0.05, repeat=3):
+    """
+    Измеряет время одного выполнения функции (лучший результат из нескольких замеров).
+    Количество выполнений в замере подбирается так, чтобы замер длился не меньше min_time секунд.
+
+    :param function: Функция без аргументов.
+    :param min_time: Минимальная длительность одного замера в секундах.
+    :param repeat: Количество замеров.
+    :return: Число типа float – время одного выполнения в секундах.
+    """
+
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed * 10 < min_time else 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        best = min(best, timer.timeit(number))
+    return best / number
+
+
+def run_benchmarks(sizes=SIZES, names=None, min_time=0.05, repeat=3):
+    """
+    Выполняет замеры всех (или выбранных) сценариев.
+    Сценарии, которые завершаются ошибкой (например, переполнением), записываются со значением None.
+
+    :param sizes: Длины операндов в десятичных цифрах.
+    :param names: Подстроки имен сценариев, которые нужно выполнить (None – все сценарии).
+    :param min_time: Минимальная длительность одного замера в секундах.
+    :param repeat: Количество замеров каждого сценария.
+    :return: Словарь с описанием окружения и результатами {имя сценария: секунд на операцию}.
+    """
+
+    results = {}
+    for name, function in benchmark_cases(sizes).items():
+        if names and not any(part in name for part in names):
+            continue
+        try:
+            function()
+        except (OverflowError, ValueError, ZeroDivisionError):
+            results[name] = None
+            continue
+        results[name] = time_case(function, min_time, repeat)
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "seed": SEED,
+        "results": results,
+    }
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Сравнивает два замера и находит сценарии, замедлившиеся больше чем на порог.
+
+    :param baseline: Базовый замер (словарь, возвращаемый run_benchmarks).
+    :param current: Новый замер.
+    :param threshold: Допустимое относительное замедление (0.1 – 10%).
+    :return: Список кортежей (имя сценария, базовое время, новое время, отношение), упорядоченный по отношению.
+    """
+
+    regressions = []
+    for name, old in baseline["results"].items():
+        new = current["results"].get(name)
+        if old is None or new is None:
+            continue
+        ratio = new / old
+        if ratio > 1 + threshold:
+            regressions.append((name, old, new, ratio))
+    regressions.sort(key=lambda item: item[3], reverse=True)
+    return regressions
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Benchmarks for Rational and Complex.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run benchmarks and store results as JSON")
+    run_parser.add_argument("--output", default="benchmark_baseline.json")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    run_parser.add_argument("--filter", nargs="+", default=None, help="run only cases containing these substrings")
+    run_parser.add_argument("--min-time", type=float, default=0.05)
+    run_parser.add_argument("--repeat", type=int, default=3)
+
+    compare_parser = commands.add_parser("compare", help="compare two stored results")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    commands.add_parser("layout", help="compare object layouts")
+
+    arguments = parser.parse_args(arguments)
+    if arguments.command == "run":
+        report = run_benchmarks(arguments.sizes, arguments.filter, arguments.min_time, arguments.repeat)
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+        for name, value in report["results"].items():
+            print(f"{name:<55} {'n/a' if value is None else f'{value * 1e6:12.3f} us'}")
+        return 0
+
+    if arguments.command == "compare":
+        with open(arguments.baseline) as file:
+            baseline = json.load(file)
+        with open(arguments.current) as file:
+            current = json.load(file)
+        regressions = compare_results(baseline, current, arguments.threshold)
+        for name, old, new, ratio in regressions:
+            print(f"REGRESSION {name:<55} {old * 1e6:12.3f} us -> {new * 1e6:12.3f} us ({ratio:.2f}x)")
+        if not regressions:
+            print("No regressions.")
+        return 1 if regressions else 0
+
+    for name, value in compare_layout().items():
+        print(f"{name:<40} {value:>14.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
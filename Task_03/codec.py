@@ -0,0 +1,339 @@
+import mmap
+import re
+from rational import Rational
+from complex import Complex
+
+# Байт-метка перед каждым значением потока
+TAG_RATIONAL = 0
+TAG_COMPLEX = 1
+
+# Числа длиннее этой границы (в битах) кодируются и декодируются целиком операциями над длинными числами,
+# более короткие – побайтно
+_BULK_BITS = 256
+
+# Первый байт без бита продолжения – последний байт varint
+_VARINT_END = re.compile(rb"[\x00-\x7f]")
+
+# Размер буфера потоковой записи по умолчанию
+_BUFFER_SIZE = 1 << 16
+
+# Маски групп varint в 64-битной полосе: i-я группа из 7 бит занимает младшие биты i-го байта
+_GROUP_MASKS = [bytes(i) + b"\x7f" + bytes(7 - i) for i in range(8)]
+
+
+def _bulk_encode(value):
+    """
+    Кодирует длинное число в varint без цикла по байтам:
+        1) каждые 7 байт числа раскладываются в 8-байтовую полосу (срезы bytearray с шагом);
+        2) в каждой полосе 8 групп по 7 бит сдвигаются в отдельные байты сразу для всех полос
+           (сдвиг и маска над всем длинным числом);
+        3) во всех байтах, кроме последнего, устанавливается бит продолжения.
+
+    :param value: Неотрицательное целое число (int).
+    :return: Объект типа bytes – число в формате varint.
+    """
+
+    groups = (value.bit_length() + 6) // 7
+    lanes_count = (groups + 7) // 8
+    data = value.to_bytes(7 * lanes_count, "little")
+    lanes = bytearray(8 * lanes_count)
+    for j in range(7):
+        lanes[j::8] = data[j::7]
+    word = int.from_bytes(lanes, "little")
+    result = word & int.from_bytes(_GROUP_MASKS[0] * lanes_count, "little")
+    for i in range(1, 8):
+        result |= (word << i) & int.from_bytes(_GROUP_MASKS[i] * lanes_count, "little")
+    result |= int.from_bytes(b"\x80" * (groups - 1), "little")
+    return result.to_bytes(groups, "little")
+
+
+def _bulk_decode(segment):
+    """
+    Декодирует varint (вместе с последним байтом) без цикла по байтам – обратное преобразование к _bulk_encode.
+
+    :param segment: Байты числа (bytes или memoryview).
+    :return: Неотрицательное целое число (int).
+    """
+
+    lanes_count = (len(segment) + 7) // 8
+    word = int.from_bytes(segment, "little")
+    result = word & int.from_bytes(_GROUP_MASKS[0] * lanes_count, "little")
+    for i in range(1, 8):
+        result |= (word & int.from_bytes(_GROUP_MASKS[i] * lanes_count, "little")) >> i
+    lanes = result.to_bytes(8 * lanes_count, "little")
+    data = bytearray(7 * lanes_count)
+    for j in range(7):
+        data[j::7] = lanes[j::8]
+    return int.from_bytes(data, "little")
+
+
+def _write_varint(value, out):
+    """
+    Дописывает неотрицательное целое число в буфер в формате varint (LEB128):
+    по 7 бит в байте, начиная с младших, старший бит байта – признак продолжения.
+
+    :param value: Неотрицательное целое число (int).
+    :param out: Буфер (bytearray).
+    """
+
+    if value >> _BULK_BITS:
+        out += _bulk_encode(value)
+        return
+    while value >= 0x80:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buffer, position):
+    """
+    Читает число в формате varint из буфера.
+    Первые 9 байт читаются побайтно; у более длинных чисел конец ищется регулярным выражением,
+    и число декодируется целиком (см. _bulk_decode).
+
+    :param buffer: Буфер (bytes, bytearray, memoryview или mmap).
+    :param position: Позиция первого байта числа.
+    :return: Кортеж (число, позиция следующего байта).
+    """
+
+    start = position
+    value = 0
+    shift = 0
+    end = position + 9
+    while position < end:
+        byte = buffer[position]
+        position += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+    match = _VARINT_END.search(buffer, position)
+    if match is None:
+        raise IndexError("Truncated varint.")
+    stop = match.end()
+    return _bulk_decode(memoryview(buffer)[start:stop]), stop
+
+
+def _write_rational(numerator, denominator, out):
+    """
+    Дописывает дробь в буфер: числитель – zigzag varint, знаменатель – varint.
+    Короткие числа записываются без вызова _write_varint.
+    """
+
+    zigzag = numerator << 1 if numerator >= 0 else (-numerator << 1) - 1
+    if zigzag >> _BULK_BITS:
+        _write_varint(zigzag, out)
+    else:
+        while zigzag >= 0x80:
+            out.append((zigzag & 0x7f) | 0x80)
+            zigzag >>= 7
+        out.append(zigzag)
+    if denominator >> _BULK_BITS:
+        _write_varint(denominator, out)
+    else:
+        while denominator >= 0x80:
+            out.append((denominator & 0x7f) | 0x80)
+            denominator >>= 7
+        out.append(denominator)
+
+
+def _read_rational(buffer, position, trusted):
+    """
+    Читает дробь из буфера. Однобайтовые числа (в том числе знаменатель 1) читаются без вызова _read_varint.
+    Нулевой знаменатель (поврежденный поток) отвергается всегда, даже для доверенного буфера.
+
+    :return: Кортеж (число типа Rational, позиция следующего байта).
+    """
+
+    start = position
+    zigzag = buffer[position]
+    if zigzag < 0x80:
+        position += 1
+    else:
+        zigzag, position = _read_varint(buffer, position)
+    denominator = buffer[position]
+    if denominator < 0x80:
+        position += 1
+    else:
+        denominator, position = _read_varint(buffer, position)
+    if denominator == 0:
+        raise ValueError(f"Zero denominator in value at position {start}.")
+    numerator = zigzag >> 1 if not zigzag & 1 else -(zigzag >> 1) - 1
+    if trusted:
+        return Rational._from_normalized(numerator, denominator), position
+    return Rational(numerator, denominator), position
+
+
+def encode(value, out=None):
+    """
+    Кодирует число в компактный двоичный формат.
+
+    Формат значения:
+        Rational (и int): байт TAG_RATIONAL, числитель (zigzag varint), знаменатель (varint);
+        Complex: байт TAG_COMPLEX, действительная часть и мнимая часть (каждая – числитель и знаменатель).
+
+    :param value: Число типа Rational, Complex или int.
+    :param out: Буфер (bytearray), в который дописывается значение (None – новый буфер).
+    :return: Буфер с закодированным значением.
+    """
+
+    if out is None:
+        out = bytearray()
+    if isinstance(value, Rational):
+        out.append(TAG_RATIONAL)
+        _write_rational(value.numerator, value.denominator, out)
+    elif isinstance(value, Complex):
+        out.append(TAG_COMPLEX)
+        _write_rational(value.real.numerator, value.real.denominator, out)
+        _write_rational(value.imaginary.numerator, value.imaginary.denominator, out)
+    elif isinstance(value, int):
+        out.append(TAG_RATIONAL)
+        _write_rational(value, 1, out)
+    else:
+        raise TypeError("Only Rational, Complex and int values can be encoded.")
+    return out
+
+
+def decode(buffer, position=0, trusted=False):
+    """
+    Декодирует одно значение из буфера.
+
+    :param buffer: Буфер (bytes, bytearray, memoryview или mmap).
+    :param position: Позиция байта-метки значения.
+    :param trusted: Считать ли дроби в буфере несократимыми (записанными этим модулем) и пропускать их проверку.
+        По умолчанию False: дроби проверяются и сокращаются конструктором Rational; True допустимо
+        только для буферов, заведомо записанных этим модулем.
+    :return: Кортеж (число типа Rational или Complex, позиция следующего значения).
+    """
+
+    try:
+        tag = buffer[position]
+        if tag == TAG_RATIONAL:
+            return _read_rational(buffer, position + 1, trusted)
+        if tag == TAG_COMPLEX:
+            real, next_position = _read_rational(buffer, position + 1, trusted)
+            imaginary, next_position = _read_rational(buffer, next_position, trusted)
+            return Complex._from_parts(real, imaginary), next_position
+    except IndexError:
+        raise ValueError(f"Truncated value at position {position}.") from None
+    raise ValueError(f"Unknown tag {tag} at position {position}.")
+
+
+class Writer:
+    """
+    Потоковая запись чисел в двоичный файл (или любой объект с методом write).
+    Значения кодируются в общий буфер, который сбрасывается в поток при заполнении,
+    поэтому запись каждого значения не обращается к потоку.
+    """
+
+    def __init__(self, stream, buffer_size=_BUFFER_SIZE):
+        """
+        :param stream: Двоичный поток для записи.
+        :param buffer_size: Размер буфера в байтах, при превышении которого буфер сбрасывается в поток.
+        """
+
+        self._stream = stream
+        self._buffer_size = buffer_size
+        self._buffer = bytearray()
+        self.count = 0
+
+    def write(self, value):
+        """
+        Записывает одно число (Rational, Complex или int).
+        """
+
+        encode(value, self._buffer)
+        self.count += 1
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def write_all(self, values):
+        """
+        Записывает последовательность (или итератор) чисел.
+        """
+
+        for value in values:
+            self.write(value)
+
+    def flush(self):
+        """
+        Сбрасывает буфер в поток.
+        """
+
+        if self._buffer:
+            self._stream.write(self._buffer)
+            self._buffer = bytearray()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+
+class Reader:
+    """
+    Ленивое чтение чисел из буфера (bytes, bytearray, memoryview, mmap) без копирования:
+    буфер просматривается через memoryview, и каждое значение декодируется только при обращении к нему.
+    """
+
+    def __init__(self, buffer, trusted=False):
+        """
+        :param buffer: Буфер с закодированными значениями.
+        :param trusted: Считать ли дроби в буфере несократимыми (см. decode).
+        """
+
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._trusted = trusted
+
+    @classmethod
+    def open(cls, path, trusted=False):
+        """
+        Открывает файл, отображенный в память (mmap). Reader следует закрыть методом close
+        (или использовать как контекстный менеджер).
+
+        :param path: Путь к файлу.
+        :param trusted: Считать ли дроби в файле несократимыми (см. decode).
+        :return: Объект класса Reader.
+        """
+
+        with open(path, "rb") as file:
+            if file.seek(0, 2) == 0:
+                return cls(b"", trusted)
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), trusted)
+
+    def iter_from(self, position=0):
+        """
+        Генератор значений, начиная с заданной позиции.
+
+        :param position: Позиция байта-метки первого значения.
+        :return: Генератор пар (позиция значения, значение).
+        """
+
+        view = self._view
+        size = len(view)
+        while position < size:
+            value, next_position = decode(view, position, self._trusted)
+            yield position, value
+            position = next_position
+
+    def __iter__(self):
+        for _, value in self.iter_from():
+            yield value
+
+    def close(self):
+        """
+        Освобождает буфер (и закрывает mmap, если он был открыт методом open).
+        """
+
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,5 +1,114 @@
+import functools
 import math
-from rational import Rational
+import sys
+from rational import Rational, InternCache, _tree_reduce, _binary_exponent, _scaled_float
+
+# Параметры хеширования комплексных чисел в CPython (те же, что у встроенного complex)
+_HASH_IMAG = sys.hash_info.imag
+_HASH_WIDTH = sys.hash_info.width
+
+# Вычисления с заданной точностью (Complex.abs, Complex.arg): запасные биты фиксированной точки
+# и количество удвоений угла при понижении аргумента арктангенса
+_GUARD_BITS = 40
+_ATAN_HALVINGS = 8
+
+# Приближенное возведение в степень (Complex.power(approximate=True)) округляет результат до 4 знака после запятой
+_APPROXIMATE_DENOMINATOR = 10 ** 4
+
+
+def _add_triples(left, right):
+    """
+    Сумма двух комплексных чисел, заданных несокращенными тройками (a, b, d) – числами (a + bi) / d.
+    """
+
+    a, b, d = left
+    c, e, f = right
+    if d == f:
+        return a + c, b + e, d
+    return a * f + c * d, b * f + e * d, d * f
+
+
+def _multiply_triples(left, right):
+    """
+    Произведение двух комплексных чисел, заданных несокращенными тройками (a, b, d),
+    тремя умножениями вместо четырех (метод Гаусса).
+    """
+
+    a, b, d = left
+    c, e, f = right
+    k1 = c * (a + b)
+    k2 = a * (e - c)
+    k3 = b * (c + e)
+    return k1 - k3, k1 + k2, d * f
+
+
+def _from_triple(triple):
+    """
+    Комплексное число из несокращенной тройки (a, b, d); действительная и мнимая части сокращаются по отдельности.
+    """
+
+    real, imaginary, denominator = triple
+    return Complex._from_parts(Rational._from_normalized(*Rational.reducedfraction(real, denominator)),
+                               Rational._from_normalized(*Rational.reducedfraction(imaginary, denominator)))
+
+
+def _check_digits(digits):
+    """
+    Проверяет, что количество десятичных знаков – неотрицательное целое число.
+    """
+
+    if not isinstance(digits, int) or digits < 0:
+        raise ValueError("digits must be a non-negative integer.")
+
+
+def _atan_inverse(n, one):
+    """
+    arctg(1/n) в фиксированной точке с единицей one (ряд Тейлора в целых числах).
+    """
+
+    total = term = one // n
+    n_squared = n * n
+    k = 1
+    while term:
+        term //= n_squared
+        k += 2
+        total += -(term // k) if k % 4 == 3 else term // k
+    return total
+
+
+@functools.lru_cache(maxsize=None)
+def _pi_fixed(bits):
+    """
+    Число pi в фиксированной точке с единицей 2^bits (формула Мэчина: pi = 16·arctg(1/5) - 4·arctg(1/239)).
+    """
+
+    one = 1 << (bits + _GUARD_BITS)
+    return (16 * _atan_inverse(5, one) - 4 * _atan_inverse(239, one)) >> _GUARD_BITS
+
+
+@functools.lru_cache(maxsize=1024)
+def _atan_fixed(numerator, denominator, bits):
+    """
+    arctg(p/q) для 0 <= p <= q в фиксированной точке с единицей 2^bits.
+    Аргумент уменьшается формулой arctg(t) = 2·arctg(t / (1 + sqrt(1 + t^2))), после чего суммируется ряд Тейлора.
+    Результаты кэшируются: повторное вычисление одного и того же угла (в том числе для пропорциональных
+    комплексных чисел) не выполняется.
+    """
+
+    precision = bits + _GUARD_BITS
+    one = 1 << precision
+    t = (numerator << precision) // denominator
+    for _ in range(_ATAN_HALVINGS):
+        t = (t << precision) // (one + math.isqrt(one * one + t * t))
+
+    t_squared = (t * t) >> precision
+    total = power = t
+    k = 1
+    while power:
+        power = (power * t_squared) >> precision
+        k += 2
+        total += -(power // k) if k % 4 == 3 else power // k
+    return (total << _ATAN_HALVINGS) >> _GUARD_BITS
 
 
 class Complex:
@@ -11,8 +120,16 @@ class Complex:
         i – мнимая единица
 
     Представить такое число можно парой рациональных коэффициентов a и b
+
+    Объекты класса неизменяемы: коэффициенты хранятся в слотах (__slots__),
+    а все операции возвращают новые объекты.
     """
 
+    __slots__ = ('_real', '_imaginary')
+
+    # Кэш интернированных значений (см. Complex.interned)
+    _intern_cache = InternCache()
+
     def __init__(self, real, imaginary=0):
         """
         Метод инициализации объекта класса Complex (комплексного числа).
@@ -26,8 +143,32 @@ class Complex:
             real = Rational(real)
         if not isinstance(imaginary, Rational):
             imaginary = Rational(imaginary)
-        self.real = real
-        self.imaginary = imaginary
+        _set_real(self, real)
+        _set_imaginary(self, imaginary)
+
+    @classmethod
+    def _from_parts(cls, real, imaginary):
+        """
+        Внутренний конструктор для результатов арифметических операций.
+        Не выполняет никаких проверок и преобразований: оба коэффициента должны быть объектами класса Rational.
+
+        :param real: Коэффициент при действительной части (Rational).
+        :param imaginary: Коэффициент при мнимой части (Rational).
+        :return: Новый объект класса Complex.
+        """
+
+        result = object.__new__(cls)
+        _set_real(result, real)
+        _set_imaginary(result, imaginary)
+        return result
+
+    @property
+    def real(self):
+        return self._real
+
+    @property
+    def imaginary(self):
+        return self._imaginary
 
     @staticmethod
     def to_complex(other):
@@ -42,91 +183,268 @@ class Complex:
             return other
         else:
             if isinstance(other, Rational):
-                return Complex(other, Rational(0))
+                return Complex._from_parts(other, Rational.interned(0))
+            elif isinstance(other, int):
+                return Complex._from_parts(Rational.interned(other), Rational.interned(0))
             else:
                 real_part = Rational(other)
-                return Complex(real_part, Rational(0))
+                return Complex._from_parts(real_part, Rational.interned(0))
+
+    @staticmethod
+    def interned(real, imaginary=0):
+        """
+        Статический метод получения часто используемого комплексного числа (0, 1, -1, i, -i и т.п.) из кэша.
+        Повторные запросы одного и того же значения с небольшими целыми или рациональными коэффициентами
+        возвращают один и тот же объект.
+
+        :param real: Коэффициент при действительной части (int или Rational).
+        :param imaginary: Коэффициент при мнимой части (int или Rational).
+        :return: Число типа Complex.
+        """
+
+        if not isinstance(real, (int, Rational)) or not isinstance(imaginary, (int, Rational)):
+            return Complex(real, imaginary)
+        real = real if isinstance(real, Rational) else Rational.interned(real)
+        imaginary = imaginary if isinstance(imaginary, Rational) else Rational.interned(imaginary)
+        key = (real.numerator, real.denominator, imaginary.numerator, imaginary.denominator)
+        value = Complex._intern_cache.get(key)
+        if value is None:
+            value = Complex._from_parts(real, imaginary)
+            Complex._intern_cache.put(key, value)
+        return value
+
+    @staticmethod
+    def set_intern_cache_size(maxsize):
+        """
+        Статический метод изменения размера кэша интернированных значений (0 отключает кэширование).
+
+        :param maxsize: Наибольшее количество хранимых значений.
+        """
+
+        Complex._intern_cache.resize(maxsize)
+
+    @staticmethod
+    def sum(values):
+        """
+        Статический метод суммирования последовательности чисел (Complex, Rational, int).
+        Действительные и мнимые части суммируются методом Rational.sum:
+        без промежуточных сокращений, с одним сокращением дроби в конце.
 
+        :param values: Последовательность (или итератор) чисел.
+        :return: Число типа Complex – сумма чисел (0 для пустой последовательности).
+        """
+
+        real = []
+        imaginary = []
+        for value in values:
+            if isinstance(value, Complex):
+                real.append(value._real)
+                imaginary.append(value._imaginary)
+            elif isinstance(value, (Rational, int)):
+                real.append(value)
+            else:
+                raise TypeError("Complex.sum() accepts only Complex, Rational and int values.")
+        return Complex._from_parts(Rational.sum(real), Rational.sum(imaginary))
+
+    @staticmethod
+    def prod(values):
+        """
+        Статический метод перемножения последовательности чисел (Complex, Rational, int).
+        Каждое число представляется несокращенной тройкой (a, b, d) – числом (a + bi) / d с целыми a, b, d;
+        тройки перемножаются по сбалансированному дереву (тремя умножениями вместо четырех),
+        а дроби сокращаются один раз в конце.
+
+        :param values: Последовательность (или итератор) чисел.
+        :return: Число типа Complex – произведение чисел (1 для пустой последовательности).
+        """
+
+        def triples():
+            for value in values:
+                if isinstance(value, Complex):
+                    real, imaginary = value._real, value._imaginary
+                    denominator = real.denominator * imaginary.denominator
+                    yield real.numerator * imaginary.denominator, imaginary.numerator * real.denominator, denominator
+                elif isinstance(value, Rational):
+                    yield value.numerator, 0, value.denominator
+                elif isinstance(value, int):
+                    yield value, 0, 1
+                else:
+                    raise TypeError("Complex.prod() accepts only Complex, Rational and int values.")
+
+        result = _tree_reduce(triples(), _multiply_triples)
+        if result is None:
+            return Complex.interned(1)
+        return _from_triple(result)
 
     def __add__(self, other):
         """
         Оператор сложения комплексного числа с другим числом.
-        Переводит переданное число в комплексную форму, и производит операцию сложения двух комплексных чисел.
+        Целое (int) или рациональное (Rational) число прибавляется только к действительной части,
+        мнимая часть переиспользуется без изменений.
+        Остальные числа переводятся в комплексную форму, и производится операция сложения двух комплексных чисел.
 
         :param other: Число, с которым происходит сложение.
         :return: Результат сложения двух чисел – сумма двух комплексных чисел
             или ошибка неопределенности операции при переводе числа в комплексную форму.
         """
 
+        if isinstance(other, (int, Rational)):
+            return Complex._from_parts(self._real + other, self._imaginary)
         other = Complex.to_complex(other)
         if other is NotImplemented:
             return NotImplemented
-        return Complex(self.real + other.real, self.imaginary + other.imaginary)
+        return Complex._from_parts(self._real + other._real, self._imaginary + other._imaginary)
+
+    def __radd__(self, other):
+        """
+        Отраженный оператор сложения: число (int, Rational, float) + комплексное число.
+        Позволяет записывать выражения вида 2 + z и суммировать комплексные числа встроенной функцией sum().
+
+        :param other: Число, к которому прибавляется комплексное число.
+        :return: Результат сложения двух чисел – сумма двух комплексных чисел
+            или ошибка неопределенности операции при переводе числа в комплексную форму.
+        """
+
+        return self + other
 
     def __sub__(self, other):
         """
         Оператор вычитания из комплексного числа другого числа.
-        Переводит переданное число в комплексную форму, и производит операцию вычитания.
+        Целое (int) или рациональное (Rational) число вычитается только из действительной части.
+        Остальные числа переводятся в комплексную форму, и производится операция вычитания.
 
         :param other: Число, которе вычитается из комплексного числа.
         :return: Результат вычитания – разность двух комплексных чисел
             или ошибка неопределенности операции при переводе числа в комплексную форму.
         """
 
+        if isinstance(other, (int, Rational)):
+            return Complex._from_parts(self._real - other, self._imaginary)
         other = Complex.to_complex(other)
         if other is NotImplemented:
             return NotImplemented
-        return Complex(self.real - other.real, self.imaginary - other.imaginary)
+        return Complex._from_parts(self._real - other._real, self._imaginary - other._imaginary)
+
+    def __rsub__(self, other):
+        """
+        Отраженный оператор вычитания: число (int, Rational, float) - комплексное число.
+
+        :param other: Число, из которого вычитается комплексное число.
+        :return: Результат вычитания – разность двух комплексных чисел
+            или ошибка неопределенности операции при переводе числа в комплексную форму.
+        """
+
+        if isinstance(other, (int, Rational)):
+            return Complex._from_parts(other - self._real, -self._imaginary)
+        return Complex.to_complex(other) - self
 
     def __mul__(self, other):
         """
         Оператор умножения комплексного числа на другое число.
-        Переводит переданное число в комплексную форму, и производит операцию сложения двух комплексных чисел.
+        Целое (int) или рациональное (Rational) число умножается на каждую часть (два умножения вместо четырех).
+        Остальные числа переводятся в комплексную форму, и производится операция умножения двух комплексных чисел.
 
         :param other: Число, на которое происходит умножение.
         :return: Результат умножения двух чисел – произведение двух комплексных чисел
             или ошибка неопределенности операции при переводе числа в комплексную форму.
         """
 
+        if isinstance(other, (int, Rational)):
+            return Complex._from_parts(self._real * other, self._imaginary * other)
         other = Complex.to_complex(other)
         if other is NotImplemented:
             return NotImplemented
-        new_real = self.real * other.real - self.imaginary * other.imaginary
-        new_imaginary = self.real * other.imaginary + self.imaginary * other.real
-        return Complex(new_real, new_imaginary)
+        new_real = self._real * other._real - self._imaginary * other._imaginary
+        new_imaginary = self._real * other._imaginary + self._imaginary * other._real
+        return Complex._from_parts(new_real, new_imaginary)
+
+    def __rmul__(self, other):
+        """
+        Отраженный оператор умножения: число (int, Rational, float) * комплексное число.
+
+        :param other: Число, которое умножается на комплексное число.
+        :return: Результат умножения двух чисел – произведение двух комплексных чисел
+            или ошибка неопределенности операции при переводе числа в комплексную форму.
+        """
+
+        return self * other
 
     def __truediv__(self, other):
         """
         Оператор деления комплексного числа на другое число.
-        Переводит переданное число в комплексную форму, и производит операцию сложения двух комплексных чисел.
+        Каждая часть делится на целое (int) или рациональное (Rational) число непосредственно.
+        Остальные числа переводятся в комплексную форму, и производится операция деления двух комплексных чисел.
 
         :param other: Число, на которое происходит деление.
         :return: Результат деления двух чисел – частное двух комплексных чисел
             или ошибка неопределенности операции при переводе числа в комплексную форму.
         """
 
+        if isinstance(other, (int, Rational)):
+            if other == 0:
+                raise ZeroDivisionError("Cannot divide by zero.")
+            return Complex._from_parts(self._real / other, self._imaginary / other)
         other = Complex.to_complex(other)
         if other is NotImplemented:
             return NotImplemented
-        denominator = other.real * other.real + other.imaginary * other.imaginary
-        if denominator == Rational(0, 1):
+        denominator = other._real * other._real + other._imaginary * other._imaginary
+        if denominator.numerator == 0:
             raise ZeroDivisionError("Cannot divide by zero.")
-        new_real = (self.real * other.real + self.imaginary * other.imaginary) / denominator
-        new_imaginary = (self.imaginary * other.real - self.real * other.imaginary) / denominator
-        return Complex(new_real, new_imaginary)
+        new_real = (self._real * other._real + self._imaginary * other._imaginary) / denominator
+        new_imaginary = (self._imaginary * other._real - self._real * other._imaginary) / denominator
+        return Complex._from_parts(new_real, new_imaginary)
+
+    def __rtruediv__(self, other):
+        """
+        Отраженный оператор деления: число (int, Rational, float) / комплексное число, отличное от нуля.
+        Для целого (int) или рационального (Rational) числа k: k / (a + bi) = (k*a - k*b*i) / (a^2 + b^2).
+
+        :param other: Число, которое делится на комплексное число.
+        :return: Результат деления – частное двух чисел
+            или ошибка неопределенности операции при переводе числа в комплексную форму.
+        """
+
+        if isinstance(other, (int, Rational)):
+            denominator = self._real * self._real + self._imaginary * self._imaginary
+            if denominator.numerator == 0:
+                raise ZeroDivisionError("Cannot divide by zero.")
+            scale = other / denominator
+            return Complex._from_parts(self._real * scale, -(self._imaginary * scale))
+        return Complex.to_complex(other) / self
 
     def __eq__(self, other):
         """
         Оператор проверки равенства комплексного числа с другим числом.
         Переводит переданное число в комплексную форму, и производит операцию сложения двух комплексных чисел.
 
+        Числа типов int, float и Rational, а также встроенные комплексные числа (complex) сравниваются точно,
+        без предварительного округления, поэтому сравнение согласовано с хешем.
+
         :param other: Число, с которым проводится проверка на равенство.
         :return: Результат проверки на равенство – True/False
             или ошибка неопределенности операции при переводе числа в комплексную форму.
         """
 
+        if isinstance(other, (Rational, int, float)):
+            return self._imaginary.numerator == 0 and self._real == other
+        if isinstance(other, complex):
+            return self._real == other.real and self._imaginary == other.imag
         other = Complex.to_complex(other)
-        return self.real == other.real and self.imaginary == other.imaginary
+        return self._real == other._real and self._imaginary == other._imaginary
+
+    def __hash__(self):
+        """
+        Оператор вычисления хеша комплексного числа.
+        Согласован с хешем встроенного complex (и с хешем Rational для чисел с нулевой мнимой частью).
+
+        :return: Число типа int – хеш комплексного числа.
+        """
+
+        # Как и в CPython: hash(real) + imag * hash(imaginary) с переполнением машинного слова
+        combined = (hash(self._real) + _HASH_IMAG * hash(self._imaginary)) & ((1 << _HASH_WIDTH) - 1)
+        if combined >= 1 << (_HASH_WIDTH - 1):
+            combined -= 1 << _HASH_WIDTH
+        return -2 if combined == -1 else combined
 
     def __ne__(self, other):
         """
@@ -144,7 +462,8 @@ class Complex:
     def __iadd__(self, other):
         """
         Оператор сложения с присваиванием комплексного числа с другим числом.
-        Переводит переданное число в комплексную форму, и производит операцию сложения двух комплексных чисел.
+        Целое (int) и рациональное (Rational) число обрабатываются без перевода в комплексную форму (см. __add__),
+        остальные числа переводятся в комплексную форму, и производится операция сложения двух комплексных чисел.
 
         :param other: Число, с которым проводится сложение с присваиванием.
         :return: Результат сложения с присваиванием –
@@ -152,17 +471,20 @@ class Complex:
             или ошибка неопределенности операции при переводе числа в комплексную форму.
         """
 
+        if isinstance(other, (int, Rational)):
+            return self.__add__(other)
         other = Complex.to_complex(other)
         if other is NotImplemented:
             return NotImplemented
-        new_real = self.real + other.real
-        new_imaginary = self.imaginary + other.imaginary
-        return Complex(new_real, new_imaginary)
+        new_real = self._real + other._real
+        new_imaginary = self._imaginary + other._imaginary
+        return Complex._from_parts(new_real, new_imaginary)
 
     def __isub__(self, other):
         """
         Оператор вычитания с присваиванием из комплексного числа другого числа.
-        Переводит переданное число в комплексную форму, и производит операцию сложения двух комплексных чисел.
+        Целое (int) и рациональное (Rational) число обрабатываются без перевода в комплексную форму (см. __sub__),
+        остальные числа переводятся в комплексную форму, и производится операция вычитания.
 
         :param other: Число, с которым проводится вычитание с присваиванием.
         :return: Результат вычитания с присваиванием –
@@ -170,17 +492,20 @@ class Complex:
             или ошибка неопределенности операции при переводе числа в комплексную форму.
         """
 
+        if isinstance(other, (int, Rational)):
+            return self.__sub__(other)
         other = Complex.to_complex(other)
         if other is NotImplemented:
             return NotImplemented
-        new_real = self.real - other.real
-        new_imaginary = self.imaginary - other.imaginary
-        return Complex(new_real, new_imaginary)
+        new_real = self._real - other._real
+        new_imaginary = self._imaginary - other._imaginary
+        return Complex._from_parts(new_real, new_imaginary)
 
     def __imul__(self, other):
         """
         Оператор умножения с присваиванием комплексного числа на другое число.
-        Переводит переданное число в комплексную форму, и производит операцию сложения двух комплексных чисел.
+        Целое (int) и рациональное (Rational) число обрабатываются без перевода в комплексную форму (см. __mul__),
+        остальные числа переводятся в комплексную форму, и производится операция умножения двух комплексных чисел.
 
         :param other: Число, с которым проводится умножение с присваиванием.
         :return: Результат умножения с присваиванием –
@@ -188,17 +513,20 @@ class Complex:
             или ошибка неопределенности операции при переводе числа в комплексную форму.
         """
 
+        if isinstance(other, (int, Rational)):
+            return self.__mul__(other)
         other = Complex.to_complex(other)
         if other is NotImplemented:
             return NotImplemented
-        new_real = self.real * other.real - self.imaginary * other.imaginary
-        new_imaginary = self.real * other.imaginary + self.imaginary * other.real
-        return Complex(new_real, new_imaginary)
+        new_real = self._real * other._real - self._imaginary * other._imaginary
+        new_imaginary = self._real * other._imaginary + self._imaginary * other._real
+        return Complex._from_parts(new_real, new_imaginary)
 
     def __itruediv__(self, other):
         """
         Оператор деления с присваиванием комплексного числа на другое число.
-        Переводит переданное число в комплексную форму, и производит операцию сложения двух комплексных чисел.
+        Целое (int) и рациональное (Rational) число обрабатываются без перевода в комплексную форму (см. __truediv__),
+        остальные числа переводятся в комплексную форму, и производится операция деления двух комплексных чисел.
 
         :param other: Число, с которым проводится деление с присваиванием.
         :return: Результат деления с присваиванием –
@@ -206,15 +534,17 @@ class Complex:
             или ошибка неопределенности операции при переводе числа в комплексную форму.
         """
 
+        if isinstance(other, (int, Rational)):
+            return self.__truediv__(other)
         other = Complex.to_complex(other)
         if other is NotImplemented:
             return NotImplemented
-        denominator = other.real * other.real + other.imaginary * other.imaginary
-        if denominator == Rational(0, 1):
+        denominator = other._real * other._real + other._imaginary * other._imaginary
+        if denominator.numerator == 0:
             raise ZeroDivisionError("Cannot divide by zero.")
-        new_real = (self.real * other.real + self.imaginary * other.imaginary) / denominator
-        new_imaginary = (self.imaginary * other.real - self.real * other.imaginary) / denominator
-        return Complex(new_real, new_imaginary)
+        new_real = (self._real * other._real + self._imaginary * other._imaginary) / denominator
+        new_imaginary = (self._imaginary * other._real - self._real * other._imaginary) / denominator
+        return Complex._from_parts(new_real, new_imaginary)
 
     def __neg__(self):
         """
@@ -223,58 +553,220 @@ class Complex:
         :return: Результат отрицания – комплексное число с коэффициентами противоположного знака.
         """
 
-        new_real = -self.real
-        new_imaginary = -self.imaginary
-        return Complex(new_real, new_imaginary)
+        new_real = -self._real
+        new_imaginary = -self._imaginary
+        return Complex._from_parts(new_real, new_imaginary)
+
+    def _scaled_floats(self):
+        """
+        Переводит коэффициенты в вещественные числа, предварительно умножив оба на общую степень двойки 2^(-shift),
+        при которой больший по модулю коэффициент близок к 1. Поэтому ни длинные числители и знаменатели,
+        ни очень большие или очень маленькие коэффициенты не приводят к переполнению или потере точности.
+
+        :return: Кортеж (действительная часть, мнимая часть, shift) – два числа типа float и целое число.
+        """
+
+        exponents = [_binary_exponent(part.numerator, part.denominator)
+                     for part in (self._real, self._imaginary) if part.numerator != 0]
+        shift = max(exponents) if exponents else 0
+        real_float = _scaled_float(self._real.numerator, self._real.denominator, shift)
+        imaginary_float = _scaled_float(self._imaginary.numerator, self._imaginary.denominator, shift)
+        return real_float, imaginary_float, shift
 
     def __abs__(self):
         """
         Оператор взятия модуля комплексного числа.
+        Модуль вычисляется как hypot от масштабированных коэффициентов (см. _scaled_floats)
+        и затем домножается на общую степень двойки, поэтому OverflowError возникает,
+        только если сам модуль не представим в float.
 
         :return: Число типа float – модуль комплексного числа.
         """
 
-        real_squared = self.real * self.real
-        imaginary_squared = self.imaginary * self.imaginary
-        modulus_squared = real_squared + imaginary_squared
-        modulus = math.sqrt(float(modulus_squared.numerator) / float(modulus_squared.denominator))
+        real_float, imaginary_float, shift = self._scaled_floats()
+        modulus = math.ldexp(math.hypot(real_float, imaginary_float), shift)
         return modulus
 
-    def arg(self):
+    def arg(self, digits=None):
         """
         Оператор взятия аргумента комплексного числа.
+        Аргумент не зависит от общего множителя коэффициентов, поэтому вычисляется по масштабированным коэффициентам
+        (см. _scaled_floats) и не переполняется.
 
-        :return: Число типа float – аргумент комплексного числа.
+        Если задано количество знаков digits, аргумент вычисляется в целых числах с фиксированной точкой
+        (арктангенс отношения |b|/|a| или |a|/|b|, не превосходящего 1, и pi по формуле Мэчина).
+        Арктангенсы кэшируются по несократимому отношению коэффициентов, поэтому повторные углы не пересчитываются.
+
+        :param digits: Количество верных десятичных знаков после запятой (None – вычисление в float).
+        :return: Число типа float – аргумент комплексного числа в диапазоне [-pi, pi],
+            или число типа Rational со знаменателем 10^digits (до сокращения) с погрешностью меньше 10^(-digits).
         """
 
-        real_float = float(self.real.numerator) / float(self.real.denominator)
-        imaginary_float = float(self.imaginary.numerator) / float(self.imaginary.denominator)
+        if digits is not None:
+            return self._arg_digits(digits)
+        real_float, imaginary_float, _ = self._scaled_floats()
         argument = math.atan2(imaginary_float, real_float)
         return argument
 
-    def power(self, n):
+    def _arg_digits(self, digits):
+        """
+        Аргумент комплексного числа с точностью до digits десятичных знаков (см. arg).
+        """
+
+        _check_digits(digits)
+        scale = 10 ** digits
+        bits = digits * 10 // 3 + 8
+        real_sign = (self._real.numerator > 0) - (self._real.numerator < 0)
+        imaginary_sign = (self._imaginary.numerator > 0) - (self._imaginary.numerator < 0)
+        if imaginary_sign == 0:
+            angle = _pi_fixed(bits) if real_sign < 0 else 0
+        elif real_sign == 0:
+            angle = imaginary_sign * (_pi_fixed(bits) >> 1)
+        else:
+            # |b/a| = (|b_num|·a_den) / (|a_num|·b_den)
+            ratio = Rational(abs(self._imaginary.numerator) * self._real.denominator,
+                             abs(self._real.numerator) * self._imaginary.denominator)
+            if ratio.numerator <= ratio.denominator:
+                angle = _atan_fixed(ratio.numerator, ratio.denominator, bits)
+            else:
+                angle = (_pi_fixed(bits) >> 1) - _atan_fixed(ratio.denominator, ratio.numerator, bits)
+            if real_sign < 0:
+                angle = _pi_fixed(bits) - angle
+            angle *= imaginary_sign
+        return Rational((angle * scale + (1 << (bits - 1))) >> bits, scale)
+
+    def abs_exact(self):
+        """
+        Метод точного вычисления модуля комплексного числа.
+        Квадрат модуля a^2 + b^2 – несократимая дробь p/q; ее корень рационален,
+        только если p и q – полные квадраты (проверяется с помощью math.isqrt).
+
+        :return: Число типа Rational – точный модуль или None, если модуль иррационален.
+        """
+
+        modulus_squared = self._real * self._real + self._imaginary * self._imaginary
+        numerator_root = math.isqrt(modulus_squared.numerator)
+        if numerator_root * numerator_root != modulus_squared.numerator:
+            return None
+        denominator_root = math.isqrt(modulus_squared.denominator)
+        if denominator_root * denominator_root != modulus_squared.denominator:
+            return None
+        return Rational._from_normalized(numerator_root, denominator_root)
+
+    def abs(self, digits=None):
+        """
+        Метод вычисления модуля комплексного числа с заданной точностью.
+        Вычисление выполняется в целых числах: floor(|z|·10^digits) = isqrt(floor((a^2 + b^2)·10^(2·digits))),
+        поэтому точность не ограничена 53 битами float.
+
+        :param digits: Количество верных десятичных знаков после запятой (None – вычисление в float, как abs(z)).
+        :return: Число типа Rational со знаменателем 10^digits (до сокращения) – модуль, округленный вниз,
+            или число типа float, если digits не задано.
+        """
+
+        if digits is None:
+            return abs(self)
+        _check_digits(digits)
+        modulus_squared = self._real * self._real + self._imaginary * self._imaginary
+        scale = 10 ** digits
+        root = math.isqrt(modulus_squared.numerator * scale * scale // modulus_squared.denominator)
+        return Rational(root, scale)
+
+    def __complex__(self):
+        """
+        Оператор преобразования комплексного числа во встроенное комплексное число (complex).
+        Каждый коэффициент округляется корректно (см. Rational.__float__).
+
+        :return: Число типа complex.
         """
-        Оператор возведения комплексного числа в натуральную степень
 
-        :param n: Натуральное число (int) – степень, в которую требуется возвести комплексное число
-        :return: Результат (приблизительный, округленный до 4 знака после запятой) возведения комплексного числа в натуральную степень
+        return complex(float(self._real), float(self._imaginary))
+
+    def power(self, n, approximate=False):
+        """
+        Оператор возведения комплексного числа в целую степень.
+
+        По умолчанию вычисление точное: бинарное возведение в степень (возведение в квадрат и умножение)
+        в рациональной арифметике, требующее O(log n) умножений и не использующее вещественных чисел.
+        Отрицательная степень вычисляется как степень точного обратного числа.
+
+        Приближенный режим (approximate=True) использует формулу Муавра в числах с плавающей точкой
+        и возвращает результат, округленный до 4 знака после запятой.
+
+        :param n: Целое число (int) – степень, в которую требуется возвести комплексное число
+        :param approximate: Использовать ли быстрое приближенное вычисление по формуле Муавра
+        :return: Результат возведения комплексного числа в степень
+        """
+
+        if not isinstance(n, int):
+            raise ValueError("Exponent must be an integer")
+
+        if approximate:
+            r = abs(self)
+            theta = self.arg()
+
+            # Возводим в степень по теореме Муавра
+            new_real = r ** n * math.cos(n * theta)
+            new_imaginary = r ** n * math.sin(n * theta)
+
+            # Возвращаемся к рациональным коэффициентам действительной и мнимой части,
+            # округленным до 4 знака после запятой (ближайшие дроби со знаменателем не больше 10^4)
+            real_rational = Rational._from_normalized(
+                *Rational.reducedfraction(*new_real.as_integer_ratio(), max_denominator=_APPROXIMATE_DENOMINATOR))
+            imaginary_rational = Rational._from_normalized(
+                *Rational.reducedfraction(*new_imaginary.as_integer_ratio(), max_denominator=_APPROXIMATE_DENOMINATOR))
+
+            return Complex._from_parts(real_rational, imaginary_rational)
+
+        base = self
+        if n < 0:
+            base = Complex.interned(1) / self
+            n = -n
+
+        result = Complex.interned(1)
+        while n:
+            if n & 1:
+                result = result * base
+            n >>= 1
+            if n:
+                base = base * base
+        return result
+
+    def powers(self, n):
+        """
+        Генератор последовательных степеней комплексного числа z^0, z^1, ..., z^n.
+        В отличие от n вызовов power, каждая следующая степень получается из предыдущей одним умножением:
+        степень хранится несокращенной тройкой (a, b, d) – числом (a + bi) / d – и умножается на z
+        методом Гаусса; сокращаются только выдаваемые значения.
+
+        :param n: Наибольший показатель степени – неотрицательное целое число (int).
+        :return: Итератор чисел типа Complex (n + 1 значение).
         """
 
         if not isinstance(n, int) or n < 0:
-            raise ValueError("Exponent must be a natural number (non-negative integer)")
+            raise ValueError("n should be a non-negative integer.")
+        real, imaginary = self._real, self._imaginary
+        denominator = math.lcm(real.denominator, imaginary.denominator)
+        base = (real.numerator * (denominator // real.denominator),
+                imaginary.numerator * (denominator // imaginary.denominator), denominator)
+
+        def generate():
+            current = (1, 0, 1)
+            yield Complex.interned(1)
+            for _ in range(n):
+                current = _multiply_triples(current, base)
+                yield _from_triple(current)
 
-        r = abs(self)
-        theta = self.arg()
+        return generate()
 
-        # Возводим в степень по теореме Муавра
-        new_real = r ** n * math.cos(n * theta)
-        new_imaginary = r ** n * math.sin(n * theta)
+    def __setattr__(self, name, value):
+        raise AttributeError("Complex objects are immutable.")
 
-        # Возвращаемся к рациональным коэффициентам действительной и мнимой части
-        real_rational = Rational(new_real)  # Приблизительное значение
-        imaginary_rational = Rational(new_imaginary)  # Приблизительное значение
+    def __delattr__(self, name):
+        raise AttributeError("Complex objects are immutable.")
 
-        return Complex(real_rational, imaginary_rational)
+    def __reduce__(self):
+        return Complex._from_parts, (self._real, self._imaginary)
 
     def __str__(self):
         """
@@ -284,7 +776,7 @@ class Complex:
         :return: Объект типа str в формате "(действительная часть) + (мнимая часть)i".
         """
 
-        return f"({self.real}) + ({self.imaginary})i"
+        return f"({self._real}) + ({self._imaginary})i"
 
     def __repr__(self):
         """
@@ -294,7 +786,12 @@ class Complex:
         :return: Объект типа str в формате "Complex(действительная часть, мнимая часть)".
         """
 
-        return f"Complex(Rational({self.real.numerator}, {self.real.denominator}), Rational({self.imaginary.numerator}, {self.imaginary.denominator}))"
+        return f"Complex(Rational({self._real.numerator}, {self._real.denominator}), Rational({self._imaginary.numerator}, {self._imaginary.denominator}))"
+
+
+# Слоты неизменяемых объектов заполняются через дескрипторы слотов в обход запрещенного __setattr__
+_set_real = Complex._real.__set__
+_set_imaginary = Complex._imaginary.__set__
 
 # r = 4
 # print(Complex.to_complex(r))
@@ -0,0 +1,348 @@
+import numpy as np
+from rational import Rational
+from complex import Complex
+from rational_array import RationalArray, _bits, _INT64_BITS
+
+
+class ComplexArray:
+    """
+    Класс массива комплексных чисел.
+    Действительные и мнимые части хранятся в двух столбцах – массивах рациональных чисел (RationalArray),
+    поэтому все операции выполняются поэлементно над целыми столбцами сразу,
+    без создания промежуточных объектов Rational для каждого элемента.
+    """
+
+    def __init__(self, values=()):
+        """
+        Метод инициализации объекта класса ComplexArray (массива комплексных чисел).
+        Принимает в себя последовательность чисел типа Complex, Rational или int.
+
+        :param values: Последовательность комплексных (Complex), рациональных (Rational) или целых (int) чисел.
+        """
+
+        real = []
+        imaginary = []
+        for value in values:
+            if isinstance(value, Complex):
+                real.append(value.real)
+                imaginary.append(value.imaginary)
+            elif isinstance(value, (Rational, int)):
+                real.append(value)
+                imaginary.append(0)
+            else:
+                raise TypeError("ComplexArray elements must be Complex, Rational or int.")
+        self.__real = RationalArray(real)
+        self.__imaginary = RationalArray(imaginary)
+
+    @classmethod
+    def from_parts(cls, real, imaginary=None):
+        """
+        Метод создания массива комплексных чисел из массивов действительных и мнимых частей.
+
+        :param real: Действительные части – RationalArray или последовательность чисел типа Rational или int.
+        :param imaginary: Мнимые части – RationalArray или последовательность чисел типа Rational или int
+            (по умолчанию все мнимые части равны нулю).
+        :return: Объект класса ComplexArray.
+        """
+
+        if not isinstance(real, RationalArray):
+            real = RationalArray(real)
+        if imaginary is None:
+            imaginary = RationalArray.from_columns(np.zeros(len(real), dtype=np.int64))
+        elif not isinstance(imaginary, RationalArray):
+            imaginary = RationalArray(imaginary)
+        if len(real) != len(imaginary):
+            raise ValueError("Real and imaginary parts must be of equal length.")
+        return cls._from_columns(real, imaginary)
+
+    @classmethod
+    def _from_columns(cls, real, imaginary):
+        """
+        Внутренний метод создания массива из двух столбцов RationalArray без каких-либо проверок.
+        """
+
+        array = cls.__new__(cls)
+        array.__real = real
+        array.__imaginary = imaginary
+        return array
+
+    @staticmethod
+    def _columns(other):
+        """
+        Статический метод представления операнда в виде пары столбцов (действительные части, мнимые части).
+        Числа распространяются на всю длину массива как столбцы длины 1.
+
+        :param other: Операнд – ComplexArray, Complex, Rational или int.
+        :return: Пара объектов RationalArray или NotImplemented, если операция для данного типа не определена.
+        """
+
+        if isinstance(other, ComplexArray):
+            return other.__real, other.__imaginary
+        if isinstance(other, Complex):
+            return RationalArray([other.real]), RationalArray([other.imaginary])
+        if isinstance(other, (Rational, int)):
+            return RationalArray([other]), RationalArray([0])
+        return NotImplemented
+
+    @property
+    def real(self):
+        return self.__real
+
+    @property
+    def imaginary(self):
+        return self.__imaginary
+
+    def __len__(self):
+        return len(self.__real)
+
+    def __getitem__(self, index):
+        """
+        Оператор доступа к элементу (или срезу) массива.
+
+        :param index: Индекс (int) или срез (slice).
+        :return: Число типа Complex для индекса или объект класса ComplexArray для среза.
+        """
+
+        if isinstance(index, slice):
+            return ComplexArray._from_columns(self.__real[index], self.__imaginary[index])
+        return Complex._from_parts(self.__real[index], self.__imaginary[index])
+
+    def __iter__(self):
+        for real, imaginary in zip(self.__real, self.__imaginary):
+            yield Complex._from_parts(real, imaginary)
+
+    def to_list(self):
+        """
+        Метод преобразования массива в список комплексных чисел.
+
+        :return: Список объектов класса Complex.
+        """
+
+        return list(self)
+
+    def __add__(self, other):
+        """
+        Оператор поэлементного сложения массива комплексных чисел с другим массивом той же длины
+        или с числом (Complex, Rational, int).
+
+        :param other: Число или массив, с которым происходит сложение.
+        :return: Результат сложения – новый объект класса ComplexArray или ошибка неопределенности операции.
+        """
+
+        columns = ComplexArray._columns(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        return ComplexArray._from_columns(self.__real + columns[0], self.__imaginary + columns[1])
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        """
+        Оператор поэлементного вычитания из массива комплексных чисел другого массива той же длины
+        или числа (Complex, Rational, int).
+
+        :param other: Число или массив, которое вычитается.
+        :return: Результат вычитания – новый объект класса ComplexArray или ошибка неопределенности операции.
+        """
+
+        columns = ComplexArray._columns(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        return ComplexArray._from_columns(self.__real - columns[0], self.__imaginary - columns[1])
+
+    def __rsub__(self, other):
+        columns = ComplexArray._columns(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        return ComplexArray._from_columns(columns[0] - self.__real, columns[1] - self.__imaginary)
+
+    def __mul__(self, other):
+        """
+        Оператор поэлементного умножения массива комплексных чисел на другой массив той же длины
+        или на число (Complex, Rational, int).
+
+        Операнды приводятся к целым тройкам (a, b, d) – (a + bi) / d, и над целыми столбцами
+        используется форма Гаусса с тремя умножениями вместо четырех:
+            (a + bi)(c + ei) = (k1 - k3) + (k1 + k2)i, где
+            k1 = c(a + b), k2 = a(e - c), k3 = b(c + e).
+        Дроби сокращаются один раз – для готовых действительных и мнимых частей.
+
+        :param other: Число или массив, на которое происходит умножение.
+        :return: Результат умножения – новый объект класса ComplexArray или ошибка неопределенности операции.
+        """
+
+        columns = ComplexArray._columns(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        self.__real._check_length(columns[0].numerators)
+        a, b, d = ComplexArray._triple(self.__real, self.__imaginary)
+        c, e, f = ComplexArray._triple(*columns)
+        bits = max(max(_bits(a), _bits(b)) + max(_bits(c), _bits(e)) + 2, _bits(d) + _bits(f))
+        if bits > _INT64_BITS or object in (a.dtype, c.dtype):
+            a, b, d, c, e, f = (column.astype(object) for column in (a, b, d, c, e, f))
+        k1 = c * (a + b)
+        k2 = a * (e - c)
+        k3 = b * (c + e)
+        denominators = d * f
+        return ComplexArray._from_columns(RationalArray._normalized(k1 - k3, denominators),
+                                          RationalArray._normalized(k1 + k2, denominators))
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        """
+        Оператор поэлементного деления массива комплексных чисел на другой массив той же длины
+        или на число (Complex, Rational, int), не содержащие нулей.
+        Знаменатель c*c + d*d вычисляется один раз для каждой пары элементов.
+
+        :param other: Число или массив, на которое происходит деление.
+        :return: Результат деления – новый объект класса ComplexArray или ошибка неопределенности операции.
+        """
+
+        columns = ComplexArray._columns(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        return ComplexArray._divide(self.__real, self.__imaginary, *columns)
+
+    def __rtruediv__(self, other):
+        columns = ComplexArray._columns(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        return ComplexArray._divide(columns[0], columns[1], self.__real, self.__imaginary)
+
+    @staticmethod
+    def _triple(real, imaginary):
+        """
+        Внутренний метод приведения столбцов действительных и мнимых частей к общему знаменателю.
+
+        :return: Тройка столбцов целых чисел (a, b, d), где элементы равны (a + bi) / d.
+        """
+
+        real_numerators, real_denominators = real.numerators, real.denominators
+        imaginary_numerators, imaginary_denominators = imaginary.numerators, imaginary.denominators
+        columns = (real_numerators, real_denominators, imaginary_numerators, imaginary_denominators)
+        # Общий знаменатель не больше произведения знаменателей, числители – не больше произведения
+        # числителя на знаменатель другой части
+        bits = max(_bits(real_numerators), _bits(imaginary_numerators), _bits(real_denominators)) \
+            + _bits(imaginary_denominators)
+        if bits > _INT64_BITS or any(column.dtype == object for column in columns):
+            columns = tuple(column.astype(object) for column in columns)
+        real_numerators, real_denominators, imaginary_numerators, imaginary_denominators = columns
+        denominators = np.lcm(real_denominators, imaginary_denominators)
+        return (real_numerators * (denominators // real_denominators),
+                imaginary_numerators * (denominators // imaginary_denominators), denominators)
+
+    @staticmethod
+    def _divide(a, b, c, d):
+        """
+        Внутренний метод деления (a + bi) / (c + di) над столбцами.
+        """
+
+        denominator = c * c + d * d
+        if np.any(denominator.numerators == 0):
+            raise ZeroDivisionError("Cannot divide by zero.")
+        return ComplexArray._from_columns((a * c + b * d) / denominator, (b * c - a * d) / denominator)
+
+    def __neg__(self):
+        """
+        Оператор поэлементного отрицания массива комплексных чисел.
+
+        :return: Новый объект класса ComplexArray с элементами противоположного знака.
+        """
+
+        return ComplexArray._from_columns(-self.__real, -self.__imaginary)
+
+    def conjugate(self):
+        """
+        Метод поэлементного комплексного сопряжения.
+
+        :return: Новый объект класса ComplexArray с мнимыми частями противоположного знака.
+        """
+
+        return ComplexArray._from_columns(self.__real, -self.__imaginary)
+
+    def __eq__(self, other):
+        """
+        Оператор поэлементной проверки равенства.
+
+        :param other: Массив той же длины или число (Complex, Rational, int).
+        :return: Массив np.ndarray логических значений или ошибка неопределенности операции.
+        """
+
+        columns = ComplexArray._columns(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        return (self.__real == columns[0]) & (self.__imaginary == columns[1])
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        return ~result
+
+    __hash__ = None
+
+    def __abs__(self):
+        """
+        Оператор поэлементного взятия модуля.
+
+        :return: Массив np.ndarray типа float64 – модули элементов.
+        """
+
+        return np.hypot(self.__real.to_float(), self.__imaginary.to_float())
+
+    def arg(self):
+        """
+        Метод поэлементного взятия аргумента.
+
+        :return: Массив np.ndarray типа float64 – аргументы элементов.
+        """
+
+        return np.arctan2(self.__imaginary.to_float(), self.__real.to_float())
+
+    def sum(self):
+        """
+        Метод суммирования элементов массива.
+
+        :return: Число типа Complex – сумма всех элементов.
+        """
+
+        return Complex._from_parts(self.__real.sum(), self.__imaginary.sum())
+
+    def prod(self):
+        """
+        Метод перемножения элементов массива попарным (древовидным) умножением:
+        на каждом шаге первая половина массива поэлементно умножается на вторую.
+
+        :return: Число типа Complex – произведение всех элементов (1 для пустого массива).
+        """
+
+        if len(self) == 0:
+            return Complex.interned(1)
+        array = self
+        while len(array) > 1:
+            half = len(array) // 2
+            head = array[:half] * array[half:2 * half]
+            if len(array) % 2:
+                head = ComplexArray._from_columns(RationalArray.concatenate((head.real, array.real[-1:])),
+                                                  RationalArray.concatenate((head.imaginary, array.imaginary[-1:])))
+            array = head
+        return array[0]
+
+    def __str__(self):
+        """
+        Оператор удобного представления массива комплексных чисел в виде объекта типа str
+        в формате "[(действительная часть) + (мнимая часть)i, ...]".
+        """
+
+        return "[" + ", ".join(str(value) for value in self) + "]"
+
+    def __repr__(self):
+        """
+        Оператор формального представления массива комплексных чисел в виде объекта типа str
+        в формате "ComplexArray([Complex(...), ...])".
+        """
+
+        return "ComplexArray([" + ", ".join(repr(value) for value in self) + "])"
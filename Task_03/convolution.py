@@ -0,0 +1,172 @@
+import math
+from rational import Rational
+from complex import Complex
+
+# Свертки, у которых длина более короткой последовательности меньше этой границы,
+# вычисляются напрямую: упаковка в одно большое число окупается не сразу
+_KRONECKER_LIMIT = 16
+
+
+def _schoolbook(left, right):
+    """
+    Свертка списков целых чисел по определению: n * m умножений.
+    """
+
+    result = [0] * (len(left) + len(right) - 1)
+    for i, a in enumerate(left):
+        if a:
+            for j, b in enumerate(right):
+                result[i + j] += a * b
+    return result
+
+
+def _slot_bytes(left_bound, right_bound, length):
+    """
+    Размер ячейки упаковки в байтах, достаточный для коэффициента свертки со знаком.
+
+    :param left_bound: Наибольшее по модулю значение первой последовательности.
+    :param right_bound: Наибольшее по модулю значение второй последовательности.
+    :param length: Длина более короткой последовательности (количество слагаемых в коэффициенте свертки).
+    """
+
+    bits = (left_bound * right_bound * length).bit_length() + 1
+    return (bits + 7) // 8
+
+
+def _pack(values, width):
+    """
+    Упаковка Кронекера: значение многочлена с целыми коэффициентами (со знаком) в точке 2^(8 * width).
+    Положительные и отрицательные коэффициенты собираются в байтовые строки по отдельности,
+    поэтому упаковка выполняется за линейное время.
+    """
+
+    positive = b"".join(value.to_bytes(width, "little") if value > 0 else bytes(width) for value in values)
+    packed = int.from_bytes(positive, "little")
+    if any(value < 0 for value in values):
+        negative = b"".join((-value).to_bytes(width, "little") if value < 0 else bytes(width) for value in values)
+        packed -= int.from_bytes(negative, "little")
+    return packed
+
+
+def _unpack(packed, count, width):
+    """
+    Распаковка Кронекера: коэффициенты со знаком по значению многочлена в точке 2^(8 * width).
+    Ячейки читаются из дополнительного кода младшими вперед; отрицательный коэффициент занимает
+    единицу из следующей ячейки.
+    """
+
+    data = packed.to_bytes(count * width + 1, "little", signed=True)
+    full = 1 << (8 * width)
+    half = full >> 1
+    result = []
+    carry = 0
+    for start in range(0, count * width, width):
+        value = int.from_bytes(data[start:start + width], "little") + carry
+        if value >= half:
+            result.append(value - full)
+            carry = 1
+        else:
+            result.append(value)
+            carry = 0
+    return result
+
+
+def _bound(values):
+    return max(map(abs, values), default=0)
+
+
+def _integer_convolve(left, right):
+    """
+    Свертка списков целых чисел (произведение многочленов с целыми коэффициентами).
+    Длинные списки упаковываются в большие целые числа (подстановка Кронекера), которые перемножаются
+    одним умножением int (алгоритм Карацубы), после чего коэффициенты распаковываются.
+
+    :param left: Список целых чисел (не пустой).
+    :param right: Список целых чисел (не пустой).
+    :return: Список из len(left) + len(right) - 1 целых чисел.
+    """
+
+    if min(len(left), len(right)) < _KRONECKER_LIMIT:
+        return _schoolbook(left, right)
+    width = _slot_bytes(_bound(left), _bound(right), min(len(left), len(right)))
+    return _unpack(_pack(left, width) * _pack(right, width), len(left) + len(right) - 1, width)
+
+
+def _gaussian_convolve(a, b, c, d):
+    """
+    Свертка последовательностей гауссовых целых чисел (a + bi) и (c + di), заданных списками
+    действительных и мнимых частей одинаковой длины: три умножения больших чисел вместо четырех
+    (ac - bd = P1 - P2, ad + bc = P3 - P1 - P2, где P3 = (a + b)(c + d)).
+
+    :return: Пара списков (действительные части, мнимые части).
+    """
+
+    count = len(a) + len(c) - 1
+    if min(len(a), len(c)) < _KRONECKER_LIMIT:
+        ac, bd = _schoolbook(a, c), _schoolbook(b, d)
+        sums = _schoolbook([x + y for x, y in zip(a, b)], [x + y for x, y in zip(c, d)])
+        return [x - y for x, y in zip(ac, bd)], [s - x - y for s, x, y in zip(sums, ac, bd)]
+    width = _slot_bytes(_bound(a) + _bound(b), _bound(c) + _bound(d), min(len(a), len(c)))
+    packed_a, packed_b, packed_c, packed_d = (_pack(values, width) for values in (a, b, c, d))
+    p1 = packed_a * packed_c
+    p2 = packed_b * packed_d
+    p3 = (packed_a + packed_b) * (packed_c + packed_d)
+    return _unpack(p1 - p2, count, width), _unpack(p3 - p1 - p2, count, width)
+
+
+def _integer_parts(values):
+    """
+    Приводит последовательность чисел к общему знаменателю.
+
+    :return: Тройка (числители действительных частей, числители мнимых частей или None, общий знаменатель).
+    """
+
+    real = []
+    imaginary = []
+    is_complex = False
+    for value in values:
+        if isinstance(value, Complex):
+            real.append(value.real)
+            imaginary.append(value.imaginary)
+            is_complex = True
+        elif isinstance(value, (Rational, int)):
+            real.append(Rational.interned(value) if isinstance(value, int) else value)
+            imaginary.append(Rational.interned(0))
+        else:
+            raise TypeError("convolve() accepts only Complex, Rational and int values.")
+    parts = real + imaginary if is_complex else real
+    denominator = math.lcm(*(part.denominator for part in parts))
+    real = [part.numerator * (denominator // part.denominator) for part in real]
+    if not is_complex:
+        return real, None, denominator
+    return real, [part.numerator * (denominator // part.denominator) for part in imaginary], denominator
+
+
+def convolve(left, right):
+    """
+    Точная свертка двух последовательностей чисел: result[k] = sum(left[i] * right[k - i]),
+    то есть коэффициенты произведения многочленов.
+
+    Вместо n * m умножений объектов Rational и Complex (каждое – с сокращением дроби) последовательности
+    приводятся к общим знаменателям, целые числители упаковываются в большие целые числа
+    (подстановка Кронекера) и перемножаются одним-тремя умножениями int; сокращается только результат.
+
+    :param left: Последовательность чисел (Complex, Rational, int).
+    :param right: Последовательность чисел (Complex, Rational, int).
+    :return: Список из len(left) + len(right) - 1 чисел типа Rational
+        (или Complex, если среди чисел есть комплексные); для пустой последовательности – пустой список.
+    """
+
+    left, right = list(left), list(right)
+    if not left or not right:
+        return []
+    a, b, left_denominator = _integer_parts(left)
+    c, d, right_denominator = _integer_parts(right)
+    denominator = left_denominator * right_denominator
+    if b is None and d is None:
+        return [Rational._from_normalized(*Rational.reducedfraction(value, denominator))
+                for value in _integer_convolve(a, c)]
+    real, imaginary = _gaussian_convolve(a, b or [0] * len(a), c, d or [0] * len(c))
+    return [Complex._from_parts(Rational._from_normalized(*Rational.reducedfraction(x, denominator)),
+                                Rational._from_normalized(*Rational.reducedfraction(y, denominator)))
+            for x, y in zip(real, imaginary)]
@@ -0,0 +1,274 @@
+import decimal
+from fractions import Fraction
+import numpy as np
+from rational import Rational
+from complex import Complex
+from rational_array import RationalArray, _pack, _INT64_BITS
+from complex_array import ComplexArray
+
+# Создание Fraction из заведомо несократимой пары без повторного вычисления НОД:
+# начиная с Python 3.12 – внутренний конструктор _from_coprime_ints, раньше – параметр _normalize=False
+if hasattr(Fraction, "_from_coprime_ints"):
+    _make_fraction = Fraction._from_coprime_ints
+else:
+    def _make_fraction(numerator, denominator):
+        return Fraction(numerator, denominator, _normalize=False)
+
+# Количество бит мантиссы float64 (вместе со скрытым битом)
+_MANTISSA_BITS = 53
+
+
+def from_fractions(values):
+    """
+    Пакетное преобразование дробей fractions.Fraction (и целых чисел) в рациональные числа.
+    Дроби Fraction всегда несократимы, поэтому проверки и сокращение (gcd) пропускаются
+    (ограничение размера из контекста арифметики применяется, см. rational.localcontext).
+
+    :param values: Последовательность (или итератор) чисел типа Fraction или int.
+    :return: Список чисел типа Rational.
+    """
+
+    result = []
+    for value in values:
+        if isinstance(value, Fraction):
+            result.append(Rational._from_coprime(value.numerator, value.denominator))
+        elif isinstance(value, int):
+            result.append(Rational._from_coprime(value, 1))
+        else:
+            raise TypeError("from_fractions() accepts only Fraction and int values.")
+    return result
+
+
+def to_fractions(values):
+    """
+    Пакетное преобразование рациональных чисел (и целых чисел) в дроби fractions.Fraction без повторного сокращения.
+
+    :param values: Последовательность (или итератор) чисел типа Rational или int либо RationalArray.
+    :return: Список чисел типа Fraction.
+    """
+
+    result = []
+    for value in values:
+        if isinstance(value, Rational):
+            result.append(_make_fraction(value.numerator, value.denominator))
+        elif isinstance(value, int):
+            result.append(_make_fraction(value, 1))
+        else:
+            raise TypeError("to_fractions() accepts only Rational and int values.")
+    return result
+
+
+def from_floats(values):
+    """
+    Пакетное точное преобразование вещественных чисел (float) в рациональные числа.
+    В отличие от конструктора Rational(float), который выбирает простейшую дробь, округляющуюся к тому же float
+    (см. ArithmeticContext), результат равен двоичному значению float в точности.
+    Пара float.as_integer_ratio() несократима, поэтому сокращение (gcd) пропускается.
+
+    :param values: Последовательность (или итератор) конечных чисел типа float или int.
+    :return: Список чисел типа Rational.
+    """
+
+    result = []
+    for value in values:
+        if not isinstance(value, (float, int)):
+            raise TypeError("from_floats() accepts only float and int values.")
+        result.append(Rational._from_coprime(*value.as_integer_ratio()))
+    return result
+
+
+def from_complexes(values):
+    """
+    Пакетное точное преобразование встроенных комплексных чисел (complex) в комплексные числа Complex
+    (действительная и мнимая части переводятся как в from_floats).
+
+    :param values: Последовательность (или итератор) чисел типа complex, float или int с конечными частями.
+    :return: Список чисел типа Complex.
+    """
+
+    result = []
+    for value in values:
+        if not isinstance(value, (complex, float, int)):
+            raise TypeError("from_complexes() accepts only complex, float and int values.")
+        value = complex(value)
+        result.append(Complex._from_parts(Rational._from_coprime(*value.real.as_integer_ratio()),
+                                          Rational._from_coprime(*value.imag.as_integer_ratio())))
+    return result
+
+
+def to_complexes(values):
+    """
+    Пакетное преобразование чисел в встроенные комплексные числа (complex);
+    каждая часть округляется корректно (см. Complex.__complex__).
+
+    :param values: Последовательность (или итератор) чисел типа Complex, Rational или int либо ComplexArray.
+    :return: Список чисел типа complex.
+    """
+
+    result = []
+    for value in values:
+        if isinstance(value, Complex):
+            result.append(complex(value))
+        elif isinstance(value, (Rational, int)):
+            result.append(complex(float(value)))
+        else:
+            raise TypeError("to_complexes() accepts only Complex, Rational and int values.")
+    return result
+
+
+def from_decimals(values):
+    """
+    Пакетное точное преобразование десятичных чисел decimal.Decimal в рациональные числа.
+    Пара Decimal.as_integer_ratio() несократима, поэтому сокращение (gcd) пропускается.
+
+    :param values: Последовательность (или итератор) конечных чисел типа Decimal или int.
+    :return: Список чисел типа Rational.
+    """
+
+    result = []
+    for value in values:
+        if not isinstance(value, (decimal.Decimal, int)):
+            raise TypeError("from_decimals() accepts only Decimal and int values.")
+        result.append(Rational._from_coprime(*value.as_integer_ratio()))
+    return result
+
+
+def to_decimals(values, context=None):
+    """
+    Пакетное преобразование рациональных чисел в десятичные числа decimal.Decimal.
+    Каждое число – частное точных Decimal(числитель) / Decimal(знаменатель), округленное по правилам контекста.
+
+    :param values: Последовательность (или итератор) чисел типа Rational или int либо RationalArray.
+    :param context: Контекст decimal.Context (по умолчанию – текущий контекст decimal.getcontext()).
+    :return: Список чисел типа Decimal.
+    """
+
+    if context is None:
+        context = decimal.getcontext()
+    result = []
+    for value in values:
+        if isinstance(value, Rational):
+            result.append(context.divide(decimal.Decimal(value.numerator), decimal.Decimal(value.denominator)))
+        elif isinstance(value, int):
+            result.append(context.create_decimal(value))
+        else:
+            raise TypeError("to_decimals() accepts only Rational and int values.")
+    return result
+
+
+def _float_columns(array):
+    """
+    Точные несократимые числители и знаменатели значений массива float64.
+    Значение раскладывается векторизованно (np.frexp) в m * 2^e с целой мантиссой m, из которой
+    удаляются младшие нулевые биты. Если числители или знаменатели не помещаются в int64,
+    столбцы вычисляются поэлементно методом float.as_integer_ratio().
+    """
+
+    if not np.all(np.isfinite(array)):
+        raise ValueError("Cannot convert NaN or infinity to Rational.")
+    mantissas, exponents = np.frexp(array)
+    mantissas = (mantissas * 2.0 ** _MANTISSA_BITS).astype(np.int64)
+    exponents = exponents.astype(np.int64) - _MANTISSA_BITS
+    nonzero = mantissas != 0
+    # Младший единичный бит мантиссы – степень двойки, ее двоичный логарифм вычисляется в float точно
+    shifts = np.log2(np.where(nonzero, mantissas & -mantissas, 1)).astype(np.int64)
+    mantissas >>= shifts
+    exponents = np.where(nonzero, exponents + shifts, 0)
+    lengths = np.log2(np.abs(mantissas) | 1).astype(np.int64) + 1
+    if len(array) == 0 or (-int(exponents.min()) <= _INT64_BITS and int((lengths + exponents).max()) <= _INT64_BITS):
+        numerators = np.where(exponents > 0, mantissas << np.maximum(exponents, 0), mantissas)
+        denominators = np.left_shift(1, np.maximum(-exponents, 0))
+        return numerators, denominators
+    pairs = [value.as_integer_ratio() for value in array.tolist()]
+    return (_pack(np.array([pair[0] for pair in pairs], dtype=object)),
+            _pack(np.array([pair[1] for pair in pairs], dtype=object)))
+
+
+def from_float64(array):
+    """
+    Точное преобразование массива np.ndarray вещественных чисел в массив рациональных чисел
+    без сокращения дробей (результат разложения уже несократим).
+
+    :param array: Одномерный массив (или последовательность) конечных вещественных чисел.
+    :return: Объект класса RationalArray.
+    """
+
+    array = np.asarray(array, dtype=np.float64)
+    if array.ndim != 1:
+        raise ValueError("Only one-dimensional arrays can be converted.")
+    return RationalArray._from_packed(*_float_columns(array))
+
+
+def to_float64(values):
+    """
+    Преобразование рациональных чисел в массив np.ndarray типа float64 (каждое число округляется корректно).
+
+    :param values: RationalArray или последовательность чисел типа Rational, int или float.
+    :return: Массив np.ndarray типа float64.
+    """
+
+    return np.asarray(Rational.to_float(values), dtype=np.float64)
+
+
+def from_complex128(array):
+    """
+    Точное преобразование массива np.ndarray комплексных чисел в массив комплексных чисел ComplexArray
+    (действительные и мнимые части переводятся как в from_float64).
+
+    :param array: Одномерный массив (или последовательность) комплексных чисел с конечными частями.
+    :return: Объект класса ComplexArray.
+    """
+
+    array = np.asarray(array, dtype=np.complex128)
+    if array.ndim != 1:
+        raise ValueError("Only one-dimensional arrays can be converted.")
+    return ComplexArray._from_columns(from_float64(array.real), from_float64(array.imag))
+
+
+def to_complex128(values):
+    """
+    Преобразование комплексных чисел в массив np.ndarray типа complex128 (каждая часть округляется корректно).
+
+    :param values: ComplexArray или последовательность чисел типа Complex, Rational или int.
+    :return: Массив np.ndarray типа complex128.
+    """
+
+    if isinstance(values, ComplexArray):
+        return values.real.to_float() + 1j * values.imaginary.to_float()
+    return np.array(to_complexes(values), dtype=np.complex128)
+
+
+def from_int64_pairs(numerators, denominators=None, normalized=False):
+    """
+    Создание массива рациональных чисел из столбцов целых числителей и знаменателей (например, np.ndarray типа int64).
+
+    :param numerators: Столбец числителей.
+    :param denominators: Столбец знаменателей (по умолчанию все знаменатели равны 1).
+    :param normalized: Если True, столбцы считаются уже нормализованными (знаменатели положительны,
+        дроби несократимы – например, получены из to_int64_pairs) и используются без проверок и сокращения.
+    :return: Объект класса RationalArray.
+    """
+
+    if not normalized:
+        return RationalArray.from_columns(numerators, denominators)
+    numerators = np.asarray(numerators, dtype=np.int64)
+    if denominators is None:
+        denominators = np.ones(len(numerators), dtype=np.int64)
+    return RationalArray._from_packed(numerators, np.asarray(denominators, dtype=np.int64))
+
+
+def to_int64_pairs(values):
+    """
+    Преобразование рациональных чисел в пару столбцов np.ndarray типа int64 (числители, знаменатели).
+
+    :param values: RationalArray или последовательность чисел типа Rational или int.
+    :return: Пара массивов np.ndarray типа int64.
+    :raises OverflowError: Если числитель или знаменатель не помещается в int64.
+    """
+
+    if not isinstance(values, RationalArray):
+        values = RationalArray(values)
+    numerators, denominators = values.numerators, values.denominators
+    if numerators.dtype != np.int64 or denominators.dtype != np.int64:
+        raise OverflowError("Numerators and denominators do not fit into int64.")
+    return numerators, denominators
@@ -0,0 +1,351 @@
+import math
+from rational import Rational
+from complex import Complex
+
+
+def _int_mul(a, b):
+    return a * b
+
+
+def _int_sub(a, b):
+    return a - b
+
+
+def _int_exact_div(a, b):
+    return a // b
+
+
+def _gaussian_mul(a, b):
+    return a[0] * b[0] - a[1] * b[1], a[0] * b[1] + a[1] * b[0]
+
+
+def _gaussian_sub(a, b):
+    return a[0] - b[0], a[1] - b[1]
+
+
+def _gaussian_exact_div(a, b):
+    norm = b[0] * b[0] + b[1] * b[1]
+    return (a[0] * b[0] + a[1] * b[1]) // norm, (a[1] * b[0] - a[0] * b[1]) // norm
+
+
+# Кольца, в которых ведется исключение без дробей: целые числа (для Rational) и гауссовы целые числа (для Complex)
+_INTEGERS = (0, 1, _int_mul, _int_sub, _int_exact_div)
+_GAUSSIAN_INTEGERS = ((0, 0), (1, 0), _gaussian_mul, _gaussian_sub, _gaussian_exact_div)
+
+
+def _bareiss(rows, ring, columns, reduced):
+    """
+    Исключение Барейса без дробей над кольцом целых (или гауссовых целых) чисел.
+    Все промежуточные значения являются минорами исходной матрицы, поэтому деление на предыдущий
+    ведущий элемент всегда точное, а размер чисел растет лишь полиномиально.
+
+    :param rows: Список строк матрицы (изменяется на месте).
+    :param ring: Описание кольца (ноль, единица, умножение, вычитание, точное деление).
+    :param columns: Количество столбцов, в которых ищутся ведущие элементы.
+    :param reduced: Исключать ли элементы и над ведущими (метод Гаусса-Жордана).
+        В этом случае все ведущие элементы в конце равны последнему из них.
+    :return: Тройка (список столбцов ведущих элементов, знак перестановки строк, последний ведущий элемент).
+    """
+
+    zero, one, mul, sub, exact_div = ring
+    previous = one
+    sign = 1
+    pivots = []
+    pivot_row = 0
+    for column in range(columns):
+        if pivot_row == len(rows):
+            break
+        for candidate in range(pivot_row, len(rows)):
+            if rows[candidate][column] != zero:
+                break
+        else:
+            continue
+        if candidate != pivot_row:
+            rows[pivot_row], rows[candidate] = rows[candidate], rows[pivot_row]
+            sign = -sign
+
+        pivot = rows[pivot_row][column]
+        source = rows[pivot_row]
+        for i in range(len(rows)):
+            if i == pivot_row or (i < pivot_row and not reduced):
+                continue
+            row = rows[i]
+            factor = row[column]
+            for j in range(len(row)):
+                if j != column:
+                    row[j] = exact_div(sub(mul(pivot, row[j]), mul(factor, source[j])), previous)
+            row[column] = zero
+        # При reduced=True ведущие элементы предыдущих строк после шага становятся равны текущему:
+        # (pivot * previous - factor * 0) / previous = pivot
+        previous = pivot
+        pivots.append(column)
+        pivot_row += 1
+    return pivots, sign, previous
+
+
+class Matrix:
+    """
+    Класс матриц с точными элементами – рациональными (Rational) или комплексными (Complex) числами.
+
+    Определитель, ранг, решение систем, обратная матрица и приведенный ступенчатый вид вычисляются
+    без дробей: строки приводятся к общему знаменателю, после чего над целыми (для Complex – гауссовыми целыми)
+    числами выполняется исключение Барейса. Сокращение дробей (НОД) выполняется только в самом конце.
+    """
+
+    def __init__(self, rows):
+        """
+        Метод инициализации объекта класса Matrix (матрицы).
+        Принимает в себя последовательность строк – последовательностей чисел одинаковой длины.
+        Числа типов int и float преобразуются в Rational; если среди элементов есть комплексные числа,
+        все элементы преобразуются в Complex.
+
+        :param rows: Последовательность строк матрицы.
+        """
+
+        rows = [list(row) for row in rows]
+        if not rows or not rows[0]:
+            raise ValueError("Matrix must have at least one row and one column.")
+        if any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError("All matrix rows must have the same length.")
+
+        is_complex = any(isinstance(value, Complex) for row in rows for value in row)
+        for row in rows:
+            for j, value in enumerate(row):
+                if is_complex:
+                    if not isinstance(value, Complex):
+                        row[j] = Complex.to_complex(value)
+                elif not isinstance(value, Rational):
+                    row[j] = Rational(value)
+        self.__rows = rows
+        self.__is_complex = is_complex
+
+    @staticmethod
+    def identity(size):
+        """
+        Статический метод создания единичной матрицы.
+
+        :param size: Размер матрицы (натуральное число).
+        :return: Единичная матрица типа Matrix.
+        """
+
+        return Matrix([[Rational.interned(int(i == j)) for j in range(size)] for i in range(size)])
+
+    @property
+    def shape(self):
+        return len(self.__rows), len(self.__rows[0])
+
+    @property
+    def is_complex(self):
+        return self.__is_complex
+
+    def rows(self):
+        """
+        Метод получения строк матрицы.
+
+        :return: Список строк – списков элементов матрицы.
+        """
+
+        return [list(row) for row in self.__rows]
+
+    def __getitem__(self, index):
+        """
+        Оператор доступа к элементу матрицы по паре индексов (строка, столбец).
+        """
+
+        i, j = index
+        return self.__rows[i][j]
+
+    def _integer_rows(self):
+        """
+        Внутренний метод приведения каждой строки к общему знаменателю.
+
+        :return: Пара (список целочисленных строк, список множителей строк).
+            Для комплексной матрицы элементы строк – пары (действительная часть, мнимая часть).
+        """
+
+        integer_rows = []
+        scales = []
+        for row in self.__rows:
+            if self.__is_complex:
+                scale = math.lcm(*(part.denominator for value in row for part in (value.real, value.imaginary)))
+                integer_rows.append([(value.real.numerator * (scale // value.real.denominator),
+                                      value.imaginary.numerator * (scale // value.imaginary.denominator))
+                                     for value in row])
+            else:
+                scale = math.lcm(*(value.denominator for value in row))
+                integer_rows.append([value.numerator * (scale // value.denominator) for value in row])
+            scales.append(scale)
+        return integer_rows, scales
+
+    def _ring(self):
+        return _GAUSSIAN_INTEGERS if self.__is_complex else _INTEGERS
+
+    def _to_number(self, numerator, denominator):
+        """
+        Внутренний метод преобразования частного двух элементов кольца в число (Rational или Complex).
+        Здесь выполняется единственное за все вычисление сокращение дроби.
+        """
+
+        if not self.__is_complex:
+            return Rational(numerator, denominator)
+        norm = denominator[0] * denominator[0] + denominator[1] * denominator[1]
+        real = numerator[0] * denominator[0] + numerator[1] * denominator[1]
+        imaginary = numerator[1] * denominator[0] - numerator[0] * denominator[1]
+        return Complex._from_parts(Rational(real, norm), Rational(imaginary, norm))
+
+    def determinant(self):
+        """
+        Метод вычисления определителя квадратной матрицы.
+
+        :return: Определитель – число типа Rational (или Complex для комплексной матрицы).
+        """
+
+        size, columns = self.shape
+        if size != columns:
+            raise ValueError("Determinant is defined only for square matrices.")
+        rows, scales = self._integer_rows()
+        pivots, sign, last_pivot = _bareiss(rows, self._ring(), columns, reduced=False)
+        zero, one = self._ring()[:2]
+        if len(pivots) < size:
+            return self._to_number(zero, one)
+        if sign < 0:
+            last_pivot = self._ring()[3](zero, last_pivot)
+        return self._to_number(last_pivot, self._scale_element(math.prod(scales)))
+
+    def _scale_element(self, scale):
+        return (scale, 0) if self.__is_complex else scale
+
+    def rank(self):
+        """
+        Метод вычисления ранга матрицы.
+
+        :return: Ранг матрицы – целое число (int).
+        """
+
+        rows, _ = self._integer_rows()
+        pivots, _, _ = _bareiss(rows, self._ring(), self.shape[1], reduced=False)
+        return len(pivots)
+
+    def rref(self):
+        """
+        Метод приведения матрицы к приведенному ступенчатому виду (методом Гаусса-Жордана без дробей).
+
+        :return: Матрица типа Matrix в приведенном ступенчатом виде.
+        """
+
+        rows, _ = self._integer_rows()
+        pivots, _, last_pivot = _bareiss(rows, self._ring(), self.shape[1], reduced=True)
+        zero, one = self._ring()[:2]
+        result = []
+        for i, row in enumerate(rows):
+            # Все ненулевые строки сейчас умножены на последний ведущий элемент
+            denominator = last_pivot if i < len(pivots) else one
+            result.append([self._to_number(value, denominator) for value in row])
+        return Matrix(result)
+
+    def solve(self, right_side):
+        """
+        Метод решения системы линейных уравнений A x = b с невырожденной квадратной матрицей A.
+
+        :param right_side: Правая часть – последовательность чисел (вектор) или матрица типа Matrix
+            (тогда решается несколько систем сразу).
+        :return: Решение – список чисел для вектора или матрица типа Matrix для матрицы.
+        """
+
+        size, columns = self.shape
+        if size != columns:
+            raise ValueError("Only square systems can be solved.")
+        is_vector = not isinstance(right_side, Matrix)
+        if is_vector:
+            right_side = Matrix([[value] for value in right_side])
+        if right_side.shape[0] != size:
+            raise ValueError("Right side must have as many rows as the matrix.")
+
+        is_complex = self.__is_complex or right_side.is_complex
+        augmented = Matrix([left + right for left, right in zip(self.__rows, right_side.rows())])
+        if is_complex and not augmented.is_complex:
+            augmented = Matrix([[Complex.to_complex(value) for value in row] for row in augmented.rows()])
+        rows, _ = augmented._integer_rows()
+        pivots, _, last_pivot = _bareiss(rows, augmented._ring(), columns, reduced=True)
+        if len(pivots) < size:
+            raise ValueError("Matrix is singular.")
+
+        # Левая часть стала last_pivot * E, значит x = (правая часть) / last_pivot
+        solution = [[augmented._to_number(value, last_pivot) for value in row[columns:]] for row in rows]
+        if is_vector:
+            return [row[0] for row in solution]
+        return Matrix(solution)
+
+    def inverse(self):
+        """
+        Метод вычисления обратной матрицы.
+
+        :return: Обратная матрица типа Matrix.
+        """
+
+        size, columns = self.shape
+        if size != columns:
+            raise ValueError("Only square matrices can be inverted.")
+        return self.solve(Matrix.identity(size))
+
+    def __mul__(self, other):
+        """
+        Оператор умножения матрицы на матрицу (матричное произведение) или на число.
+
+        :param other: Матрица типа Matrix или число (Rational, Complex, int).
+        :return: Результат умножения – матрица типа Matrix или ошибка неопределенности операции.
+        """
+
+        if isinstance(other, Matrix):
+            if self.shape[1] != other.shape[0]:
+                raise ValueError("Matrix shapes do not match.")
+            left_rows = self.__rows
+            other_rows = other.rows()
+            if self.__is_complex != other.is_complex:
+                left_rows = [[Complex.to_complex(value) for value in row] for row in left_rows]
+                other_rows = [[Complex.to_complex(value) for value in row] for row in other_rows]
+            other_columns = list(zip(*other_rows))
+            result = []
+            for row in left_rows:
+                new_row = []
+                for column in other_columns:
+                    total = row[0] * column[0]
+                    for left, right in zip(row[1:], column[1:]):
+                        total = total + left * right
+                    new_row.append(total)
+                result.append(new_row)
+            return Matrix(result)
+        if isinstance(other, (Rational, Complex, int)):
+            if isinstance(other, Complex):
+                return Matrix([[Complex.to_complex(value) * other for value in row] for row in self.__rows])
+            return Matrix([[value * other for value in row] for row in self.__rows])
+        return NotImplemented
+
+    def __eq__(self, other):
+        """
+        Оператор проверки равенства двух матриц.
+        """
+
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.shape == other.shape and all(
+            left == right for row, other_row in zip(self.__rows, other.rows()) for left, right in zip(row, other_row))
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    __hash__ = None
+
+    def __str__(self):
+        """
+        Оператор удобного представления матрицы в виде объекта типа str: по одной строке матрицы на строку текста.
+        """
+
+        return "\n".join("[" + ", ".join(str(value) for value in row) + "]" for row in self.__rows)
+
+    def __repr__(self):
+        """
+        Оператор формального представления матрицы в виде объекта типа str в формате "Matrix([[...], ...])".
+        """
+
+        return "Matrix([" + ", ".join("[" + ", ".join(repr(value) for value in row) + "]" for row in self.__rows) + "])"
@@ -0,0 +1,514 @@
+import functools
+import itertools
+import math
+import os
+import numpy as np
+from rational import Rational
+from complex import Complex
+from matrix import Matrix
+from parallel import _pack_all
+
+# Простые модули не длиннее одной цифры int в CPython (30 бит): операции по такому модулю самые быстрые.
+# Все модули сравнимы с 1 по модулю 4, поэтому у -1 есть квадратный корень и комплексная задача
+# по модулю p распадается на две задачи с обычными вычетами (см. _solve_primes).
+_PRIME_BITS = 30
+
+# Модули обрабатываются пачками: первая пачка невелика (ответ может оказаться коротким),
+# затем размер пачки удваивается до наибольшего; в пуле процессов каждой задаче отдается наибольшая пачка
+_FIRST_BATCH = 4
+_MAX_BATCH = 64
+
+# Числа меньше этой границы по модулю переводятся в вычеты векторно (в numpy.int64)
+_SMALL_LIMIT = 1 << 62
+
+# Сколько модулей может оказаться вырожденными (матрица системы вырождена по модулю p),
+# прежде чем вырожденность проверяется точным вычислением
+_SINGULAR_LIMIT = 4
+
+# Результаты вычисления по модулю, не дающие вычетов ответа:
+# знаменатель входных данных делится на модуль или матрица вырождена по модулю
+_UNLUCKY = "unlucky"
+_SINGULAR = "singular"
+
+# Простые модули в порядке убывания (дополняется по мере необходимости)
+_PRIMES = []
+
+
+class _UnluckyPrime(Exception):
+    pass
+
+
+def _is_prime(number):
+    """
+    Детерминированный тест Миллера – Рабина для чисел меньше 2^32 (основания 2, 7, 61).
+    """
+
+    if number < 2:
+        return False
+    for base in (2, 7, 61):
+        if number % base == 0:
+            return number == base
+    odd, shift = number - 1, 0
+    while odd % 2 == 0:
+        odd, shift = odd // 2, shift + 1
+    for base in (2, 7, 61):
+        x = pow(base, odd, number)
+        if x in (1, number - 1):
+            continue
+        for _ in range(shift - 1):
+            x = x * x % number
+            if x == number - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _primes():
+    """
+    Генератор простых модулей p < 2^30, p = 1 (mod 4), в порядке убывания.
+    """
+
+    for index in itertools.count():
+        if index == len(_PRIMES):
+            candidate = _PRIMES[-1] - 4 if _PRIMES else (1 << _PRIME_BITS) - 3
+            while not _is_prime(candidate):
+                candidate -= 4
+            _PRIMES.append(candidate)
+        yield _PRIMES[index]
+
+
+@functools.lru_cache(maxsize=None)
+def _sqrt_minus_one(prime):
+    """
+    Квадратный корень из -1 по простому модулю p = 1 (mod 4).
+    """
+
+    for base in itertools.count(2):
+        root = pow(base, (prime - 1) // 4, prime)
+        if root * root % prime == prime - 1:
+            return root
+
+
+def _inverse(values, moduli):
+    """
+    Обратные вычеты по простым модулям (малая теорема Ферма: x^(p-2)), для массивов сразу.
+    Для нуля возвращается ноль.
+
+    :param values: Массив вычетов (numpy.int64).
+    :param moduli: Массив модулей, совместимый по форме с values.
+    :return: Массив обратных вычетов той же формы.
+    """
+
+    result = np.ones_like(values)
+    base = values % moduli
+    exponent = np.broadcast_to(moduli - 2, values.shape).copy()
+    while exponent.any():
+        odd = (exponent & 1).astype(bool)
+        result = np.where(odd, result * base % moduli, result)
+        base = base * base % moduli
+        exponent >>= 1
+    return result
+
+
+def _reduce_integers(numbers, primes):
+    """
+    Вычеты целых чисел по каждому из простых модулей.
+
+    :return: Массив numpy.int64 формы (количество модулей, количество чисел).
+    """
+
+    moduli = np.array(primes, dtype=np.int64)[:, None]
+    if all(-_SMALL_LIMIT < number < _SMALL_LIMIT for number in numbers):
+        return np.array(numbers, dtype=np.int64)[None, :] % moduli
+    numbers = np.array(numbers, dtype=object)
+    return np.array([numbers % prime for prime in primes], dtype=np.int64)
+
+
+def _residues(fractions, primes):
+    """
+    Вычеты дробей n/d по каждому из простых модулей.
+
+    :param fractions: Список пар (числитель, знаменатель).
+    :param primes: Список простых модулей.
+    :return: Пара (массив вычетов формы (количество модулей, количество дробей),
+        массив признаков "знаменатель какой-то дроби делится на модуль").
+    """
+
+    moduli = np.array(primes, dtype=np.int64)[:, None]
+    numerators = _reduce_integers([numerator for numerator, _ in fractions], primes)
+    # Знаменатели обычно повторяются, поэтому обращаются только различные из них
+    distinct = {}
+    indices = np.array([distinct.setdefault(denominator, len(distinct)) for _, denominator in fractions], dtype=np.intp)
+    denominators = _reduce_integers(list(distinct), primes)
+    unlucky = (denominators == 0).any(axis=1)
+    return numerators * _inverse(denominators, moduli)[:, indices] % moduli, unlucky
+
+
+def _crt_step(residues, modulus, new_residues, prime):
+    """
+    Добавляет к вычетам по модулю M вычеты по новому простому модулю p (китайская теорема об остатках).
+
+    :return: Пара (вычеты по модулю M * p, M * p).
+    """
+
+    if residues is None:
+        return list(new_residues), prime
+    inverse = pow(modulus % prime, -1, prime)
+    combined = [residue + modulus * ((new - residue) * inverse % prime)
+                for residue, new in zip(residues, new_residues)]
+    return combined, modulus * prime
+
+
+def crt(residues, moduli):
+    """
+    Китайская теорема об остатках: число x, 0 <= x < m1 * m2 * ..., такое что x = r_k (mod m_k).
+
+    :param residues: Последовательность вычетов.
+    :param moduli: Последовательность попарно взаимно простых модулей той же длины.
+    :return: Пара (x, произведение модулей).
+    """
+
+    result, modulus = 0, 1
+    for residue, prime in zip(residues, moduli, strict=True):
+        inverse = pow(modulus % prime, -1, prime)
+        result += modulus * ((residue - result) * inverse % prime)
+        modulus *= prime
+    return result, modulus
+
+
+def rational_reconstruction(residue, modulus):
+    """
+    Восстановление дроби по вычету (алгоритм Ванга): несократимая дробь n/d, такая что n = residue * d (mod m),
+    |n| <= sqrt(m / 2), 0 < d <= sqrt(m / 2). Такая дробь единственна, если существует.
+
+    :param residue: Вычет по модулю modulus.
+    :param modulus: Модуль (натуральное число).
+    :return: Пара (числитель, знаменатель) или None, если модуль слишком мал для восстановления.
+    """
+
+    bound = math.isqrt(modulus // 2)
+    r0, r1 = modulus, residue % modulus
+    t0, t1 = 0, 1
+    while r1 > bound:
+        quotient = r0 // r1
+        r0, r1 = r1, r0 - quotient * r1
+        t0, t1 = t1, t0 - quotient * t1
+    if t1 < 0:
+        r1, t1 = -r1, -t1
+    if t1 > bound or math.gcd(r1, t1) != 1:
+        return None
+    return r1, t1
+
+
+def _swap_pivots(rows, column):
+    """
+    Для каждого модуля переставляет на место column строку с первым ненулевым элементом в этом столбце.
+
+    :param rows: Массив формы (количество модулей, строки, столбцы) – изменяется на месте.
+    :return: Пара (признаки "ведущий элемент найден", признаки "строки переставлены").
+    """
+
+    mask = rows[:, column:, column] != 0
+    found = mask.any(axis=1)
+    pivot_rows = mask.argmax(axis=1) + column
+    swapped = pivot_rows != column
+    if swapped.any():
+        indices = np.arange(len(rows))
+        pivot = rows[indices, pivot_rows].copy()
+        rows[indices, pivot_rows] = rows[:, column]
+        rows[:, column] = pivot
+    return found, swapped
+
+
+def _determinant_mod(values, moduli, size):
+    """
+    Определители матрицы по простым модулям (по всем модулям сразу).
+    Исключение ведется без деления: строка i заменяется на pivot * row_i - factor * row_pivot, поэтому на шаге c
+    определитель умножается на pivot_c^(size - c - 1). Этот множитель равен произведению префиксных произведений
+    ведущих элементов и обращается один раз в конце – вместо обращения ведущего элемента на каждом шаге.
+
+    :param values: Массив формы (количество модулей, size * size) – элементы матрицы по строкам.
+    :param moduli: Массив простых модулей.
+    :return: Пара (массив определителей формы (количество модулей, 1), признаки вырожденности – все False).
+    """
+
+    rows = values.reshape(len(moduli), size, size).copy()
+    column_moduli = moduli[:, None, None]
+    sign = np.ones(len(moduli), dtype=np.int64)
+    diagonal = np.ones(len(moduli), dtype=np.int64)
+    prefix = np.ones(len(moduli), dtype=np.int64)
+    scale = np.ones(len(moduli), dtype=np.int64)
+    for column in range(size):
+        found, swapped = _swap_pivots(rows, column)
+        sign = np.where(swapped, -sign, sign)
+        pivot = np.where(found, rows[:, column, column], 0)
+        diagonal = diagonal * pivot % moduli
+        if column == size - 1:
+            break
+        prefix = prefix * pivot % moduli
+        scale = scale * prefix % moduli
+        rows[:, column + 1:, column:] = (rows[:, column + 1:, column:] * pivot[:, None, None]
+                                         - rows[:, column + 1:, column, None] * rows[:, None, column, column:]) \
+            % column_moduli
+    determinant = diagonal * _inverse(scale, moduli) % moduli
+    return np.where(sign < 0, (moduli - determinant) % moduli, determinant)[:, None], np.zeros(len(moduli), dtype=bool)
+
+
+def _solve_mod(values, moduli, size, width):
+    """
+    Решения системы A X = B по простым модулям (метод Гаусса – Жордана, по всем модулям сразу).
+    Исключение ведется без деления (см. _determinant_mod): в конце левая часть диагональна, и строки делятся
+    на диагональные элементы одним векторным обращением.
+
+    :param values: Массив формы (количество модулей, size * (size + width)) – расширенная матрица (A | B) по строкам.
+    :param moduli: Массив простых модулей.
+    :return: Пара (массив элементов X по строкам, признаки вырожденности A по модулю).
+    """
+
+    rows = values.reshape(len(moduli), size, size + width).copy()
+    column_moduli = moduli[:, None, None]
+    singular = np.zeros(len(moduli), dtype=bool)
+    for column in range(size):
+        found, _ = _swap_pivots(rows, column)
+        singular |= ~found
+        factors = rows[:, :, column].copy()
+        multipliers = np.repeat(rows[:, column, column, None], size, axis=1)
+        factors[:, column] = 0
+        multipliers[:, column] = 1
+        rows = (rows * multipliers[:, :, None] - factors[:, :, None] * rows[:, None, column, :]) % column_moduli
+    diagonal = rows[:, np.arange(size), np.arange(size)]
+    inverse = _inverse(diagonal, moduli[:, None])
+    solution = rows[:, :, size:] * inverse[:, :, None] % column_moduli
+    return solution.reshape(len(moduli), -1), singular
+
+
+def _prod_mod(values, moduli):
+    """
+    Произведения чисел по простым модулям (попарное перемножение половин, по всем модулям сразу).
+    """
+
+    moduli = moduli[:, None]
+    while values.shape[1] > 1:
+        half = values.shape[1] // 2
+        product = values[:, :half] * values[:, half:2 * half] % moduli
+        values = np.concatenate([product, values[:, 2 * half:]], axis=1)
+    if values.shape[1] == 0:
+        return np.ones((len(moduli), 1), dtype=np.int64), np.zeros(len(moduli), dtype=bool)
+    return values, np.zeros(len(moduli), dtype=bool)
+
+
+def _solve_primes(task, fractions, is_complex, arguments, primes):
+    """
+    Выполняет вычисление по простым модулям (функция уровня модуля – выполняется и в процессах пула).
+    Все модули обрабатываются одновременно: вычеты хранятся в массивах numpy.int64, где модули – первое измерение,
+    поэтому каждый шаг исключения – несколько векторных операций вместо цикла по элементам.
+
+    Комплексное число a + bi по модулю p = 1 (mod 4) отображается в пару вычетов (a + bs, a - bs), s^2 = -1:
+    кольцо Z_p[i] распадается в произведение двух полей, поэтому одна комплексная задача сводится к двум задачам
+    с обычными вычетами, а части ответа восстанавливаются как a = (u + v) / 2, b = (u - v) / (2s).
+
+    :param task: Функция вычисления: (массив вычетов, массив модулей, *arguments) ->
+        (массив вычетов ответа, признаки вырожденности).
+    :param fractions: Входные данные – список пар (числитель, знаменатель); для комплексной задачи –
+        чередующиеся действительные и мнимые части.
+    :param is_complex: Есть ли среди входных данных комплексные числа.
+    :param arguments: Дополнительные аргументы task.
+    :param primes: Список простых модулей.
+    :return: Список результатов по модулям: списки вычетов (для комплексного ответа – чередующиеся
+        действительные и мнимые части), _UNLUCKY или _SINGULAR.
+    """
+
+    moduli = np.array(primes, dtype=np.int64)
+    residues, unlucky = _residues(fractions, primes)
+    if not is_complex:
+        results, singular = task(residues, moduli, *arguments)
+    else:
+        roots = np.array([_sqrt_minus_one(prime) for prime in primes], dtype=np.int64)
+        real, imaginary = residues[:, ::2], residues[:, 1::2] * roots[:, None] % moduli[:, None]
+        images = np.concatenate([(real + imaginary) % moduli[:, None], (real - imaginary) % moduli[:, None]])
+        images, singular = task(images, np.concatenate([moduli, moduli]), *arguments)
+        count = len(primes)
+        u, v = images[:count], images[count:]
+        singular = singular[:count] | singular[count:]
+        half = (moduli + 1) // 2
+        inverse = _inverse(2 * roots % moduli, moduli)
+        results = np.empty((count, 2 * u.shape[1]), dtype=np.int64)
+        results[:, ::2] = (u + v) * half[:, None] % moduli[:, None]
+        results[:, 1::2] = (u - v) * inverse[:, None] % moduli[:, None]
+    return [_UNLUCKY if unlucky[index] else _SINGULAR if singular[index] else results[index].tolist()
+            for index in range(len(primes))]
+
+
+def _matches(candidate, residues, prime):
+    return all((numerator - residue * denominator) % prime == 0
+               for (numerator, denominator), residue in zip(candidate, residues))
+
+
+def _reconstruct(residues, modulus):
+    """
+    Восстанавливает дроби по всем вычетам (сначала пробует первый вычет, чтобы не тратить время впустую).
+
+    :return: Список пар (числитель, знаменатель) или None.
+    """
+
+    if rational_reconstruction(residues[0], modulus) is None:
+        return None
+    candidate = []
+    for residue in residues:
+        fraction = rational_reconstruction(residue, modulus)
+        if fraction is None:
+            return None
+        candidate.append(fraction)
+    return candidate
+
+
+def _multimodular(task, items, is_complex, arguments=(), workers=None, executor=None, singular_check=None):
+    """
+    Многомодульное вычисление: задача решается по нескольким простым модулям (в пуле процессов – параллельно),
+    вычеты объединяются по китайской теореме об остатках, а ответ восстанавливается как дробь (rational_reconstruction).
+
+    Вычисление заканчивается досрочно: как только по накопленному модулю восстанавливаются все дроби,
+    они проверяются по следующему, еще не использованному модулю; при совпадении ответ возвращается
+    (вероятность ошибочного ответа – порядка 2^-30 на проверку), иначе модуль добавляется и вычисление продолжается.
+    Восстановление пробуется при росте количества модулей на четверть, поэтому его стоимость не преобладает.
+
+    :param task: Функция вычисления по модулю (см. _solve_primes).
+    :param items: Входные данные в компактном представлении (см. parallel._pack_all).
+    :param is_complex: Есть ли среди входных данных комплексные числа.
+    :param arguments: Дополнительные аргументы task.
+    :param workers: Количество процессов пула (по умолчанию – количество процессоров).
+    :param executor: Пул процессов или None (вычисление в текущем процессе).
+    :param singular_check: Функция без аргументов, точно проверяющая вырожденность задачи; вызывается один раз,
+        когда _SINGULAR_LIMIT модулей оказались вырожденными. Если она возвращает True, выбрасывается ValueError,
+        иначе вырожденные модули пропускаются.
+    :return: Список пар (числитель, знаменатель); для комплексного ответа – чередующиеся действительные и мнимые части.
+    """
+
+    if workers is not None and workers < 1:
+        raise ValueError("workers should be at least 1.")
+    if is_complex:
+        fractions = [part for item in items
+                     for part in ((item[0], item[1]), (item[2], item[3]) if len(item) == 4 else (0, 1))]
+    else:
+        fractions = items
+    if executor is None:
+        workers = 1
+    else:
+        workers = workers or os.cpu_count() or 1
+    batch = _FIRST_BATCH
+    primes = _primes()
+    residues, modulus = None, 1
+    candidate = None
+    used, next_attempt = 0, 1
+    singular = 0
+    while True:
+        chunk = list(itertools.islice(primes, batch * workers))
+        if executor is None:
+            results = _solve_primes(task, fractions, is_complex, arguments, chunk)
+        else:
+            tasks = [chunk[start:start + batch] for start in range(0, len(chunk), batch)]
+            parts = executor.map(_solve_primes, itertools.repeat(task), itertools.repeat(fractions),
+                                 itertools.repeat(is_complex), itertools.repeat(arguments), tasks)
+            results = [result for part in parts for result in part]
+        batch = min(2 * batch, _MAX_BATCH)
+        for prime, result in zip(chunk, results):
+            if result is _UNLUCKY:
+                continue
+            if result is _SINGULAR:
+                singular += 1
+                if singular == _SINGULAR_LIMIT and singular_check is not None and singular_check():
+                    raise ValueError("Matrix is singular.")
+                continue
+            if candidate is not None:
+                if _matches(candidate, result, prime):
+                    return candidate
+                candidate = None
+            residues, modulus = _crt_step(residues, modulus, result, prime)
+            used += 1
+            if used >= next_attempt:
+                next_attempt = used + max(1, used // 4)
+                candidate = _reconstruct(residues, modulus)
+
+
+def _to_numbers(fractions, is_complex):
+    """
+    Числа Rational (или Complex) из восстановленных дробей (с учетом текущего контекста арифметики).
+    """
+
+    values = [Rational._from_coprime(numerator, denominator) for numerator, denominator in fractions]
+    if not is_complex:
+        return values
+    return [Complex._from_parts(real, imaginary) for real, imaginary in zip(values[::2], values[1::2])]
+
+
+def _matrix_items(matrix):
+    return _pack_all(value for row in matrix.rows() for value in row)
+
+
+def modular_determinant(matrix, workers=None, executor=None):
+    """
+    Определитель квадратной матрицы многомодульным методом: вычисление ведется по простым модулям
+    длиной в машинное слово, и промежуточные значения не растут, а число простых модулей определяется
+    размером ответа (а не размером промежуточных миноров, как в Matrix.determinant).
+
+    :param matrix: Квадратная матрица типа Matrix.
+    :param workers: Количество процессов (при переданном пуле; по умолчанию – количество процессоров).
+    :param executor: Пул процессов для параллельного вычисления по разным модулям (по умолчанию – в текущем процессе).
+    :return: Определитель – число типа Rational (или Complex для комплексной матрицы).
+    """
+
+    size, columns = matrix.shape
+    if size != columns:
+        raise ValueError("Determinant is defined only for square matrices.")
+    items, is_complex = _matrix_items(matrix)
+    fractions = _multimodular(_determinant_mod, items, is_complex, (size,), workers, executor)
+    return _to_numbers(fractions, is_complex)[0]
+
+
+def modular_solve(matrix, right_side, workers=None, executor=None):
+    """
+    Решение системы линейных уравнений A x = b с невырожденной квадратной матрицей A многомодульным методом
+    (см. modular_determinant). Результат совпадает с Matrix.solve.
+
+    :param matrix: Квадратная матрица A типа Matrix.
+    :param right_side: Правая часть – последовательность чисел (вектор) или матрица типа Matrix.
+    :param workers: Количество процессов (при переданном пуле).
+    :param executor: Пул процессов для параллельного вычисления по разным модулям.
+    :return: Решение – список чисел для вектора или матрица типа Matrix для матрицы.
+    """
+
+    size, columns = matrix.shape
+    if size != columns:
+        raise ValueError("Only square systems can be solved.")
+    is_vector = not isinstance(right_side, Matrix)
+    if is_vector:
+        right_side = Matrix([[value] for value in right_side])
+    if right_side.shape[0] != size:
+        raise ValueError("Right side must have as many rows as the matrix.")
+    width = right_side.shape[1]
+    augmented = Matrix([left + right for left, right in zip(matrix.rows(), right_side.rows())])
+    items, is_complex = _matrix_items(augmented)
+    fractions = _multimodular(_solve_mod, items, is_complex, (size, width), workers, executor,
+                              singular_check=lambda: matrix.rank() < size)
+    values = _to_numbers(fractions, is_complex)
+    solution = [values[i * width:(i + 1) * width] for i in range(size)]
+    if is_vector:
+        return [row[0] for row in solution]
+    return Matrix(solution)
+
+
+def modular_prod(values, workers=None, executor=None):
+    """
+    Произведение последовательности чисел (Rational, Complex, int) многомодульным методом.
+    Для комплексных чисел каждое умножение по модулю – два умножения машинных слов (см. _solve_primes).
+
+    :param values: Последовательность (или итератор) чисел.
+    :param workers: Количество процессов (при переданном пуле).
+    :param executor: Пул процессов для параллельного вычисления по разным модулям.
+    :return: Число типа Rational (или Complex, если среди чисел есть комплексные) – произведение чисел.
+    """
+
+    items, is_complex = _pack_all(values)
+    fractions = _multimodular(_prod_mod, items, is_complex, (), workers, executor)
+    return _to_numbers(fractions, is_complex)[0]
@@ -0,0 +1,237 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from rational import Rational, getcontext, localcontext, _tree_reduce, _add_fractions, _multiply_fractions
+from complex import Complex, _add_triples, _multiply_triples, _from_triple
+
+# Последовательности короче этой границы без явно переданного пула процессов обрабатываются в текущем процессе:
+# запуск процессов и передача данных обходятся дороже самих вычислений
+_SERIAL_LIMIT = 4096
+
+# Количество частей (шардов) на один процесс: позволяет выровнять нагрузку при разной длине чисел
+_SHARDS_PER_WORKER = 4
+
+
+def _pack(value):
+    """
+    Компактное представление числа для передачи между процессами – кортеж целых чисел:
+    (числитель, знаменатель) для Rational,
+    (числитель, знаменатель действительной части, числитель, знаменатель мнимой части) для Complex.
+    Остальные значения (например, результаты map) передаются как есть в кортеже из одного элемента.
+    """
+
+    if isinstance(value, Rational):
+        return value.numerator, value.denominator
+    if isinstance(value, Complex):
+        real, imaginary = value.real, value.imaginary
+        return real.numerator, real.denominator, imaginary.numerator, imaginary.denominator
+    return value,
+
+
+def _unpack(item):
+    """
+    Восстанавливает число из компактного представления (см. _pack) без повторного сокращения дробей.
+    """
+
+    if len(item) == 2:
+        return Rational._from_normalized(item[0], item[1])
+    if len(item) == 4:
+        return Complex._from_parts(Rational._from_normalized(item[0], item[1]),
+                                   Rational._from_normalized(item[2], item[3]))
+    return item[0]
+
+
+def _pack_all(values):
+    """
+    Переводит последовательность чисел в компактное представление (целые числа – в дроби со знаменателем 1).
+
+    :return: Кортеж (список кортежей целых чисел, есть ли среди чисел комплексные).
+    """
+
+    items = []
+    is_complex = False
+    for value in values:
+        if isinstance(value, int):
+            item = value, 1
+        elif isinstance(value, (Rational, Complex)):
+            item = _pack(value)
+        else:
+            raise TypeError("Only Rational, Complex and int values are supported.")
+        is_complex = is_complex or len(item) == 4
+        items.append(item)
+    return items, is_complex
+
+
+def _triple(item):
+    """
+    Несокращенная тройка (a, b, d) – число (a + bi) / d – из компактного представления числа.
+    """
+
+    if len(item) == 2:
+        return item[0], 0, item[1]
+    return item[0] * item[3], item[2] * item[1], item[1] * item[3]
+
+
+def _sum_shard(items, is_complex):
+    values = [_unpack(item) for item in items]
+    return _pack(Complex.sum(values) if is_complex else Rational.sum(values))
+
+
+def _prod_shard(items, is_complex):
+    values = [_unpack(item) for item in items]
+    return _pack(Complex.prod(values) if is_complex else Rational.prod(values))
+
+
+def _dot_shard(left, right, is_complex):
+    """
+    Скалярное произведение двух частей: произведения и их сумма не сокращаются, дробь сокращается один раз.
+    """
+
+    if is_complex:
+        result = _tree_reduce(map(_multiply_triples, map(_triple, left), map(_triple, right)), _add_triples)
+        return _pack(_from_triple(result)) if result is not None else (0, 1)
+    result = _tree_reduce(map(_multiply_fractions, left, right), _add_fractions)
+    return Rational.reducedfraction(*result) if result is not None else (0, 1)
+
+
+def _map_shard(function, items):
+    return [_pack(function(_unpack(item))) for item in items]
+
+
+def _in_context(context, function, *arguments):
+    """
+    Выполняет функцию в контексте арифметики вызывающего процесса (процессы пула его не наследуют).
+    """
+
+    with localcontext(context):
+        return function(*arguments)
+
+
+def _shards(items, workers):
+    """
+    Делит список на части примерно одинаковой длины (по _SHARDS_PER_WORKER частей на процесс).
+    """
+
+    size = max(1, -(-len(items) // (workers * _SHARDS_PER_WORKER)))
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def _run(function, arguments, size, executor, workers):
+    """
+    Выполняет функцию для каждого набора аргументов: в переданном пуле процессов, в новом пуле
+    или, для коротких последовательностей и одного процесса, в текущем процессе.
+    Процессы пула выполняют функцию в текущем контексте арифметики (см. rational.localcontext).
+
+    :param function: Функция уровня модуля (передается в процессы по имени).
+    :param arguments: Список кортежей аргументов (по одному на часть).
+    :param size: Общее количество элементов.
+    :param executor: Пул процессов (concurrent.futures.Executor) или None.
+    :param workers: Количество процессов нового пула.
+    :return: Список результатов в порядке частей.
+    """
+
+    if not arguments or executor is None and (workers == 1 or size < _SERIAL_LIMIT):
+        return [function(*argument) for argument in arguments]
+    columns = itertools.repeat(getcontext()), itertools.repeat(function), *zip(*arguments)
+    if executor is not None:
+        return list(executor.map(_in_context, *columns))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_in_context, *columns))
+
+
+def _workers(workers):
+    """
+    Количество процессов: заданное или, по умолчанию, количество процессоров.
+    """
+
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers should be at least 1.")
+    return workers
+
+
+def parallel_sum(values, workers=None, executor=None):
+    """
+    Параллельное суммирование последовательности чисел (Rational, Complex, int).
+    Последовательность делится на части, которые передаются процессам в виде кортежей целых чисел;
+    каждый процесс суммирует свою часть (Rational.sum или Complex.sum), а частичные суммы
+    объединяются по сбалансированному дереву с одним сокращением дроби в конце.
+
+    :param values: Последовательность (или итератор) чисел.
+    :param workers: Количество процессов (по умолчанию – количество процессоров);
+        при переданном пуле определяет количество частей.
+    :param executor: Пул процессов, который нужно использовать (по умолчанию создается новый).
+    :return: Число типа Rational (или Complex, если среди чисел есть комплексные) – сумма чисел.
+    """
+
+    items, is_complex = _pack_all(values)
+    workers = _workers(workers)
+    partials = _run(_sum_shard, [(shard, is_complex) for shard in _shards(items, workers)],
+                    len(items), executor, workers)
+    values = [_unpack(item) for item in partials]
+    return Complex.sum(values) if is_complex else Rational.sum(values)
+
+
+def parallel_prod(values, workers=None, executor=None):
+    """
+    Параллельное перемножение последовательности чисел (Rational, Complex, int) – см. parallel_sum.
+
+    :param values: Последовательность (или итератор) чисел.
+    :param workers: Количество процессов (по умолчанию – количество процессоров).
+    :param executor: Пул процессов, который нужно использовать (по умолчанию создается новый).
+    :return: Число типа Rational (или Complex, если среди чисел есть комплексные) – произведение чисел.
+    """
+
+    items, is_complex = _pack_all(values)
+    workers = _workers(workers)
+    partials = _run(_prod_shard, [(shard, is_complex) for shard in _shards(items, workers)],
+                    len(items), executor, workers)
+    values = [_unpack(item) for item in partials]
+    return Complex.prod(values) if is_complex else Rational.prod(values)
+
+
+def parallel_dot(left, right, workers=None, executor=None):
+    """
+    Параллельное скалярное произведение двух последовательностей одинаковой длины: sum(left[i] * right[i])
+    (комплексные числа не сопрягаются).
+    Внутри каждой части произведения и их сумма вычисляются без промежуточных сокращений.
+
+    :param left: Первая последовательность чисел.
+    :param right: Вторая последовательность чисел.
+    :param workers: Количество процессов (по умолчанию – количество процессоров).
+    :param executor: Пул процессов, который нужно использовать (по умолчанию создается новый).
+    :return: Число типа Rational (или Complex, если среди чисел есть комплексные).
+    """
+
+    left_items, left_complex = _pack_all(left)
+    right_items, right_complex = _pack_all(right)
+    if len(left_items) != len(right_items):
+        raise ValueError("Sequences should have the same length.")
+    is_complex = left_complex or right_complex
+    workers = _workers(workers)
+    arguments = [(left_shard, right_shard, is_complex)
+                 for left_shard, right_shard in zip(_shards(left_items, workers), _shards(right_items, workers))]
+    partials = _run(_dot_shard, arguments, len(left_items), executor, workers)
+    values = [_unpack(item) for item in partials]
+    return Complex.sum(values) if is_complex else Rational.sum(values)
+
+
+def parallel_map(function, values, workers=None, executor=None):
+    """
+    Параллельное применение функции к каждому числу последовательности.
+    Функция должна быть определена на уровне модуля (процессам она передается по имени).
+    Результаты типов Rational и Complex передаются в компактном представлении, остальные – как есть.
+
+    :param function: Функция одного аргумента.
+    :param values: Последовательность (или итератор) чисел.
+    :param workers: Количество процессов (по умолчанию – количество процессоров).
+    :param executor: Пул процессов, который нужно использовать (по умолчанию создается новый).
+    :return: Список результатов в исходном порядке.
+    """
+
+    items, _ = _pack_all(values)
+    workers = _workers(workers)
+    results = _run(_map_shard, [(function, shard) for shard in _shards(items, workers)],
+                   len(items), executor, workers)
+    return [_unpack(item) for shard in results for item in shard]
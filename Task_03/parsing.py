@@ -0,0 +1,144 @@
+import functools
+import re
+from rational import Rational
+from complex import Complex
+
+# Дробь "a/b" (как в Rational.__str__) или десятичная запись "2.3333", "-.5", "1.5e-3"
+_RATIONAL = re.compile(r"\s*([+-]?)(?:(\d+)/(\d+)|(\d*)(?:\.(\d*))?(?:[eE]([+-]?\d+))?)\s*")
+
+# Запись "(a/b) + (c/d)i" (как в Complex.__str__)
+_COMPLEX = re.compile(r"\s*\(([^()]*)\)\s*\+\s*\(([^()]*)\)i\s*")
+
+# Строки цифр не длиннее этой границы переводятся в int встроенной функцией,
+# более длинные – делением пополам (см. _digits_to_int)
+_DIGITS_CHUNK = 1000
+
+# Наибольший допустимый по модулю десятичный порядок (как Emax контекста decimal по умолчанию):
+# больший порядок, например "1e999999999", потребовал бы построения огромной степени десяти
+_MAX_EXPONENT = 999999
+
+# Размер блока потокового чтения по умолчанию (в символах)
+_CHUNK_SIZE = 1 << 16
+
+
+@functools.lru_cache(maxsize=64)
+def _power_of_ten(exponent):
+    return 10 ** exponent
+
+
+def _digits_to_int(digits):
+    """
+    Переводит строку десятичных цифр в целое число.
+    Встроенный int(str) работает за квадратичное время и ограничен sys.get_int_max_str_digits(),
+    поэтому длинная строка делится пополам: int(старшая половина) * 10^k + int(младшая половина),
+    степени десяти кэшируются.
+
+    :param digits: Строка десятичных цифр.
+    :return: Число типа int.
+    """
+
+    if len(digits) <= _DIGITS_CHUNK:
+        return int(digits)
+    # Длина младшей половины округляется до степени двойки, чтобы степени десяти повторялись
+    low_length = _DIGITS_CHUNK
+    while low_length * 2 < len(digits):
+        low_length *= 2
+    return _digits_to_int(digits[:-low_length]) * _power_of_ten(low_length) + _digits_to_int(digits[-low_length:])
+
+
+def parse_rational(text):
+    """
+    Разбирает рациональное число из строки без промежуточного перевода в float.
+
+    Поддерживаемые форматы:
+        "a/b" и "a" (формат Rational.__str__), например "-7/3";
+        десятичная запись, в том числе с порядком, например "2.3333", "-.5", "1.5e-3" – переводится точно:
+        "2.3333" = 23333/10000.
+
+    :param text: Строка с числом (пробелы в начале и в конце допускаются).
+    :return: Число типа Rational.
+    :raises ValueError: Если строка не является записью числа или порядок по модулю больше _MAX_EXPONENT.
+    """
+
+    match = _RATIONAL.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Invalid rational number: {text!r}")
+    sign, numerator, denominator, whole, fraction, exponent = match.groups()
+    if numerator is not None:
+        numerator = _digits_to_int(numerator)
+        denominator = _digits_to_int(denominator)
+        if denominator == 0:
+            raise ValueError(f"Invalid rational number: {text!r}")
+    else:
+        fraction = fraction or ""
+        if not whole and not fraction:
+            raise ValueError(f"Invalid rational number: {text!r}")
+        exponent = int(exponent) if exponent else 0
+        if abs(exponent) > _MAX_EXPONENT:
+            raise ValueError(f"Exponent is out of range [-{_MAX_EXPONENT}, {_MAX_EXPONENT}]: {text!r}")
+        numerator = _digits_to_int(whole + fraction)
+        shift = exponent - len(fraction)
+        if shift >= 0:
+            numerator *= 10 ** shift
+            denominator = 1
+        else:
+            denominator = 10 ** -shift
+    if sign == "-":
+        numerator = -numerator
+    return Rational(numerator, denominator)
+
+
+def parse_complex(text):
+    """
+    Разбирает комплексное число из строки формата Complex.__str__ – "(a/b) + (c/d)i".
+    Коэффициенты разбираются функцией parse_rational (допускается и десятичная запись).
+    Строка без мнимой части разбирается как рациональное число с нулевой мнимой частью.
+
+    :param text: Строка с числом.
+    :return: Число типа Complex.
+    """
+
+    match = _COMPLEX.fullmatch(text)
+    if match is None:
+        return Complex._from_parts(parse_rational(text), Rational.interned(0))
+    return Complex._from_parts(parse_rational(match.group(1)), parse_rational(match.group(2)))
+
+
+def parse(text):
+    """
+    Разбирает рациональное или комплексное число из строки (см. parse_rational и parse_complex).
+
+    :param text: Строка с числом.
+    :return: Число типа Complex, если строка в формате "(a/b) + (c/d)i", иначе число типа Rational.
+    """
+
+    if "(" in text:
+        return parse_complex(text)
+    return parse_rational(text)
+
+
+def read_values(stream, chunk_size=_CHUNK_SIZE):
+    """
+    Генератор, читающий числа из текстового потока (по одному числу в строке, пустые строки пропускаются).
+    Поток читается блоками фиксированного размера, поэтому файл любого размера не загружается в память целиком,
+    а строка, разрезанная границей блока, дописывается следующим блоком.
+
+    :param stream: Поток с методом read (текстовый или двоичный в кодировке ASCII).
+    :param chunk_size: Размер блока чтения.
+    :return: Генератор чисел типа Rational и Complex.
+    """
+
+    tail = ""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        if isinstance(chunk, bytes):
+            chunk = chunk.decode("ascii")
+        lines = (tail + chunk).split("\n")
+        tail = lines.pop()
+        for line in lines:
+            if line and not line.isspace():
+                yield parse(line)
+    if tail and not tail.isspace():
+        yield parse(tail)
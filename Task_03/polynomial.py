@@ -0,0 +1,467 @@
+import math
+import numpy as np
+from rational import Rational
+from complex import Complex
+from rational_array import RationalArray
+from complex_array import ComplexArray
+from convolution import _integer_convolve, _gaussian_convolve
+
+
+def _add_lists(left, right):
+    if len(left) < len(right):
+        left, right = right, left
+    result = list(left)
+    for i, value in enumerate(right):
+        result[i] += value
+    return result
+
+
+def _max_bits(values):
+    """
+    Длина в битах наибольшего по модулю значения списка или столбца np.ndarray.
+    """
+
+    if len(values) == 0:
+        return 0
+    if isinstance(values, np.ndarray):
+        return max(int(values.max()), -int(values.min())).bit_length()
+    return max(abs(value) for value in values).bit_length()
+
+
+class Polynomial:
+    """
+    Класс многочленов с рациональными (Rational) или комплексными (Complex) коэффициентами.
+
+    Коэффициенты хранятся как целые числители (отдельно действительные и мнимые части)
+    над общим натуральным знаменателем, поэтому вычисление значения схемой Горнера,
+    умножение и деление многочленов выполняются в целых числах, а сокращение дроби – один раз в конце.
+    Коэффициенты перечисляются от младшей степени к старшей.
+    """
+
+    def __init__(self, coefficients=()):
+        """
+        Метод инициализации объекта класса Polynomial (многочлена).
+
+        :param coefficients: Последовательность коэффициентов (Rational, Complex, int или float)
+            от свободного члена к старшей степени.
+        """
+
+        real = []
+        imaginary = []
+        is_complex = False
+        for value in coefficients:
+            if isinstance(value, Complex):
+                real.append(value.real)
+                imaginary.append(value.imaginary)
+                is_complex = True
+            else:
+                real.append(value if isinstance(value, Rational) else Rational(value))
+                imaginary.append(Rational.interned(0))
+
+        parts = real + imaginary if is_complex else real
+        denominator = math.lcm(*(part.denominator for part in parts)) if parts else 1
+        self._set(
+            [part.numerator * (denominator // part.denominator) for part in real],
+            [part.numerator * (denominator // part.denominator) for part in imaginary] if is_complex else None,
+            denominator)
+
+    @classmethod
+    def _from_integers(cls, real, imaginary, denominator):
+        """
+        Внутренний метод создания многочлена из целых числителей и общего знаменателя.
+        """
+
+        polynomial = cls.__new__(cls)
+        polynomial._set(list(real), list(imaginary) if imaginary is not None else None, denominator)
+        return polynomial
+
+    def _set(self, real, imaginary, denominator):
+        """
+        Внутренний метод нормализации: удаляет нулевые старшие коэффициенты, делает знаменатель положительным
+        и сокращает все числители и знаменатель на их общий НОД.
+        """
+
+        if denominator == 0:
+            raise ZeroDivisionError("Cannot divide by zero.")
+        if imaginary is not None:
+            if len(imaginary) < len(real):
+                imaginary = imaginary + [0] * (len(real) - len(imaginary))
+            elif len(real) < len(imaginary):
+                real = real + [0] * (len(imaginary) - len(real))
+            while real and real[-1] == 0 and imaginary[-1] == 0:
+                real.pop()
+                imaginary.pop()
+            if not any(imaginary):
+                imaginary = None
+        else:
+            while real and real[-1] == 0:
+                real.pop()
+        if denominator < 0:
+            real = [-value for value in real]
+            imaginary = [-value for value in imaginary] if imaginary is not None else None
+            denominator = -denominator
+
+        gcd_value = math.gcd(denominator, *real, *(imaginary or ()))
+        if gcd_value > 1:
+            real = [value // gcd_value for value in real]
+            imaginary = [value // gcd_value for value in imaginary] if imaginary is not None else None
+            denominator //= gcd_value
+        self._real = real
+        self._imaginary = imaginary
+        self._denominator = denominator
+
+    @property
+    def degree(self):
+        """
+        Степень многочлена (-1 для нулевого многочлена).
+        """
+
+        return len(self._real) - 1
+
+    @property
+    def is_complex(self):
+        return self._imaginary is not None
+
+    def coefficients(self):
+        """
+        Метод получения коэффициентов многочлена.
+
+        :return: Список коэффициентов (Rational или Complex) от свободного члена к старшей степени.
+        """
+
+        if self._imaginary is None:
+            return [Rational(value, self._denominator) for value in self._real]
+        return [Complex._from_parts(Rational(real, self._denominator), Rational(imaginary, self._denominator))
+                for real, imaginary in zip(self._real, self._imaginary)]
+
+    def _parts(self):
+        """
+        Внутренний метод получения пары списков числителей (мнимые части заполняются нулями).
+        """
+
+        return self._real, self._imaginary if self._imaginary is not None else [0] * len(self._real)
+
+    @staticmethod
+    def _coerce(other):
+        if isinstance(other, Polynomial):
+            return other
+        if isinstance(other, (Rational, Complex, int)):
+            return Polynomial([other])
+        return NotImplemented
+
+    def __call__(self, point):
+        """
+        Оператор вычисления значения многочлена в точке (см. метод evaluate).
+        """
+
+        return self.evaluate(point)
+
+    def evaluate(self, point):
+        """
+        Метод вычисления значения многочлена в точке по схеме Горнера.
+        Точка x = p / q обрабатывается в однородной форме: a_n p^n + a_(n-1) p^(n-1) q + ... + a_0 q^n,
+        поэтому все промежуточные вычисления целочисленные, а дробь сокращается один раз.
+
+        :param point: Точка – число типа Rational, Complex, int или float.
+        :return: Значение многочлена – число типа Rational (или Complex для комплексного многочлена или точки).
+        """
+
+        if isinstance(point, Complex):
+            denominator = math.lcm(point.real.denominator, point.imaginary.denominator)
+            point_real = point.real.numerator * (denominator // point.real.denominator)
+            point_imaginary = point.imaginary.numerator * (denominator // point.imaginary.denominator)
+        else:
+            if not isinstance(point, Rational):
+                point = Rational(point)
+            point_real, point_imaginary, denominator = point.numerator, 0, point.denominator
+        is_complex = self._imaginary is not None or isinstance(point, Complex)
+
+        if not self._real:
+            result = Rational.interned(0)
+            return Complex.to_complex(result) if is_complex else result
+
+        power = 1
+        if not is_complex:
+            accumulator = self._real[-1]
+            for coefficient in reversed(self._real[:-1]):
+                power *= denominator
+                accumulator = accumulator * point_real + coefficient * power
+            return Rational(accumulator, self._denominator * power)
+
+        real, imaginary = self._parts()
+        accumulator_real, accumulator_imaginary = real[-1], imaginary[-1]
+        for k in range(len(real) - 2, -1, -1):
+            power *= denominator
+            accumulator_real, accumulator_imaginary = (
+                accumulator_real * point_real - accumulator_imaginary * point_imaginary + real[k] * power,
+                accumulator_real * point_imaginary + accumulator_imaginary * point_real + imaginary[k] * power)
+        return Complex._from_parts(Rational(accumulator_real, self._denominator * power),
+                                   Rational(accumulator_imaginary, self._denominator * power))
+
+    def evaluate_many(self, points):
+        """
+        Метод вычисления значений многочлена сразу во многих точках.
+        Схема Горнера в однородной форме выполняется векторизованно над столбцами числителей
+        и знаменателей всех точек; сокращение дробей – один раз в конце, векторизованным НОД.
+
+        :param points: Точки – RationalArray, ComplexArray или последовательность чисел (Rational, Complex, int).
+        :return: Значения – RationalArray (или ComplexArray для комплексного многочлена или точек).
+        """
+
+        if not isinstance(points, (RationalArray, ComplexArray)):
+            points = list(points)
+            if any(isinstance(point, Complex) for point in points):
+                points = ComplexArray(points)
+            else:
+                points = RationalArray(points)
+
+        if isinstance(points, ComplexArray):
+            real_denominators = points.real.denominators.astype(object)
+            imaginary_denominators = points.imaginary.denominators.astype(object)
+            denominators = np.lcm(real_denominators, imaginary_denominators)
+            point_real = points.real.numerators.astype(object) * (denominators // real_denominators)
+            point_imaginary = points.imaginary.numerators.astype(object) * (denominators // imaginary_denominators)
+        else:
+            denominators = points.denominators
+            point_real = points.numerators
+            point_imaginary = None
+        is_complex = self._imaginary is not None or point_imaginary is not None
+
+        # Если результат (числители и знаменатель self._denominator * power) заведомо помещается в int64,
+        # вычисления ведутся в int64, иначе – в длинной арифметике
+        degree = max(self.degree, 0)
+        point_bits = max(_max_bits(point_real), _max_bits(denominators),
+                         _max_bits(point_imaginary) if point_imaginary is not None else 0)
+        coefficient_bits = max(_max_bits(self._real), _max_bits(self._imaginary or ()), self._denominator.bit_length())
+        bits = coefficient_bits + degree * point_bits + degree.bit_length() + 2
+        dtype = np.int64 if bits <= 62 else object
+        point_real = point_real.astype(dtype)
+        denominators = denominators.astype(dtype)
+        size = len(denominators)
+
+        real, imaginary = self._parts()
+        if not real:
+            real, imaginary = [0], [0]
+        power = np.ones(size, dtype=dtype)
+        accumulator_real = np.full(size, real[-1], dtype=dtype)
+        if not is_complex:
+            for coefficient in reversed(real[:-1]):
+                power = power * denominators
+                accumulator_real = accumulator_real * point_real + coefficient * power
+            return RationalArray.from_columns(accumulator_real, self._denominator * power)
+
+        if point_imaginary is None:
+            point_imaginary = np.zeros(size, dtype=dtype)
+        point_imaginary = point_imaginary.astype(dtype)
+        accumulator_imaginary = np.full(size, imaginary[-1], dtype=dtype)
+        for k in range(len(real) - 2, -1, -1):
+            power = power * denominators
+            accumulator_real, accumulator_imaginary = (
+                accumulator_real * point_real - accumulator_imaginary * point_imaginary + real[k] * power,
+                accumulator_real * point_imaginary + accumulator_imaginary * point_real + imaginary[k] * power)
+        denominators = self._denominator * power
+        return ComplexArray.from_parts(RationalArray.from_columns(accumulator_real, denominators),
+                                       RationalArray.from_columns(accumulator_imaginary, denominators))
+
+    def __add__(self, other):
+        """
+        Оператор сложения многочлена с другим многочленом или числом (Rational, Complex, int).
+        """
+
+        other = Polynomial._coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return self._combine(other, 1)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        """
+        Оператор вычитания из многочлена другого многочлена или числа (Rational, Complex, int).
+        """
+
+        other = Polynomial._coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return self._combine(other, -1)
+
+    def __rsub__(self, other):
+        other = Polynomial._coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return other._combine(self, -1)
+
+    def _combine(self, other, sign):
+        """
+        Внутренний метод сложения (sign = 1) или вычитания (sign = -1) многочленов над общим знаменателем.
+        """
+
+        denominator = math.lcm(self._denominator, other._denominator)
+        left_scale = denominator // self._denominator
+        right_scale = sign * (denominator // other._denominator)
+        real = _add_lists([value * left_scale for value in self._real], [value * right_scale for value in other._real])
+        if self._imaginary is None and other._imaginary is None:
+            return Polynomial._from_integers(real, None, denominator)
+        left_imaginary, right_imaginary = self._parts()[1], other._parts()[1]
+        imaginary = _add_lists([value * left_scale for value in left_imaginary],
+                               [value * right_scale for value in right_imaginary])
+        return Polynomial._from_integers(real, imaginary, denominator)
+
+    def __mul__(self, other):
+        """
+        Оператор умножения многочлена на другой многочлен или число (Rational, Complex, int).
+        Числители перемножаются как многочлены с целыми коэффициентами (для длинных многочленов –
+        подстановкой Кронекера, см. convolution.convolve), знаменатели – как числа.
+        """
+
+        other = Polynomial._coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        if not self._real or not other._real:
+            return Polynomial()
+        denominator = self._denominator * other._denominator
+        if self._imaginary is None and other._imaginary is None:
+            return Polynomial._from_integers(_integer_convolve(self._real, other._real), None, denominator)
+        real, imaginary = _gaussian_convolve(*self._parts(), *other._parts())
+        return Polynomial._from_integers(real, imaginary, denominator)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __neg__(self):
+        return Polynomial._from_integers([-value for value in self._real],
+                                         [-value for value in self._imaginary] if self._imaginary is not None else None,
+                                         self._denominator)
+
+    def __divmod__(self, other):
+        """
+        Оператор деления многочлена на другой ненулевой многочлен с остатком.
+        Используется псевдоделение в целых числах: b^k A = Q B + R, где b – старший коэффициент делителя
+        (для комплексного делителя он предварительно делается вещественным умножением на сопряженное число).
+
+        :param other: Многочлен-делитель или число (Rational, Complex, int).
+        :return: Пара многочленов (частное, остаток).
+        """
+
+        other = Polynomial._coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        if not other._real:
+            raise ZeroDivisionError("Cannot divide by zero polynomial.")
+        if len(self._real) < len(other._real):
+            return Polynomial(), self
+
+        is_complex = self._imaginary is not None or other._imaginary is not None
+        a_real, a_imaginary = self._parts()
+        b_real, b_imaginary = other._parts()
+        lead_real, lead_imaginary = b_real[-1], b_imaginary[-1]
+        if lead_imaginary:
+            # Умножаем делимое и делитель на число, сопряженное старшему коэффициенту делителя
+            a_real, a_imaginary = (
+                [x * lead_real + y * lead_imaginary for x, y in zip(a_real, a_imaginary)],
+                [y * lead_real - x * lead_imaginary for x, y in zip(a_real, a_imaginary)])
+            b_real, b_imaginary = (
+                [x * lead_real + y * lead_imaginary for x, y in zip(b_real, b_imaginary)],
+                [y * lead_real - x * lead_imaginary for x, y in zip(b_real, b_imaginary)])
+        lead = b_real[-1]
+
+        n = len(b_real) - 1
+        steps = len(a_real) - n
+        quotient_real, quotient_imaginary = [0] * steps, [0] * steps
+        remainder_real, remainder_imaginary = list(a_real), list(a_imaginary)
+        for d in range(steps - 1, -1, -1):
+            c_real, c_imaginary = remainder_real[d + n], remainder_imaginary[d + n]
+            quotient_real = [value * lead for value in quotient_real]
+            quotient_imaginary = [value * lead for value in quotient_imaginary]
+            quotient_real[d] += c_real
+            quotient_imaginary[d] += c_imaginary
+            remainder_real = [value * lead for value in remainder_real]
+            remainder_imaginary = [value * lead for value in remainder_imaginary]
+            for j in range(n + 1):
+                remainder_real[d + j] -= c_real * b_real[j] - c_imaginary * b_imaginary[j]
+                remainder_imaginary[d + j] -= c_real * b_imaginary[j] + c_imaginary * b_real[j]
+
+        # lead^steps * A' = Q * B' + R  =>  A = (Q D_B / (lead^steps D_A)) B + R / (lead^steps D_A (conj. множитель))
+        scale = lead ** steps * self._denominator
+        quotient = Polynomial._from_integers([value * other._denominator for value in quotient_real],
+                                             [value * other._denominator for value in quotient_imaginary]
+                                             if is_complex else None, scale)
+        remainder_real, remainder_imaginary = remainder_real[:n], remainder_imaginary[:n]
+        if lead_imaginary:
+            # Остаток был умножен на сопряженное число: умножаем на само число и делим на квадрат модуля (= lead)
+            remainder_real, remainder_imaginary = (
+                [x * lead_real - y * lead_imaginary for x, y in zip(remainder_real, remainder_imaginary)],
+                [x * lead_imaginary + y * lead_real for x, y in zip(remainder_real, remainder_imaginary)])
+            scale *= lead
+        remainder = Polynomial._from_integers(remainder_real, remainder_imaginary if is_complex else None, scale)
+        return quotient, remainder
+
+    def __floordiv__(self, other):
+        result = self.__divmod__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        return result[0]
+
+    def __mod__(self, other):
+        result = self.__divmod__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        return result[1]
+
+    def derivative(self):
+        """
+        Метод вычисления производной многочлена.
+
+        :return: Многочлен типа Polynomial – производная.
+        """
+
+        return Polynomial._from_integers([k * value for k, value in enumerate(self._real)][1:],
+                                         [k * value for k, value in enumerate(self._imaginary)][1:]
+                                         if self._imaginary is not None else None,
+                                         self._denominator)
+
+    def __eq__(self, other):
+        """
+        Оператор проверки равенства многочлена с другим многочленом или числом.
+        """
+
+        other = Polynomial._coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return (self._real == other._real and self._imaginary == other._imaginary
+                and self._denominator == other._denominator)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        return not result
+
+    __hash__ = None
+
+    def __str__(self):
+        """
+        Оператор удобного представления многочлена в виде объекта типа str
+        в формате "(a_n)x^n + ... + (a_1)x + (a_0)" (нулевые коэффициенты пропускаются).
+        """
+
+        terms = []
+        for k, coefficient in reversed(list(enumerate(self.coefficients()))):
+            if coefficient == 0:
+                continue
+            if k == 0:
+                terms.append(f"({coefficient})")
+            elif k == 1:
+                terms.append(f"({coefficient})x")
+            else:
+                terms.append(f"({coefficient})x^{k}")
+        return " + ".join(terms) if terms else "0"
+
+    def __repr__(self):
+        """
+        Оператор формального представления многочлена в виде объекта типа str
+        в формате "Polynomial([коэффициенты])".
+        """
+
+        return "Polynomial([" + ", ".join(repr(coefficient) for coefficient in self.coefficients()) + "])"
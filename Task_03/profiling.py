@@ -0,0 +1,189 @@
+import contextlib
+import functools
+import sys
+from collections import Counter, defaultdict
+import rational
+from rational import Rational
+from complex import Complex
+
+# Операторы, для которых собирается гистограмма длин операндов
+_OPERATORS = ('__add__', '__radd__', '__sub__', '__rsub__', '__mul__', '__rmul__', '__truediv__', '__rtruediv__',
+              '__iadd__', '__isub__', '__imul__', '__itruediv__', '__neg__', '__eq__', '__lt__', '__le__',
+              '__gt__', '__ge__', '__pow__')
+
+# Активный профиль (профилирование не может быть вложенным)
+_active = None
+
+
+def _bits(value):
+    """
+    Длина числа в битах: для Rational – длина наибольшей из частей дроби, для Complex – наибольшей из четырех частей.
+
+    :param value: Операнд (Rational, Complex, int или значение другого типа).
+    :return: Длина в битах или None для значений других типов (например, float).
+    """
+
+    if isinstance(value, Rational):
+        return max(value.numerator.bit_length(), value.denominator.bit_length())
+    if isinstance(value, Complex):
+        return max(_bits(value.real), _bits(value.imaginary))
+    if isinstance(value, int):
+        return value.bit_length()
+    return None
+
+
+def _bucket(bits):
+    """
+    Интервал гистограммы для длины в битах: наименьшая степень двойки, не меньшая длины (0 для нуля).
+    """
+
+    return 1 << (bits - 1).bit_length() if bits else 0
+
+
+class ArithmeticProfile:
+    """
+    Счетчики, собранные за время работы profile_arithmetic().
+
+    Атрибуты:
+        constructions – количество созданных объектов по классам (Counter: "Rational", "Complex");
+        gcd_calls – количество вызовов gcd при сокращении дробей;
+        reductions – количество вызовов Rational.reducedfraction;
+        operations – количество вызовов каждого оператора (Counter: "Rational.__mul__" и т. п.);
+        operand_bits – гистограммы длин операндов по операторам: для каждого вызова учитывается длина
+            наибольшего операнда, округленная вверх до степени двойки (dict: оператор -> Counter);
+        call_sites – наибольшая длина операнда (в битах) для каждого места вызова оператора
+            ("файл:строка" -> длина); заполняется, только если профиль создан с track_call_sites=True.
+    """
+
+    def __init__(self, track_call_sites=False):
+        self.track_call_sites = track_call_sites
+        self.constructions = Counter()
+        self.gcd_calls = 0
+        self.reductions = 0
+        self.operations = Counter()
+        self.operand_bits = defaultdict(Counter)
+        self.call_sites = {}
+
+    def _record(self, name, bits):
+        self.operations[name] += 1
+        self.operand_bits[name][_bucket(bits)] += 1
+        if self.track_call_sites:
+            # Кадр 2 – код, вызвавший оператор (кадр 1 – обертка)
+            frame = sys._getframe(2)
+            site = f"{frame.f_code.co_filename}:{frame.f_lineno} ({name})"
+            if bits > self.call_sites.get(site, -1):
+                self.call_sites[site] = bits
+
+    def report(self, top=10):
+        """
+        Текстовый отчет о собранных счетчиках.
+
+        :param top: Количество мест вызова с наибольшими операндами, включаемых в отчет.
+        :return: Строка с отчетом.
+        """
+
+        lines = [f"constructions: {dict(self.constructions)}",
+                 f"gcd calls: {self.gcd_calls}",
+                 f"reducedfraction calls: {self.reductions}"]
+        for name, count in self.operations.most_common():
+            histogram = ", ".join(f"<={bucket}: {number}" for bucket, number in sorted(self.operand_bits[name].items()))
+            lines.append(f"{name}: {count} calls, operand bits {histogram}")
+        if self.call_sites:
+            lines.append("largest operands by call site:")
+            for site, bits in sorted(self.call_sites.items(), key=lambda item: -item[1])[:top]:
+                lines.append(f"    {site}: {bits} bits")
+        return "\n".join(lines)
+
+
+def _counting_constructor(profile, name, function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        profile.constructions[name] += 1
+        return function(*args, **kwargs)
+    return wrapper
+
+
+def _counting_operator(profile, name, function):
+    @functools.wraps(function)
+    def wrapper(self, *args):
+        bits = _bits(self)
+        if args:
+            other = _bits(args[0])
+            if other is not None and other > bits:
+                bits = other
+        profile._record(name, bits)
+        return function(self, *args)
+    return wrapper
+
+
+def _counting_reducedfraction(profile, function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        profile.reductions += 1
+        return function(*args, **kwargs)
+    return wrapper
+
+
+def _counting_gcd(profile, function):
+    def wrapper(*args):
+        profile.gcd_calls += 1
+        return function(*args)
+    return wrapper
+
+
+def _patches(profile):
+    """
+    Список замен (объект, имя атрибута, новое значение) для включения профилирования.
+    Методы классов заменяются обертками в словаре класса, поэтому вызовы через Rational._from_normalized
+    и т. п. учитываются во всех модулях.
+    """
+
+    patches = [(rational, '_gcd', _counting_gcd(profile, rational._gcd)),
+               (Rational, 'reducedfraction',
+                staticmethod(_counting_reducedfraction(profile, Rational.__dict__['reducedfraction'].__func__)))]
+    for cls, factory in ((Rational, '_from_normalized'), (Complex, '_from_parts')):
+        name = cls.__name__
+        patches.append((cls, '__init__', _counting_constructor(profile, name, cls.__dict__['__init__'])))
+        patches.append((cls, factory, classmethod(_counting_constructor(profile, name, cls.__dict__[factory].__func__))))
+        for operator in _OPERATORS:
+            if operator in cls.__dict__:
+                patches.append((cls, operator,
+                                _counting_operator(profile, f"{name}.{operator}", cls.__dict__[operator])))
+    return patches
+
+
+@contextlib.contextmanager
+def profile_arithmetic(track_call_sites=False):
+    """
+    Контекстный менеджер, собирающий счетчики арифметики Rational и Complex: количество созданных объектов,
+    вызовов gcd и Rational.reducedfraction, гистограммы длин операндов по операторам.
+
+    Пока профилирование не включено, классы не содержат никакого дополнительного кода: обертки
+    подставляются в классы при входе в блок with и удаляются при выходе из него.
+    Профилирование действует на весь процесс (во всех потоках) и не может быть вложенным.
+
+    Пример:
+        with profile_arithmetic() as profile:
+            polynomial.evaluate(x)
+        print(profile.report())
+
+    :param track_call_sites: Запоминать наибольшую длину операндов для каждого места вызова оператора
+        (замедляет профилирование).
+    :return: Объект ArithmeticProfile, заполняемый во время работы блока.
+    """
+
+    global _active
+    if _active is not None:
+        raise RuntimeError("Arithmetic profiling is already active.")
+    profile = ArithmeticProfile(track_call_sites)
+    patches = _patches(profile)
+    originals = [(target, name, target.__dict__[name]) for target, name, _ in patches]
+    _active = profile
+    try:
+        for target, name, value in patches:
+            setattr(target, name, value)
+        yield profile
+    finally:
+        for target, name, value in originals:
+            setattr(target, name, value)
+        _active = None
@@ -1,57 +1,611 @@
+import contextlib
+import contextvars
 import math
+import sys
+import threading
+from collections import OrderedDict
+
+# Параметры хеширования чисел в CPython (те же, что у int, float и fractions.Fraction)
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
+
+# Интернируются только значения, числитель и знаменатель которых не превышают этой границы по модулю
+_INTERN_LIMIT = 1 << 16
+
+# Сравнение дробей: если перекрестные произведения не длиннее машинного слова, они вычисляются сразу;
+# вещественная оценка используется, пока двоичный порядок дроби далек от границ диапазона float
+_SMALL_PRODUCT_BITS = 64
+_FLOAT_EXPONENT_LIMIT = 1000
+
+# Все сокращения дробей выполняются через эту ссылку (глобальное имя модуля),
+# чтобы профилировщик (profiling.profile_arithmetic) мог подсчитать вызовы gcd, не замедляя обычную работу
+_gcd = math.gcd
+
+
+def _limit_denominator(numerator, denominator, max_denominator, max_numerator=None):
+    """
+    Возвращает ближайшую к numerator/denominator дробь со знаменателем, не превышающим max_denominator
+    (и, если задан max_numerator, с числителем, не превышающим его по модулю).
+    Знаменатель исходной дроби положителен.
+
+    Ответ определяется лишь первыми ~2*log2(max_denominator) битами дробной части,
+    поэтому для длинных операндов приближение ищется для границ отрезка [a/2^k, (a+1)/2^k], содержащего дробь.
+    Множество чисел с одним и тем же наилучшим приближением – отрезок,
+    значит, при совпадении ответов для обеих границ он верен и для самой дроби.
+    """
+
+    if denominator <= max_denominator and (max_numerator is None or abs(numerator) <= max_numerator):
+        return numerator, denominator
+
+    shift = 2 * max(max_denominator, max_numerator or 0).bit_length() + 8
+    if denominator.bit_length() > 2 * shift:
+        fixed = (numerator << shift) // denominator
+        scale = 1 << shift
+        lower = _best_approximation(fixed, scale, max_denominator, max_numerator)
+        if lower == _best_approximation(fixed + 1, scale, max_denominator, max_numerator):
+            return lower
+
+    return _best_approximation(numerator, denominator, max_denominator, max_numerator)
+
+
+def _best_approximation(numerator, denominator, max_denominator, max_numerator=None):
+    """
+    Поиск ближайшей дроби со знаменателем не больше max_denominator (и числителем не больше max_numerator,
+    если он задан; тогда дробь неотрицательна) перебором подходящих дробей (алгоритм Евклида)
+    и выбором между последней подходящей и последней промежуточной дробью.
+    Оба ограничения монотонны вдоль дерева Штерна–Броко, поэтому соседи числа среди допустимых дробей –
+    это по-прежнему последняя допустимая подходящая дробь и последняя допустимая промежуточная дробь.
+    """
+
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    n, d = numerator, denominator
+    while d:
+        a = n // d
+        p2, q2 = p0 + a * p1, q0 + a * q1
+        if q2 > max_denominator or (max_numerator is not None and p2 > max_numerator):
+            break
+        p0, q0, p1, q1 = p1, q1, p2, q2
+        n, d = d, n - a * d
+    else:
+        return p1, q1
+
+    k = (max_denominator - q0) // q1
+    if max_numerator is not None and p1:
+        k = min(k, (max_numerator - p0) // p1)
+    p_bound, q_bound = p0 + k * p1, q0 + k * q1
+    # Сравниваем расстояния |p/q - numerator/denominator| без деления
+    if abs(p1 * denominator - numerator * q1) * q_bound <= abs(p_bound * denominator - numerator * q_bound) * q1:
+        return p1, q1
+    return p_bound, q_bound
+
+
+def _continued_fraction(numerator, denominator):
+    """
+    Неполные частные цепной дроби numerator/denominator (алгоритм Евклида). Знаменатель положителен.
+    """
+
+    while denominator:
+        quotient, numerator, denominator = numerator // denominator, denominator, numerator % denominator
+        yield quotient
+
+
+def _convergents(terms):
+    """
+    Подходящие дроби (p, q) цепной дроби с неполными частными terms:
+    p_k = a_k * p_(k-1) + p_(k-2), q_k = a_k * q_(k-1) + q_(k-2). Подходящие дроби всегда несократимы.
+    """
+
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    for term in terms:
+        p0, q0, p1, q1 = p1, q1, term * p1 + p0, term * q1 + q0
+        yield p1, q1
+
+
+def _simplest_between(low_numerator, low_denominator, high_numerator, high_denominator):
+    """
+    Простейшая дробь (с наименьшими знаменателем и числителем) на отрезке [low, high], 0 <= low <= high,
+    знаменатели концов положительны. Спуск по дереву Штерна–Броко: пока отрезок не содержит целого числа,
+    у его концов общая целая часть a – очередное неполное частное ответа, и отрезок заменяется
+    на [1/(high - a), 1/(low - a)]. Число шагов логарифмично по знаменателям концов.
+    """
+
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    while True:
+        whole, remainder = divmod(low_numerator, low_denominator)
+        if not remainder:
+            return whole * p1 + p0, whole * q1 + q0
+        if (whole + 1) * high_denominator <= high_numerator:
+            return (whole + 1) * p1 + p0, (whole + 1) * q1 + q0
+        p0, q0, p1, q1 = p1, q1, whole * p1 + p0, whole * q1 + q0
+        low_numerator, low_denominator, high_numerator, high_denominator = \
+            high_denominator, high_numerator - whole * high_denominator, low_denominator, remainder
+
+
+def _simplest_float_ratio(value):
+    """
+    Простейшая дробь, которая при переводе в float округляется к value, – дробь с наименьшим знаменателем
+    на отрезке между серединами value и соседних вещественных чисел (например, 0.1 -> 1/10, а не 3602879701896397/2^55).
+    Целые вещественные числа переводятся точно.
+    """
+
+    numerator, denominator = value.as_integer_ratio()
+    if denominator == 1:
+        return numerator, denominator
+    # Половина расстояния до соседних чисел не больше 2/scale; ниже степени двойки (кроме субнормальных)
+    # соседние числа вдвое ближе
+    scale = 4 * math.ulp(value).as_integer_ratio()[1]
+    if 2 * denominator * denominator < scale:
+        # Дроби со знаменателем q <= denominator отстоят от value не меньше чем на 1/denominator^2,
+        # то есть вне отрезка: короткая двоичная дробь (например, 2.5 = 5/2) уже простейшая
+        return numerator, denominator
+    sign = -1 if numerator < 0 else 1
+    center = abs(numerator) * (scale // denominator)
+    below = 1 if math.frexp(abs(value))[0] == 0.5 and abs(value) > sys.float_info.min else 2
+    numerator, denominator = _simplest_between(center - below, scale, center + 2, scale)
+    return sign * numerator, denominator
+
+
+def _limit_bits(numerator, denominator, max_bits):
+    """
+    Возвращает ближайшую к numerator/denominator дробь, числитель и знаменатель которой
+    занимают не более max_bits бит. Знаменатель исходной дроби положителен.
+    Если целая часть дроби по модулю длиннее max_bits бит, возбуждается OverflowError.
+    """
+
+    limit = (1 << max_bits) - 1
+    if abs(numerator) <= limit and denominator <= limit:
+        return numerator, denominator
+    if abs(numerator) // denominator > limit:
+        raise OverflowError("Value does not fit into max_bits bits.")
+    sign = -1 if numerator < 0 else 1
+    numerator, denominator = _limit_denominator(abs(numerator), denominator, limit, limit)
+    return sign * numerator, denominator
+
+
+def _tree_reduce(items, combine):
+    """
+    Сворачивает последовательность бинарной операцией по сбалансированному дереву:
+    стек хранит частичные результаты вместе с их уровнем (количеством свернутых элементов 2^уровень),
+    и два результата одного уровня сразу объединяются. Поэтому объединяются операнды сравнимого размера,
+    а в памяти хранится лишь O(log n) частичных результатов.
+
+    :param items: Последовательность (или итератор) элементов.
+    :param combine: Бинарная ассоциативная операция.
+    :return: Результат свертки или None для пустой последовательности.
+    """
+
+    stack = []
+    for item in items:
+        level = 0
+        while stack and stack[-1][0] == level:
+            item = combine(stack.pop()[1], item)
+            level += 1
+        stack.append((level, item))
+    if not stack:
+        return None
+    result = stack.pop()[1]
+    while stack:
+        result = combine(stack.pop()[1], result)
+    return result
+
+
+def _add_fractions(left, right):
+    """
+    Сумма двух несокращенных дробей, заданных парами (числитель, знаменатель).
+    """
+
+    if left[1] == right[1]:
+        return left[0] + right[0], left[1]
+    return left[0] * right[1] + right[0] * left[1], left[1] * right[1]
+
+
+def _multiply_fractions(left, right):
+    """
+    Произведение двух несокращенных дробей, заданных парами (числитель, знаменатель).
+    """
+
+    return left[0] * right[0], left[1] * right[1]
+
+
+def _compare_fractions(numerator, denominator, other_numerator, other_denominator):
+    """
+    Сравнивает две дроби с положительными знаменателями.
+    Точное перекрестное умножение длинных чисел выполняется, только если не помогли дешевые проверки:
+        1) знаки числителей;
+        2) двоичные порядки дробей (по длинам чисел в битах): при разнице порядков не меньше 2 дроби различны;
+        3) вещественные оценки n/d, вычисляемые с корректным округлением: округление монотонно,
+           поэтому различные оценки задают порядок самих дробей.
+
+    :return: -1, 0 или 1 – результат сравнения первой дроби со второй.
+    """
+
+    sign = (numerator > 0) - (numerator < 0)
+    other_sign = (other_numerator > 0) - (other_numerator < 0)
+    if sign != other_sign:
+        return -1 if sign < other_sign else 1
+    if sign == 0:
+        return 0
+
+    numerator_bits = abs(numerator).bit_length()
+    other_numerator_bits = abs(other_numerator).bit_length()
+    denominator_bits = denominator.bit_length()
+    other_denominator_bits = other_denominator.bit_length()
+
+    if numerator_bits + other_denominator_bits > _SMALL_PRODUCT_BITS \
+            or other_numerator_bits + denominator_bits > _SMALL_PRODUCT_BITS:
+        exponent = numerator_bits - denominator_bits
+        other_exponent = other_numerator_bits - other_denominator_bits
+        if exponent - other_exponent >= 2:
+            return sign
+        if other_exponent - exponent >= 2:
+            return -sign
+        if -_FLOAT_EXPONENT_LIMIT < exponent < _FLOAT_EXPONENT_LIMIT:
+            estimate = numerator / denominator
+            other_estimate = other_numerator / other_denominator
+            if estimate != other_estimate:
+                return -1 if estimate < other_estimate else 1
+
+    left = numerator * other_denominator
+    right = other_numerator * denominator
+    return (left > right) - (left < right)
+
+
+def _float_estimate(numerator, denominator):
+    """
+    Ближайшее к дроби вещественное число (с корректным округлением);
+    слишком большие по модулю дроби оцениваются бесконечностью соответствующего знака.
+    """
+
+    try:
+        return numerator / denominator
+    except OverflowError:
+        # math.copysign здесь не подходит: он сам переводит длинный числитель в float
+        return math.inf if numerator > 0 else -math.inf
+
+
+def _binary_exponent(numerator, denominator):
+    """
+    Двоичный порядок дроби (по длинам чисел в битах): 2^(e-1) < |n/d| < 2^(e+1), где e = len(n) - len(d).
+    """
+
+    return abs(numerator).bit_length() - denominator.bit_length()
+
+
+def _scaled_float(numerator, denominator, shift):
+    """
+    Вещественное число, ближайшее к дроби n/d, умноженной на 2^(-shift).
+    Масштабирование выполняется сдвигом целых чисел, а деление целых чисел в Python округляется корректно,
+    поэтому промежуточные значения не переполняются, даже если сама дробь не представима в float.
+    """
+
+    if shift >= 0:
+        return numerator / (denominator << shift)
+    return (numerator << -shift) / denominator
+
+
+class _SortKey:
+    """
+    Ключ сортировки рациональных чисел (см. Rational.sort_key).
+    Хранит вещественную оценку числа, вычисленную один раз; при равных оценках числа сравниваются точно.
+    """
+
+    __slots__ = ('numerator', 'denominator', 'estimate')
+
+    def __init__(self, numerator, denominator):
+        self.numerator = numerator
+        self.denominator = denominator
+        self.estimate = _float_estimate(numerator, denominator)
+
+    def __lt__(self, other):
+        if self.estimate != other.estimate:
+            return self.estimate < other.estimate
+        return _compare_fractions(self.numerator, self.denominator, other.numerator, other.denominator) < 0
+
+    def __eq__(self, other):
+        return self.estimate == other.estimate \
+            and _compare_fractions(self.numerator, self.denominator, other.numerator, other.denominator) == 0
+
+    __hash__ = None
+
+
+class InternCache:
+    """
+    Ограниченный кэш часто используемых неизменяемых значений (например, 0, 1, -1, 1/2, i).
+    При переполнении вытесняется значение, которое дольше всего не запрашивалось (LRU).
+    Кэш размера 0 ничего не хранит.
+
+    Кэши классов общие для всех потоков, поэтому операции над OrderedDict (поиск и перемещение в конец,
+    вставка и вытеснение) выполняются под блокировкой: иначе другой поток может вытеснить ключ между ними.
+    """
+
+    def __init__(self, maxsize=256):
+        """
+        :param maxsize: Наибольшее количество хранимых значений (неотрицательное целое число).
+        """
+
+        if maxsize < 0:
+            raise ValueError("Cache size cannot be negative.")
+        self.maxsize = maxsize
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Возвращает значение по ключу (и отмечает его как недавно использованное) или None, если значения нет.
+        """
+
+        with self._lock:
+            value = self._values.get(key)
+            if value is not None:
+                self._values.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """
+        Сохраняет значение по ключу, при необходимости вытесняя самое давно использованное.
+        """
+
+        with self._lock:
+            if self.maxsize == 0:
+                return
+            self._values[key] = value
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+
+    def resize(self, maxsize):
+        """
+        Изменяет наибольший размер кэша, вытесняя лишние значения.
+        """
+
+        if maxsize < 0:
+            raise ValueError("Cache size cannot be negative.")
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._values) > maxsize:
+                self._values.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def __len__(self):
+        return len(self._values)
+
+
+# Режим перевода float в дробь (значение параметра float_digits контекста): простейшая дробь,
+# которая округляется в float к исходному числу
+FLOAT_SIMPLEST = 'simplest'
+
+
+class ArithmeticContext:
+    """
+    Контекст арифметики Rational (по аналогии с decimal.Context): режим приближения результатов операций
+    и точность перевода вещественных чисел (float) в дроби.
+
+    Режимы приближения:
+        - точный (max_denominator и max_bits не заданы, по умолчанию): результаты только сокращаются;
+        - ограничение знаменателя: результат заменяется ближайшей дробью со знаменателем не больше max_denominator;
+        - ограничение длины: результат заменяется ближайшей дробью, числитель и знаменатель которой
+          занимают не более max_bits бит; если целая часть результата по модулю длиннее max_bits бит,
+          операция (например, a * b) возбуждает OverflowError.
+    Если заданы оба ограничения, применяются оба (см. Rational.reducedfraction).
+
+    Объекты неизменяемы, поэтому один и тот же контекст можно безопасно разделять между потоками и задачами asyncio;
+    для изменения параметров создается новый контекст (см. метод copy и функцию localcontext).
+    """
+
+    __slots__ = ('_max_denominator', '_max_bits', '_float_digits', '_exact', '_float_denominator')
+
+    def __init__(self, max_denominator=None, max_bits=None, float_digits=FLOAT_SIMPLEST):
+        """
+        :param max_denominator: Наибольший допустимый знаменатель результатов операций (натуральное число) или None.
+        :param max_bits: Наибольшая допустимая длина числителя и знаменателя результатов в битах или None.
+        :param float_digits: Перевод float в дробь: FLOAT_SIMPLEST (по умолчанию) – простейшая дробь,
+            округляющаяся к тому же float; количество знаков после запятой – ближайшая дробь
+            со знаменателем не больше 10^float_digits; None – точный перевод.
+        """
+
+        if max_denominator is not None and max_denominator < 1:
+            raise ValueError("max_denominator should be at least 1.")
+        if max_bits is not None and max_bits < 1:
+            raise ValueError("max_bits should be at least 1.")
+        if float_digits is not None and float_digits != FLOAT_SIMPLEST and float_digits < 0:
+            raise ValueError("float_digits cannot be negative.")
+        self._max_denominator = max_denominator
+        self._max_bits = max_bits
+        self._float_digits = float_digits
+        self._exact = max_denominator is None and max_bits is None
+        self._float_denominator = 10 ** float_digits if isinstance(float_digits, int) else None
+
+    @property
+    def max_denominator(self):
+        return self._max_denominator
+
+    @property
+    def max_bits(self):
+        return self._max_bits
+
+    @property
+    def float_digits(self):
+        return self._float_digits
+
+    @property
+    def exact(self):
+        """
+        True, если результаты операций не приближаются (не заданы ни max_denominator, ни max_bits).
+        """
+
+        return self._exact
+
+    def copy(self, **changes):
+        """
+        Возвращает новый контекст с измененными параметрами, например context.copy(max_bits=64).
+
+        :param changes: Новые значения параметров max_denominator, max_bits, float_digits.
+        :return: Новый объект класса ArithmeticContext.
+        """
+
+        parameters = {'max_denominator': self._max_denominator, 'max_bits': self._max_bits,
+                      'float_digits': self._float_digits}
+        for name in changes:
+            if name not in parameters:
+                raise TypeError(f"Unknown context parameter: {name!r}")
+        parameters.update(changes)
+        return ArithmeticContext(**parameters)
+
+    def __eq__(self, other):
+        if not isinstance(other, ArithmeticContext):
+            return NotImplemented
+        return (self._max_denominator, self._max_bits, self._float_digits) == \
+            (other._max_denominator, other._max_bits, other._float_digits)
+
+    def __hash__(self):
+        return hash((self._max_denominator, self._max_bits, self._float_digits))
+
+    def __reduce__(self):
+        return ArithmeticContext, (self._max_denominator, self._max_bits, self._float_digits)
+
+    def __repr__(self):
+        return f"ArithmeticContext(max_denominator={self._max_denominator!r}, max_bits={self._max_bits!r}, " \
+               f"float_digits={self._float_digits!r})"
+
+
+# Текущий контекст арифметики: свой для каждого потока и каждой задачи asyncio
+DEFAULT_CONTEXT = ArithmeticContext()
+_context = contextvars.ContextVar('rational_context', default=DEFAULT_CONTEXT)
+
+
+def getcontext():
+    """
+    Возвращает текущий контекст арифметики (объект класса ArithmeticContext).
+    """
+
+    return _context.get()
+
+
+def setcontext(context):
+    """
+    Устанавливает контекст арифметики для текущего потока (задачи asyncio).
+
+    :param context: Объект класса ArithmeticContext.
+    """
+
+    if not isinstance(context, ArithmeticContext):
+        raise TypeError("context should be an ArithmeticContext.")
+    _context.set(context)
+
+
+@contextlib.contextmanager
+def localcontext(context=None, **changes):
+    """
+    Контекстный менеджер, временно устанавливающий контекст арифметики (по аналогии с decimal.localcontext).
+    При выходе из блока with восстанавливается прежний контекст.
+
+    Пример:
+        with localcontext(max_bits=64):
+            result = a * b + c      # результаты приближаются дробями не длиннее 64 бит
+
+    :param context: Контекст, который нужно установить (по умолчанию – текущий).
+    :param changes: Параметры, которые нужно изменить (max_denominator, max_bits, float_digits).
+    :return: Установленный контекст.
+    """
+
+    if context is None:
+        context = _context.get()
+    elif not isinstance(context, ArithmeticContext):
+        raise TypeError("context should be an ArithmeticContext.")
+    if changes:
+        context = context.copy(**changes)
+    token = _context.set(context)
+    try:
+        yield context
+    finally:
+        _context.reset(token)
+
 
 class Rational:
     """
     Класс рациональных чисел.
     Рациональное число – число, представимое в виде дроби
     с целым числом в числителе и натуральным числом в знаменателе
+
+    Объекты класса неизменяемы: числитель и знаменатель хранятся в слотах (__slots__),
+    а все операции возвращают новые объекты.
     """
 
+    __slots__ = ('_numerator', '_denominator')
+
+    # Кэш интернированных значений (см. Rational.interned)
+    _intern_cache = InternCache()
+
     @staticmethod
-    def reducedfraction(big_numerator: int, big_denominator: int):
+    def reducedfraction(big_numerator: int, big_denominator: int, max_denominator=None, max_bits=None):
         """
-        Статический метод, повышающий удобство работы с вещественными числами, конвертированных в рациональные.
-        Возвращает числитель и знаменатель дроби из целых чисел, которая в десятичном представлении совпадает с
-        упрощаемым числом до 4 знака после запятой.
+        Статический метод, приводящий дробь к несократимому виду и, при необходимости,
+        заменяющий ее наилучшим рациональным приближением ограниченного размера.
+        Возвращает числитель и знаменатель (положительный) получившейся дроби.
+
+        Поддерживаются три режима:
+            - точный (max_denominator и max_bits не заданы): дробь только сокращается;
+            - ограничение знаменателя: ближайшая к исходной дробь со знаменателем не больше max_denominator
+              (ищется по подходящим и промежуточным дробям цепной дроби);
+            - ограничение длины: ближайшая дробь, числитель и знаменатель которой занимают не более max_bits бит.
 
-        Этот метод призван избавить пользователя от рациональных чисел, представленных
-        в виде дробей с очень большими числителями и знаменателями, за счет некоторого уменьшения точности вычислений.
+        Если параметры не переданы, используются параметры текущего контекста арифметики (см. getcontext),
+        которые задают режим работы арифметических операторов.
 
         Пример для наглядности:
 
             2.3333 = 5254124505271789 / 2251799813685248
 
             Очевидно, что с таким работать очень тяжело как для пользователя, так и для самой программы.
+            Ближайшая дробь со знаменателем не больше 10000 совпадает с числом до 4 знака после запятой:
 
-            Однако мы можем взять дробь с числителем и знаменателем, на порядки меньшими, которая в десятичном представлении
-            будет давать, пусть не в точности то число, представление которого мы "упрощаем", но число, достаточно близкое к нему:
+            reducedfraction(5254124505271789, 2251799813685248, max_denominator=10000) == (23333, 10000)
 
-            52541 / 22517 = 2.3333925478527333...
+        Перед поиском приближения очень длинные дроби усекаются до числа с фиксированной точкой
+        достаточной точности (одно деление), поэтому время работы почти не зависит от длины операндов.
 
-        :param big_numerator: Рациональное число, которое нужно "упростить".
-        :param big_denominator: Рациональное число, которое нужно "упростить".
-        :return: Число типа Rational – "упрощенное" рациональное число.
+        :param big_numerator: Числитель дроби, которую нужно "упростить".
+        :param big_denominator: Знаменатель дроби, которую нужно "упростить" (не равен нулю).
+        :param max_denominator: Наибольший допустимый знаменатель результата (натуральное число) или None.
+        :param max_bits: Наибольшая допустимая длина числителя и знаменателя результата в битах или None.
+        :return: Пара целых чисел (числитель, знаменатель) – "упрощенная" дробь.
+        :raises OverflowError: Если задан max_bits, а целая часть дроби по модулю длиннее max_bits бит.
         """
 
-        if len(str(big_numerator)) > 5:
-            reduced_numerator = int(str(big_numerator)[:5])
-        else:
-            reduced_numerator = big_numerator
+        if big_denominator == 0:
+            raise ValueError("Denominator cannot be zero.")
+        if big_denominator < 0:
+            big_numerator, big_denominator = -big_numerator, -big_denominator
 
-        if len(str(big_denominator)) > 5:
-            reduced_denominator = int(str(big_denominator)[:5])
-        else:
-            reduced_denominator = big_denominator
+        if max_denominator is None and max_bits is None:
+            context = _context.get()
+            max_denominator = context.max_denominator
+            max_bits = context.max_bits
+
+        if max_denominator is not None:
+            if max_denominator < 1:
+                raise ValueError("max_denominator should be at least 1.")
+            big_numerator, big_denominator = _limit_denominator(big_numerator, big_denominator, max_denominator)
 
-        return reduced_numerator, reduced_denominator
+        if max_bits is not None:
+            if max_bits < 1:
+                raise ValueError("max_bits should be at least 1.")
+            big_numerator, big_denominator = _limit_bits(big_numerator, big_denominator, max_bits)
+
+        gcd_value = _gcd(big_numerator, big_denominator)
+        return big_numerator // gcd_value, big_denominator // gcd_value
 
     def __init__(self, numerator, denominator=1):
         """
         Метод инициализации объекта класса Rational (рационального числа).
         Принимает в себя два числа: числитель и знаменатель.
         Может принять в себя объекты классов: int и float;
-            В случае float представит вещественное число как дробь из двух целых чисел
-            (число типа float будет округлено до 4 знаков после запятой).
+            В случае float представит вещественное число как дробь из двух целых чисел:
+            по умолчанию – простейшую дробь, которая округляется к тому же float (0.1 -> 1/10),
+            а если в контексте арифметики задан параметр float_digits – ближайшую дробь
+            со знаменателем не больше 10^float_digits (None – точное двоичное значение).
         Если это возможно, сокращает дробь.
 
         :param numerator: Числитель дроби – целое число (int).
@@ -62,9 +616,14 @@ class Rational:
             raise ValueError("Denominator cannot be zero.")
 
         if isinstance(numerator, float):
-            f_number = round(numerator/denominator, 4)
-            f_number_air = f_number.as_integer_ratio()
-            numerator, denominator = Rational.reducedfraction(f_number_air[0], f_number_air[1])
+            context = _context.get()
+            if context._float_digits == FLOAT_SIMPLEST:
+                numerator, denominator = _simplest_float_ratio(numerator / denominator)
+            elif context._float_denominator is None:
+                numerator, denominator = (numerator / denominator).as_integer_ratio()
+            else:
+                numerator, denominator = Rational.reducedfraction(*(numerator / denominator).as_integer_ratio(),
+                                                                  max_denominator=context._float_denominator)
 
         if not isinstance(numerator, int) or not isinstance(denominator, int):
             raise TypeError("Numerator and denominator must be integers.")
@@ -72,22 +631,189 @@ class Rational:
         if denominator < 0:
             numerator, denominator = -numerator, -denominator
 
-        gcd_value = math.gcd(numerator, denominator)
-        self.__numerator = numerator // gcd_value
-        self.__denominator = denominator // gcd_value
+        gcd_value = _gcd(numerator, denominator)
+        _set_numerator(self, numerator // gcd_value)
+        _set_denominator(self, denominator // gcd_value)
+
+    @classmethod
+    def _from_normalized(cls, numerator, denominator):
+        """
+        Внутренний конструктор для результатов арифметических операций.
+        Не выполняет никаких проверок: дробь должна быть уже несократимой, а знаменатель – положительным
+        (например, результат метода reducedfraction).
+
+        :param numerator: Числитель дроби – целое число (int).
+        :param denominator: Знаменатель дроби – натуральное число (int), взаимно простое с числителем.
+        :return: Новый объект класса Rational.
+        """
+
+        result = object.__new__(cls)
+        _set_numerator(result, numerator)
+        _set_denominator(result, denominator)
+        return result
+
+    @classmethod
+    def _from_coprime(cls, numerator, denominator):
+        """
+        Внутренний конструктор для результатов операций с целыми числами, несократимость которых известна заранее
+        (например, (n + k*d)/d при взаимно простых n и d). В точном режиме сокращение (gcd) пропускается,
+        если же контекст арифметики задает ограничение размера (max_denominator или max_bits), оно применяется.
+
+        :param numerator: Числитель дроби – целое число (int).
+        :param denominator: Знаменатель дроби – натуральное число (int), взаимно простое с числителем.
+        :return: Новый объект класса Rational.
+        """
+
+        if _context.get()._exact:
+            return cls._from_normalized(numerator, denominator)
+        return cls._from_normalized(*Rational.reducedfraction(numerator, denominator))
+
+    @staticmethod
+    def interned(numerator, denominator=1):
+        """
+        Статический метод получения часто используемого рационального числа (0, 1, -1, 1/2 и т.п.) из кэша.
+        Повторные запросы одного и того же небольшого значения возвращают один и тот же объект,
+        не создавая и не сокращая его заново. Большие значения не кэшируются.
+
+        :param numerator: Числитель дроби – целое число (int).
+        :param denominator: Знаменатель дроби - целое число (int), не равное нулю.
+        :return: Число типа Rational.
+        """
+
+        if type(numerator) is not int or type(denominator) is not int \
+                or not -_INTERN_LIMIT <= numerator <= _INTERN_LIMIT or not -_INTERN_LIMIT <= denominator <= _INTERN_LIMIT:
+            return Rational(numerator, denominator)
+        key = (numerator, denominator)
+        value = Rational._intern_cache.get(key)
+        if value is None:
+            value = Rational(numerator, denominator)
+            Rational._intern_cache.put(key, value)
+        return value
+
+    @staticmethod
+    def set_intern_cache_size(maxsize):
+        """
+        Статический метод изменения размера кэша интернированных значений (0 отключает кэширование).
+
+        :param maxsize: Наибольшее количество хранимых значений.
+        """
+
+        Rational._intern_cache.resize(maxsize)
+
+    @staticmethod
+    def sum(values):
+        """
+        Статический метод суммирования последовательности рациональных (Rational) и целых (int) чисел.
+
+        В отличие от цикла "+=", промежуточные суммы не сокращаются и не создаются как объекты:
+        слагаемые с одинаковыми знаменателями складываются по числителям, остальные несокращенные дроби
+        объединяются по сбалансированному дереву, а дробь сокращается один раз в конце.
+
+        :param values: Последовательность (или итератор) чисел типа Rational или int.
+        :return: Число типа Rational – сумма чисел (0 для пустой последовательности).
+        """
+
+        numerators = {}
+        for value in values:
+            if isinstance(value, Rational):
+                numerator, denominator = value._numerator, value._denominator
+            elif isinstance(value, int):
+                numerator, denominator = value, 1
+            else:
+                raise TypeError("Rational.sum() accepts only Rational and int values.")
+            numerators[denominator] = numerators.get(denominator, 0) + numerator
+
+        result = _tree_reduce(((numerator, denominator) for denominator, numerator in numerators.items()),
+                              _add_fractions)
+        if result is None:
+            return Rational.interned(0)
+        return Rational._from_normalized(*Rational.reducedfraction(*result))
+
+    @staticmethod
+    def prod(values):
+        """
+        Статический метод перемножения последовательности рациональных (Rational) и целых (int) чисел.
+        Числители и знаменатели перемножаются по сбалансированному дереву без промежуточных сокращений,
+        дробь сокращается один раз в конце.
+
+        :param values: Последовательность (или итератор) чисел типа Rational или int.
+        :return: Число типа Rational – произведение чисел (1 для пустой последовательности).
+        """
+
+        def fractions():
+            for value in values:
+                if isinstance(value, Rational):
+                    yield value._numerator, value._denominator
+                elif isinstance(value, int):
+                    yield value, 1
+                else:
+                    raise TypeError("Rational.prod() accepts only Rational and int values.")
+
+        result = _tree_reduce(fractions(), _multiply_fractions)
+        if result is None:
+            return Rational.interned(1)
+        return Rational._from_normalized(*Rational.reducedfraction(*result))
+
+    @staticmethod
+    def to_float(values):
+        """
+        Статический метод пакетного преобразования последовательности чисел в вещественные числа.
+        Каждое число округляется корректно (как float(r)).
+        Массивы, у которых есть собственный векторизованный метод to_float (например, RationalArray),
+        преобразуются этим методом.
+
+        :param values: Последовательность (или итератор) чисел типа Rational, int или float либо массив.
+        :return: Список чисел типа float (для массива – результат его метода to_float).
+        """
+
+        if not isinstance(values, Rational) and hasattr(values, "to_float"):
+            return values.to_float()
+        result = []
+        for value in values:
+            if isinstance(value, Rational):
+                result.append(value._numerator / value._denominator)
+            elif isinstance(value, (int, float)):
+                result.append(float(value))
+            else:
+                raise TypeError("Rational.to_float() accepts only Rational, int and float values.")
+        return result
+
+    @staticmethod
+    def sort_key(value):
+        """
+        Статический метод – ключ сортировки для sorted(), list.sort(), min(), max() и bisect.
+        Вещественная оценка каждого числа вычисляется один раз (N делений вместо ~2·N·log N перекрестных умножений),
+        а точное сравнение выполняется только для чисел с совпадающими оценками.
+
+        Пример: sorted(values, key=Rational.sort_key)
+
+        :param value: Число типа Rational, int или float (конечное).
+        :return: Ключ сортировки.
+        """
+
+        if isinstance(value, Rational):
+            return _SortKey(value._numerator, value._denominator)
+        elif isinstance(value, int):
+            return _SortKey(value, 1)
+        elif isinstance(value, float):
+            if math.isnan(value) or math.isinf(value):
+                raise ValueError("Cannot build a sort key for nan or infinity.")
+            return _SortKey(*value.as_integer_ratio())
+        raise TypeError("Rational.sort_key() accepts only Rational, int and float values.")
 
     @property
     def numerator(self):
-        return self.__numerator
+        return self._numerator
 
     @property
     def denominator(self):
-        return self.__denominator
+        return self._denominator
 
     def __add__(self, other):
         """
         Оператор сложения рационального числа с другим рациональным числом или целым числом (int).
-        В случае сложения с целым числом предворительно преобразовывет его в рациональное.
+        Сложение с целым числом k выполняется без создания промежуточного объекта и без сокращения:
+        n/d + k = (n + k*d)/d – дробь уже несократима.
         Для типов данных, отличных от Rational и int, операция не определена.
 
         :param other: Число, с которым происходит сложение.
@@ -95,19 +821,32 @@ class Rational:
         """
 
         if isinstance(other, Rational):
-            numerator = self.__numerator * other.denominator + other.numerator * self.__denominator
-            denominator = self.__denominator * other.denominator
+            numerator = self._numerator * other._denominator + other._numerator * self._denominator
+            denominator = self._denominator * other._denominator
             new_numerator, new_denominator = Rational.reducedfraction(numerator, denominator)
-            return Rational(new_numerator, new_denominator)
+            return Rational._from_normalized(new_numerator, new_denominator)
         elif isinstance(other, int):
-            return self + Rational(other)
+            return Rational._from_coprime(self._numerator + other * self._denominator, self._denominator)
         else:
             return NotImplemented
 
+    def __radd__(self, other):
+        """
+        Отраженный оператор сложения: целое число (int) + рациональное число.
+        Позволяет записывать выражения вида 2 + r и суммировать рациональные числа встроенной функцией sum().
+
+        :param other: Целое число, к которому прибавляется рациональное число.
+        :return: Результат сложения двух чисел – сумма двух чисел или ошибка неопределенности операции.
+        """
+
+        if isinstance(other, int):
+            return Rational._from_coprime(self._numerator + other * self._denominator, self._denominator)
+        return NotImplemented
+
     def __sub__(self, other):
         """
         Оператор вычитания из рационального числа другого рационального числа или целого числа (int).
-        В случае вычитания целого числа предворительно преобразовывет его в рациональное.
+        Вычитание целого числа k выполняется без сокращения: n/d - k = (n - k*d)/d.
         Для типов данных, отличных от Rational и int, операция не определена.
 
         :param other: Число, которое вычитается из рационального числа.
@@ -115,19 +854,33 @@ class Rational:
         """
 
         if isinstance(other, Rational):
-            numerator = self.__numerator * other.denominator - other.numerator * self.__denominator
-            denominator = self.__denominator * other.denominator
+            numerator = self._numerator * other._denominator - other._numerator * self._denominator
+            denominator = self._denominator * other._denominator
             new_numerator, new_denominator = Rational.reducedfraction(numerator, denominator)
-            return Rational(new_numerator, new_denominator)
+            return Rational._from_normalized(new_numerator, new_denominator)
         elif isinstance(other, int):
-            return self - Rational(other)
+            return Rational._from_coprime(self._numerator - other * self._denominator, self._denominator)
         else:
             return NotImplemented
 
+    def __rsub__(self, other):
+        """
+        Отраженный оператор вычитания: целое число (int) - рациональное число.
+        Выполняется без сокращения: k - n/d = (k*d - n)/d.
+
+        :param other: Целое число, из которого вычитается рациональное число.
+        :return: Результат вычитания – разность двух чисел или ошибка неопределенности операции.
+        """
+
+        if isinstance(other, int):
+            return Rational._from_coprime(other * self._denominator - self._numerator, self._denominator)
+        return NotImplemented
+
     def __mul__(self, other):
         """
         Оператор умножения рационального числа на другое рациональное число или целое число (int).
-        В случае умножения на целое число предворительно преобразовывет его в рациональное.
+        При умножении на целое число k сокращается только k со знаменателем (gcd от короткого числа):
+        n/d * k = (n * k/g) / (d/g), g = gcd(k, d).
         Для типов данных, отличных от Rational и int, операция не определена.
 
         :param other: Число, на которое умножается рациональное число.
@@ -135,19 +888,42 @@ class Rational:
         """
 
         if isinstance(other, Rational):
-            numerator = self.__numerator * other.numerator
-            denominator = self.__denominator * other.denominator
+            numerator = self._numerator * other._numerator
+            denominator = self._denominator * other._denominator
             new_numerator, new_denominator = Rational.reducedfraction(numerator, denominator)
-            return Rational(new_numerator, new_denominator)
+            return Rational._from_normalized(new_numerator, new_denominator)
         elif isinstance(other, int):
-            return self * Rational(other)
+            return self._multiply_integer(other)
         else:
             return NotImplemented
 
+    def __rmul__(self, other):
+        """
+        Отраженный оператор умножения: целое число (int) * рациональное число.
+
+        :param other: Целое число, которое умножается на рациональное число.
+        :return: Результат умножения двух чисел – произведение двух чисел или ошибка неопределенности операции.
+        """
+
+        if isinstance(other, int):
+            return self._multiply_integer(other)
+        return NotImplemented
+
+    def _multiply_integer(self, other):
+        """
+        Произведение рационального числа на целое число k: n/d * k = (n * k/g) / (d/g), g = gcd(k, d).
+
+        :param other: Целое число (int).
+        :return: Число типа Rational – произведение.
+        """
+
+        gcd_value = _gcd(other, self._denominator)
+        return Rational._from_coprime(self._numerator * (other // gcd_value), self._denominator // gcd_value)
+
     def __truediv__(self, other):
         """
         Оператор деления рационального числа на другое рациональное число, отличное от нуля, или целое число (int), отличное от нуля.
-        В случае деления на целое число предворительно преобразовывет его в рациональное.
+        При делении на целое число k сокращается только k с числителем: n/d / k = (n/g) / (d * k/g), g = gcd(n, k).
         Для типов данных, отличных от Rational и int, операция не определена.
 
         :param other: Число, на которое делится рациональное число.
@@ -155,34 +931,233 @@ class Rational:
         """
 
         if isinstance(other, Rational):
-            if other.numerator == 0:
+            if other._numerator == 0:
                 raise ZeroDivisionError("Cannot divide by zero")
-            numerator = self.__numerator * other.denominator
-            denominator = self.__denominator * other.numerator
+            numerator = self._numerator * other._denominator
+            denominator = self._denominator * other._numerator
             new_numerator, new_denominator = Rational.reducedfraction(numerator, denominator)
-            return Rational(new_numerator, new_denominator)
+            return Rational._from_normalized(new_numerator, new_denominator)
         elif isinstance(other, int):
-            return self / Rational(other)
+            return self._divide_integer(other)
         else:
             return NotImplemented
 
+    def __rtruediv__(self, other):
+        """
+        Отраженный оператор деления: целое число (int) / рациональное число, отличное от нуля.
+        Сокращается только k с числителем: k / (n/d) = (k/g * d) / (n/g), g = gcd(k, n).
+
+        :param other: Целое число, которое делится на рациональное число.
+        :return: Результат деления – частное двух чисел или ошибка неопределенности операции.
+        """
+
+        if not isinstance(other, int):
+            return NotImplemented
+        if self._numerator == 0:
+            raise ZeroDivisionError("Cannot divide by zero")
+        gcd_value = _gcd(other, self._numerator)
+        numerator = other // gcd_value * self._denominator
+        denominator = self._numerator // gcd_value
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        return Rational._from_coprime(numerator, denominator)
+
+    def _divide_integer(self, other):
+        """
+        Частное рационального числа и целого числа k, отличного от нуля: n/d / k = (n/g) / (d * k/g), g = gcd(n, k).
+
+        :param other: Целое число (int).
+        :return: Число типа Rational – частное.
+        """
+
+        if other == 0:
+            raise ZeroDivisionError("Cannot divide by zero")
+        gcd_value = _gcd(self._numerator, other)
+        numerator = self._numerator // gcd_value
+        denominator = self._denominator * (other // gcd_value)
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        return Rational._from_coprime(numerator, denominator)
+
+    def __pow__(self, other):
+        """
+        Оператор возведения рационального числа в целую степень (в том числе отрицательную).
+        Числитель и знаменатель возводятся в степень по отдельности: степени взаимно простых чисел
+        взаимно просты, поэтому сокращение (gcd) не требуется.
+        Для типов данных, отличных от int, операция не определена.
+
+        :param other: Целое число (int) – показатель степени.
+        :return: Число типа Rational – степень числа или ошибка неопределенности операции.
+        """
+
+        if not isinstance(other, int):
+            return NotImplemented
+        numerator, denominator = self._numerator, self._denominator
+        if other < 0:
+            if numerator == 0:
+                raise ZeroDivisionError("Cannot raise zero to a negative power")
+            numerator, denominator, other = denominator, numerator, -other
+            if denominator < 0:
+                numerator, denominator = -numerator, -denominator
+        return Rational._from_coprime(numerator ** other, denominator ** other)
+
+    def powers(self, n):
+        """
+        Генератор последовательных степеней рационального числа x^0, x^1, ..., x^n.
+        Каждая следующая степень получается из предыдущей одним умножением числителя и знаменателя
+        без сокращения дроби (см. __pow__), что удобно для вычисления рядов и строк матрицы Вандермонда.
+
+        :param n: Наибольший показатель степени – неотрицательное целое число (int).
+        :return: Итератор чисел типа Rational (n + 1 значение).
+        """
+
+        if not isinstance(n, int) or n < 0:
+            raise ValueError("n should be a non-negative integer.")
+
+        def generate():
+            numerator, denominator = 1, 1
+            yield Rational.interned(1)
+            for _ in range(n):
+                numerator *= self._numerator
+                denominator *= self._denominator
+                yield Rational._from_coprime(numerator, denominator)
+
+        return generate()
+
+    def continued_fraction(self):
+        """
+        Метод разложения рационального числа в конечную цепную дробь [a0; a1, ..., ak]:
+        x = a0 + 1/(a1 + 1/(... + 1/ak)). Неполные частные вычисляются алгоритмом Евклида,
+        их количество логарифмично по знаменателю.
+
+        :return: Список целых чисел – неполных частных (a1, ..., ak натуральные; последнее больше 1, если k > 0).
+        """
+
+        return list(_continued_fraction(self._numerator, self._denominator))
+
+    def convergents(self):
+        """
+        Генератор подходящих дробей рационального числа p0/q0, p1/q1, ... – наилучших приближений числа
+        (ни одна дробь с меньшим знаменателем не ближе к числу). Последняя подходящая дробь равна самому числу.
+        Дроби вычисляются лениво, по мере продвижения алгоритма Евклида.
+
+        :return: Итератор чисел типа Rational.
+        """
+
+        for numerator, denominator in _convergents(_continued_fraction(self._numerator, self._denominator)):
+            yield Rational._from_normalized(numerator, denominator)
+
+    def limit_denominator(self, max_denominator):
+        """
+        Метод поиска ближайшей к числу дроби со знаменателем не больше max_denominator
+        (по подходящим и промежуточным дробям цепной дроби, см. Rational.reducedfraction).
+
+        :param max_denominator: Наибольший допустимый знаменатель (натуральное число).
+        :return: Число типа Rational – наилучшее приближение.
+        """
+
+        if max_denominator < 1:
+            raise ValueError("max_denominator should be at least 1.")
+        return Rational._from_normalized(*_limit_denominator(self._numerator, self._denominator, max_denominator))
+
+    @staticmethod
+    def from_continued_fraction(terms):
+        """
+        Статический метод вычисления значения конечной цепной дроби [a0; a1, ..., ak].
+        Значение – последняя подходящая дробь, которая всегда несократима, поэтому сокращение (gcd) не требуется.
+
+        :param terms: Непустая последовательность (или итератор) неполных частных: a0 – целое число (int),
+            остальные – натуральные числа.
+        :return: Число типа Rational.
+        """
+
+        def checked():
+            for index, term in enumerate(terms):
+                if not isinstance(term, int):
+                    raise TypeError("Continued fraction terms must be integers.")
+                if index and term < 1:
+                    raise ValueError("Continued fraction terms after the first must be positive.")
+                yield term
+
+        result = None
+        for result in _convergents(checked()):
+            pass
+        if result is None:
+            raise ValueError("Continued fraction must have at least one term.")
+        return Rational._from_coprime(*result)
+
+    @staticmethod
+    def simplest_between(low, high):
+        """
+        Статический метод поиска простейшей дроби (с наименьшими знаменателем и числителем) на отрезке [low, high]
+        спуском по дереву Штерна–Броко; число шагов логарифмично по знаменателям концов.
+        Например, simplest_between(Rational(3, 10), Rational(1, 3)) == Rational(1, 3),
+        simplest_between(Rational(31, 100), Rational(8, 25)) == Rational(5, 16).
+
+        :param low: Левый конец отрезка (Rational или int).
+        :param high: Правый конец отрезка (Rational или int), не меньше левого.
+        :return: Число типа Rational.
+        """
+
+        if not isinstance(low, (Rational, int)) or not isinstance(high, (Rational, int)):
+            raise TypeError("Rational.simplest_between() accepts only Rational and int values.")
+        low_numerator, low_denominator = (low._numerator, low._denominator) if isinstance(low, Rational) else (low, 1)
+        high_numerator, high_denominator = \
+            (high._numerator, high._denominator) if isinstance(high, Rational) else (high, 1)
+        if low_numerator * high_denominator > high_numerator * low_denominator:
+            raise ValueError("low should not be greater than high.")
+        if low_numerator <= 0 <= high_numerator:
+            return Rational.interned(0)
+        if high_numerator < 0:
+            numerator, denominator = _simplest_between(-high_numerator, high_denominator,
+                                                       -low_numerator, low_denominator)
+            return Rational._from_normalized(-numerator, denominator)
+        return Rational._from_normalized(*_simplest_between(low_numerator, low_denominator,
+                                                            high_numerator, high_denominator))
+
     def __eq__(self, other):
         """
-        Оператор проверки равенства рационального числа с другим рациональным числом или целым числом (int).
-        В случае целого числа предворительно преобразовывет его в рациональное.
-        Для типов данных, отличных от Rational и int, операция не определена.
+        Оператор проверки равенства рационального числа с другим рациональным числом, целым числом (int)
+        или вещественным числом (float).
+        Сравнение с вещественным числом точное (без округления), поэтому согласовано с хешем.
+        Для остальных типов данных операция не определена.
 
         :param other: Число, с которым проводится проверка на равенство.
         :return: Результат проверки на равенство – True/False или ошибка неопределенности операции.
         """
 
         if isinstance(other, Rational):
-            return self.__numerator == other.numerator and self.__denominator == other.denominator
-        elif isinstance(other, int) or isinstance(other, float):
-            return self == Rational(other)
+            return self._numerator == other._numerator and self._denominator == other._denominator
+        elif isinstance(other, int):
+            return self._denominator == 1 and self._numerator == other
+        elif isinstance(other, float):
+            if math.isnan(other) or math.isinf(other):
+                return False
+            numerator, denominator = other.as_integer_ratio()
+            return self._numerator == numerator and self._denominator == denominator
         else:
             return NotImplemented
 
+    def __hash__(self):
+        """
+        Оператор вычисления хеша рационального числа.
+        Согласован с хешами int, float и fractions.Fraction: равные числа имеют равные хеши,
+        поэтому рациональные числа можно использовать как ключи словарей и элементы множеств.
+
+        :return: Число типа int – хеш рационального числа.
+        """
+
+        # Хеш дроби p/q в CPython – это p * q^(-1) по модулю простого числа _HASH_MODULUS
+        try:
+            inverse = pow(self._denominator, -1, _HASH_MODULUS)
+        except ValueError:
+            # Знаменатель делится на модуль: такие числа хешируются как бесконечность
+            hash_value = _HASH_INF
+        else:
+            hash_value = hash(hash(abs(self._numerator)) * inverse)
+        result = hash_value if self._numerator >= 0 else -hash_value
+        return -2 if result == -1 else result
+
     def __ne__(self, other):
         """
         Оператор проверки неравенства рационального числа с другим рациональным числом или целым числом (int).
@@ -196,11 +1171,88 @@ class Rational:
 
         return not (self == other)
 
+    def _compare(self, other):
+        """
+        Сравнивает рациональное число с другим рациональным числом, целым числом (int) или вещественным числом (float).
+        Сравнение с вещественным числом точное (без округления).
+
+        :param other: Число, с которым проводится сравнение.
+        :return: -1, 0 или 1; None для nan; NotImplemented для остальных типов данных.
+        """
+
+        if isinstance(other, Rational):
+            return _compare_fractions(self._numerator, self._denominator, other._numerator, other._denominator)
+        elif isinstance(other, int):
+            return _compare_fractions(self._numerator, self._denominator, other, 1)
+        elif isinstance(other, float):
+            if math.isnan(other):
+                return None
+            if math.isinf(other):
+                return -1 if other > 0 else 1
+            return _compare_fractions(self._numerator, self._denominator, *other.as_integer_ratio())
+        else:
+            return NotImplemented
+
+    def __lt__(self, other):
+        """
+        Оператор "меньше" для рационального числа и рационального, целого (int) или вещественного (float) числа.
+        Сначала сравниваются знаки, затем двоичные порядки и вещественные оценки,
+        и только если их недостаточно – точные перекрестные произведения.
+
+        :param other: Число, с которым проводится сравнение.
+        :return: Результат сравнения – True/False или ошибка неопределенности операции.
+        """
+
+        result = self._compare(other)
+        if result is NotImplemented:
+            return NotImplemented
+        return result is not None and result < 0
+
+    def __le__(self, other):
+        """
+        Оператор "меньше или равно" (см. __lt__).
+
+        :param other: Число, с которым проводится сравнение.
+        :return: Результат сравнения – True/False или ошибка неопределенности операции.
+        """
+
+        result = self._compare(other)
+        if result is NotImplemented:
+            return NotImplemented
+        return result is not None and result <= 0
+
+    def __gt__(self, other):
+        """
+        Оператор "больше" (см. __lt__).
+
+        :param other: Число, с которым проводится сравнение.
+        :return: Результат сравнения – True/False или ошибка неопределенности операции.
+        """
+
+        result = self._compare(other)
+        if result is NotImplemented:
+            return NotImplemented
+        return result is not None and result > 0
+
+    def __ge__(self, other):
+        """
+        Оператор "больше или равно" (см. __lt__).
+
+        :param other: Число, с которым проводится сравнение.
+        :return: Результат сравнения – True/False или ошибка неопределенности операции.
+        """
+
+        result = self._compare(other)
+        if result is NotImplemented:
+            return NotImplemented
+        return result is not None and result >= 0
+
     def __iadd__(self, other):
         """
         Оператор сложения с присваиванием рационального числа с другим рациональным числом или целым числом (int).
-        В случае целого числа предворительно преобразовывет его в рациональное.
-        Для типов данных, отличных от Rational и int, операция не определена.
+        Целое число обрабатывается без промежуточного объекта (как в соответствующем бинарном операторе),
+        вещественное (float) предварительно преобразуется в рациональное.
+        Для остальных типов данных операция не определена.
 
         :param other: Число, с которым проводится сложение с присваиванием.
         :return: Результат сложения с присваиванием –
@@ -209,14 +1261,13 @@ class Rational:
         """
 
         if isinstance(other, Rational):
-            numerator = self.__numerator * other.denominator + other.numerator * self.__denominator
-            denominator = self.__denominator * other.denominator
-            gcd_value = math.gcd(numerator, denominator)
-            numerator //= gcd_value
-            denominator //= gcd_value
+            numerator = self._numerator * other._denominator + other._numerator * self._denominator
+            denominator = self._denominator * other._denominator
             new_numerator, new_denominator = Rational.reducedfraction(numerator, denominator)
-            return Rational(new_numerator, new_denominator)
-        elif isinstance(other, int) or isinstance(other, float):
+            return Rational._from_normalized(new_numerator, new_denominator)
+        elif isinstance(other, int):
+            return self.__add__(other)
+        elif isinstance(other, float):
             return self.__iadd__(Rational(other))
         else:
             return NotImplemented
@@ -224,8 +1275,9 @@ class Rational:
     def __isub__(self, other):
         """
         Оператор вычитания с присваиванием из рационального числа другого рационального числа или целого числа (int).
-        В случае целого числа предворительно преобразовывет его в рациональное.
-        Для типов данных, отличных от Rational и int, операция не определена.
+        Целое число обрабатывается без промежуточного объекта (как в соответствующем бинарном операторе),
+        вещественное (float) предварительно преобразуется в рациональное.
+        Для остальных типов данных операция не определена.
 
         :param other: Число, с которым проводится вычитание с присваиванием.
         :return: Результат вычитания с присваиванием –
@@ -234,14 +1286,13 @@ class Rational:
         """
 
         if isinstance(other, Rational):
-            numerator = self.__numerator * other.denominator - other.numerator * self.__denominator
-            denominator = self.__denominator * other.denominator
-            gcd_value = math.gcd(numerator, denominator)
-            numerator //= gcd_value
-            denominator //= gcd_value
+            numerator = self._numerator * other._denominator - other._numerator * self._denominator
+            denominator = self._denominator * other._denominator
             new_numerator, new_denominator = Rational.reducedfraction(numerator, denominator)
-            return Rational(new_numerator, new_denominator)
-        elif isinstance(other, int)  or isinstance(other, float):
+            return Rational._from_normalized(new_numerator, new_denominator)
+        elif isinstance(other, int):
+            return self.__sub__(other)
+        elif isinstance(other, float):
             return self.__isub__(Rational(other))
         else:
             return NotImplemented
@@ -249,8 +1300,9 @@ class Rational:
     def __imul__(self, other):
         """
         Оператор умножения с присваиванием рационального числа на другое рациональное число или целое число (int).
-        В случае целого числа предворительно преобразовывет его в рациональное.
-        Для типов данных, отличных от Rational и int, операция не определена.
+        Целое число обрабатывается без промежуточного объекта (как в соответствующем бинарном операторе),
+        вещественное (float) предварительно преобразуется в рациональное.
+        Для остальных типов данных операция не определена.
 
         :param other: Число, с которым проводится умножение с присваиванием.
         :return: Результат умножения с присваиванием –
@@ -259,14 +1311,13 @@ class Rational:
         """
 
         if isinstance(other, Rational):
-            numerator = self.__numerator * other.numerator
-            denominator = self.__denominator * other.denominator
-            gcd_value = math.gcd(numerator, denominator)
-            numerator //= gcd_value
-            denominator //= gcd_value
+            numerator = self._numerator * other._numerator
+            denominator = self._denominator * other._denominator
             new_numerator, new_denominator = Rational.reducedfraction(numerator, denominator)
-            return Rational(new_numerator, new_denominator)
-        elif isinstance(other, int)  or isinstance(other, float):
+            return Rational._from_normalized(new_numerator, new_denominator)
+        elif isinstance(other, int):
+            return self.__mul__(other)
+        elif isinstance(other, float):
             return self.__imul__(Rational(other))
         else:
             return NotImplemented
@@ -274,8 +1325,9 @@ class Rational:
     def __itruediv__(self, other):
         """
         Оператор деления с присваиванием рационального числа на другое рациональное число или целое число (int).
-        В случае целого числа предворительно преобразовывет его в рациональное.
-        Для типов данных, отличных от Rational и int, операция не определена.
+        Целое число обрабатывается без промежуточного объекта (как в соответствующем бинарном операторе),
+        вещественное (float) предварительно преобразуется в рациональное.
+        Для остальных типов данных операция не определена.
 
         :param other: Число, с которым проводится деление с присваиванием.
         :return: Результат деления с присваиванием –
@@ -284,20 +1336,31 @@ class Rational:
         """
 
         if isinstance(other, Rational):
-            if other.numerator == 0:
+            if other._numerator == 0:
                 raise ZeroDivisionError("Cannot divide by zero")
-            numerator = self.__numerator * other.denominator
-            denominator = self.__denominator * other.numerator
-            gcd_value = math.gcd(numerator, denominator)
-            numerator //= gcd_value
-            denominator //= gcd_value
+            numerator = self._numerator * other._denominator
+            denominator = self._denominator * other._numerator
             new_numerator, new_denominator = Rational.reducedfraction(numerator, denominator)
-            return Rational(new_numerator, new_denominator)
-        elif isinstance(other, int)  or isinstance(other, float):
+            return Rational._from_normalized(new_numerator, new_denominator)
+        elif isinstance(other, int):
+            return self.__truediv__(other)
+        elif isinstance(other, float):
             return self.__itruediv__(Rational(other))
         else:
             return NotImplemented
 
+    def __float__(self):
+        """
+        Оператор преобразования рационального числа в вещественное число (float).
+        Деление целых чисел в Python выполняется с корректным округлением и без промежуточного перевода
+        числителя и знаменателя в float, поэтому длинные числитель и знаменатель не вызывают переполнения.
+        OverflowError возникает, только если само число не представимо в float.
+
+        :return: Число типа float, ближайшее к рациональному числу.
+        """
+
+        return self._numerator / self._denominator
+
     def __neg__(self):
         """
         Оператор отрицания рационального числа (умножение на -1).
@@ -305,8 +1368,16 @@ class Rational:
         :return: Результат отрицания – рациональное число противоположного знака.
         """
 
-        self.__numerator = -self.__numerator
-        return self
+        return Rational._from_normalized(-self._numerator, self._denominator)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Rational objects are immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError("Rational objects are immutable.")
+
+    def __reduce__(self):
+        return Rational._from_normalized, (self._numerator, self._denominator)
 
     def __str__(self):
         """
@@ -315,7 +1386,7 @@ class Rational:
         :return: Объект типа str в формате "числитель/знаменатель".
         """
 
-        return f"{self.__numerator}/{self.__denominator}"
+        return f"{self._numerator}/{self._denominator}"
 
     def __repr__(self):
         """
@@ -324,5 +1395,9 @@ class Rational:
         :return: Объект типа str в формате "Rational(числитель, знаменатель)".
         """
 
-        return f"Rational({self.__numerator}, {self.__denominator})"
+        return f"Rational({self._numerator}, {self._denominator})"
+
 
+# Слоты неизменяемых объектов заполняются через дескрипторы слотов в обход запрещенного __setattr__
+_set_numerator = Rational._numerator.__set__
+_set_denominator = Rational._denominator.__set__
@@ -0,0 +1,514 @@
+import numpy as np
+from rational import Rational
+
+# Столбцы int64 используются, пока модуль значений не превышает этой границы;
+# запас в один бит оставлен, чтобы смена знака и сравнение не переполнялись.
+_INT64_BITS = 62
+
+
+def _bits(column):
+    """
+    Возвращает верхнюю оценку количества бит, занимаемых значениями столбца (по модулю).
+
+    :param column: Столбец целых чисел (np.ndarray типа int64 или object).
+    :return: Число типа int – максимальная длина значения столбца в битах.
+    """
+
+    if len(column) == 0:
+        return 0
+    return max(int(column.max()), -int(column.min())).bit_length()
+
+
+def _pack(column):
+    """
+    Приводит столбец целых чисел к компактному виду:
+    если все значения помещаются в int64, столбец хранится как int64, иначе – как массив object (длинные int).
+
+    :param column: Столбец целых чисел (np.ndarray типа int64 или object).
+    :return: Столбец типа np.ndarray (int64 или object).
+    """
+
+    if column.dtype == object and _bits(column) <= _INT64_BITS:
+        return column.astype(np.int64)
+    return column
+
+
+def _column(values):
+    """
+    Проверяет, что последовательность состоит из целых чисел, и упаковывает ее в столбец.
+
+    :param values: Последовательность целых чисел или одномерный np.ndarray целого типа.
+    :return: Столбец типа np.ndarray (int64 или object).
+    """
+
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+        if values.ndim != 1:
+            raise ValueError("RationalArray columns must be one-dimensional.")
+        if values.dtype.kind == "i" or len(values) == 0 or int(values.max()) <= 2 ** _INT64_BITS:
+            return values.astype(np.int64)
+        values = values.astype(object)
+
+    column = np.array(values, dtype=object)
+    if column.ndim != 1:
+        raise ValueError("RationalArray columns must be one-dimensional.")
+    for value in column:
+        if not isinstance(value, (int, np.integer)):
+            raise TypeError("Numerators and denominators must be integers.")
+    if len(column) == 0:
+        return np.zeros(0, dtype=np.int64)
+    return _pack(np.array([int(value) for value in column], dtype=object))
+
+
+def _widen(left, right, bits):
+    """
+    Выбирает тип для вычисления результата операции над двумя столбцами.
+    Если результат может не поместиться в int64, оба столбца переводятся в длинную арифметику (object).
+
+    :param left: Первый столбец.
+    :param right: Второй столбец.
+    :param bits: Оценка длины результата в битах.
+    :return: Пара столбцов одного типа, в котором результат вычисляется без переполнения.
+    """
+
+    if bits <= _INT64_BITS and left.dtype == np.int64 and right.dtype == np.int64:
+        return left, right
+    return left.astype(object), right.astype(object)
+
+
+class RationalArray:
+    """
+    Класс массива рациональных чисел.
+    Числители и знаменатели хранятся в двух упакованных столбцах (np.ndarray типа int64),
+    которые автоматически переводятся в длинную арифметику (object) при угрозе переполнения.
+
+    Все операции выполняются поэлементно над целыми столбцами сразу,
+    а сокращение дробей производится векторизованным вычислением НОД.
+    Знаменатели всегда положительны, дроби всегда несократимы.
+    """
+
+    def __init__(self, values=()):
+        """
+        Метод инициализации объекта класса RationalArray (массива рациональных чисел).
+        Принимает в себя последовательность чисел типа Rational или int.
+
+        :param values: Последовательность рациональных (Rational) или целых (int) чисел.
+        """
+
+        numerators = []
+        denominators = []
+        for value in values:
+            if isinstance(value, Rational):
+                numerators.append(value.numerator)
+                denominators.append(value.denominator)
+            elif isinstance(value, int):
+                numerators.append(value)
+                denominators.append(1)
+            else:
+                raise TypeError("RationalArray elements must be Rational or int.")
+        self.__numerators = _column(numerators)
+        self.__denominators = _column(denominators)
+
+    @classmethod
+    def from_columns(cls, numerators, denominators=None):
+        """
+        Метод создания массива рациональных чисел из столбцов числителей и знаменателей.
+        Если это возможно, сокращает дроби.
+
+        :param numerators: Последовательность числителей – целых чисел.
+        :param denominators: Последовательность знаменателей – целых чисел, не равных нулю
+            (по умолчанию все знаменатели равны 1).
+        :return: Объект класса RationalArray.
+        """
+
+        numerators = _column(numerators)
+        if denominators is None:
+            denominators = np.ones(len(numerators), dtype=np.int64)
+        else:
+            denominators = _column(denominators)
+        if len(numerators) != len(denominators):
+            raise ValueError("Numerators and denominators must be of equal length.")
+        if np.any(denominators == 0):
+            raise ValueError("Denominator cannot be zero.")
+        return cls._normalized(numerators, denominators)
+
+    @classmethod
+    def _from_packed(cls, numerators, denominators):
+        """
+        Внутренний метод создания массива из уже упакованных и сокращенных столбцов без каких-либо проверок.
+        """
+
+        array = cls.__new__(cls)
+        array.__numerators = numerators
+        array.__denominators = denominators
+        return array
+
+    @classmethod
+    def _normalized(cls, numerators, denominators):
+        """
+        Внутренний метод создания массива из произвольных столбцов:
+        делает знаменатели положительными, сокращает дроби векторизованным НОД и упаковывает столбцы.
+        """
+
+        negative = denominators < 0
+        if np.any(negative):
+            numerators = np.where(negative, -numerators, numerators)
+            denominators = np.where(negative, -denominators, denominators)
+        gcd_values = np.gcd(numerators, denominators)
+        return cls._from_packed(_pack(numerators // gcd_values), _pack(denominators // gcd_values))
+
+    @staticmethod
+    def concatenate(arrays):
+        """
+        Статический метод объединения нескольких массивов рациональных чисел в один.
+
+        :param arrays: Последовательность объектов класса RationalArray.
+        :return: Объект класса RationalArray.
+        """
+
+        arrays = list(arrays)
+        if not arrays:
+            return RationalArray()
+        numerators = [array.__numerators for array in arrays]
+        denominators = [array.__denominators for array in arrays]
+        if any(column.dtype == object for column in numerators + denominators):
+            numerators = [column.astype(object) for column in numerators]
+            denominators = [column.astype(object) for column in denominators]
+        return RationalArray._from_packed(np.concatenate(numerators), np.concatenate(denominators))
+
+    @staticmethod
+    def _columns(other):
+        """
+        Статический метод представления операнда в виде пары столбцов (числители, знаменатели).
+
+        :param other: Операнд – RationalArray, Rational или int.
+        :return: Пара столбцов или NotImplemented, если операция для данного типа не определена.
+        """
+
+        if isinstance(other, RationalArray):
+            return other.__numerators, other.__denominators
+        if isinstance(other, Rational):
+            return _column([other.numerator]), _column([other.denominator])
+        if isinstance(other, int):
+            return _column([other]), np.ones(1, dtype=np.int64)
+        return NotImplemented
+
+    def _check_length(self, other_numerators):
+        # Массив длины 1 (в том числе число Rational или int) распространяется на всю длину другого операнда
+        if len(other_numerators) != len(self) and len(other_numerators) != 1 and len(self) != 1:
+            raise ValueError("RationalArray operands must have equal length.")
+
+    @property
+    def numerators(self):
+        return self.__numerators.copy()
+
+    @property
+    def denominators(self):
+        return self.__denominators.copy()
+
+    @property
+    def dtype(self):
+        """
+        Тип хранения столбцов: np.int64 для компактного представления или object для длинной арифметики.
+        """
+
+        return self.__numerators.dtype if self.__numerators.dtype == object else self.__denominators.dtype
+
+    def __len__(self):
+        return len(self.__numerators)
+
+    def __getitem__(self, index):
+        """
+        Оператор доступа к элементу (или срезу) массива.
+
+        :param index: Индекс (int) или срез (slice).
+        :return: Число типа Rational для индекса или объект класса RationalArray для среза.
+        """
+
+        if isinstance(index, slice):
+            return RationalArray._from_packed(self.__numerators[index], self.__denominators[index])
+        return Rational._from_normalized(int(self.__numerators[index]), int(self.__denominators[index]))
+
+    def __iter__(self):
+        for numerator, denominator in zip(self.__numerators, self.__denominators):
+            yield Rational._from_normalized(int(numerator), int(denominator))
+
+    def to_float(self):
+        """
+        Метод преобразования массива в массив вещественных чисел.
+        Если числители и знаменатели представимы в float точно (не длиннее 53 бит),
+        деление выполняется векторизованно, иначе – поэлементно с правильным округлением.
+
+        :return: Массив np.ndarray типа float64.
+        """
+
+        if self.dtype == np.int64 and _bits(self.__numerators) <= 53 and _bits(self.__denominators) <= 53:
+            return self.__numerators.astype(np.float64) / self.__denominators.astype(np.float64)
+        return np.array([int(numerator) / int(denominator)
+                         for numerator, denominator in zip(self.__numerators, self.__denominators)], dtype=np.float64)
+
+    def to_list(self):
+        """
+        Метод преобразования массива в список рациональных чисел.
+
+        :return: Список объектов класса Rational.
+        """
+
+        return list(self)
+
+    def _add(self, other, sign):
+        columns = RationalArray._columns(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        other_numerators, other_denominators = columns
+        self._check_length(other_numerators)
+        # Оцениваются и перекрестные произведения числителей, и произведение знаменателей
+        bits = max(_bits(self.__numerators) + _bits(other_denominators) + 1,
+                   _bits(other_numerators) + _bits(self.__denominators) + 1,
+                   _bits(self.__denominators) + _bits(other_denominators))
+        numerators, other_denominators = _widen(self.__numerators, other_denominators, bits)
+        other_numerators, denominators = _widen(other_numerators, self.__denominators, bits)
+        if sign < 0:
+            other_numerators = -other_numerators
+        return RationalArray._normalized(numerators * other_denominators + other_numerators * denominators,
+                                         denominators * other_denominators)
+
+    def __add__(self, other):
+        """
+        Оператор поэлементного сложения массива рациональных чисел с другим массивом той же длины,
+        рациональным числом (Rational) или целым числом (int).
+
+        :param other: Число или массив, с которым происходит сложение.
+        :return: Результат сложения – новый объект класса RationalArray или ошибка неопределенности операции.
+        """
+
+        return self._add(other, 1)
+
+    def __radd__(self, other):
+        return self._add(other, 1)
+
+    def __sub__(self, other):
+        """
+        Оператор поэлементного вычитания из массива рациональных чисел другого массива той же длины,
+        рационального числа (Rational) или целого числа (int).
+
+        :param other: Число или массив, которое вычитается.
+        :return: Результат вычитания – новый объект класса RationalArray или ошибка неопределенности операции.
+        """
+
+        return self._add(other, -1)
+
+    def __rsub__(self, other):
+        result = self._add(other, -1)
+        if result is NotImplemented:
+            return NotImplemented
+        return -result
+
+    def __mul__(self, other):
+        """
+        Оператор поэлементного умножения массива рациональных чисел на другой массив той же длины,
+        рациональное число (Rational) или целое число (int).
+
+        :param other: Число или массив, на которое происходит умножение.
+        :return: Результат умножения – новый объект класса RationalArray или ошибка неопределенности операции.
+        """
+
+        columns = RationalArray._columns(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        other_numerators, other_denominators = columns
+        self._check_length(other_numerators)
+        bits = max(_bits(self.__numerators) + _bits(other_numerators),
+                   _bits(self.__denominators) + _bits(other_denominators))
+        numerators, other_numerators = _widen(self.__numerators, other_numerators, bits)
+        denominators, other_denominators = _widen(self.__denominators, other_denominators, bits)
+        return RationalArray._normalized(numerators * other_numerators, denominators * other_denominators)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        """
+        Оператор поэлементного деления массива рациональных чисел на другой массив той же длины,
+        рациональное число (Rational) или целое число (int), не содержащие нулей.
+
+        :param other: Число или массив, на которое происходит деление.
+        :return: Результат деления – новый объект класса RationalArray или ошибка неопределенности операции.
+        """
+
+        columns = RationalArray._columns(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        other_numerators, other_denominators = columns
+        self._check_length(other_numerators)
+        if np.any(other_numerators == 0):
+            raise ZeroDivisionError("Cannot divide by zero")
+        return self * RationalArray._from_packed(other_denominators, other_numerators)
+
+    def __rtruediv__(self, other):
+        columns = RationalArray._columns(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        if np.any(self.__numerators == 0):
+            raise ZeroDivisionError("Cannot divide by zero")
+        return RationalArray._from_packed(self.__denominators, self.__numerators) * other
+
+    def __neg__(self):
+        """
+        Оператор поэлементного отрицания массива рациональных чисел.
+
+        :return: Новый объект класса RationalArray с элементами противоположного знака.
+        """
+
+        return RationalArray._from_packed(-self.__numerators, self.__denominators.copy())
+
+    def _compare(self, other):
+        """
+        Внутренний метод сравнения: возвращает пару столбцов, сравнение которых эквивалентно сравнению массивов
+        (знаменатели положительны, поэтому достаточно перекрестного умножения).
+        """
+
+        columns = RationalArray._columns(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        other_numerators, other_denominators = columns
+        self._check_length(other_numerators)
+        bits = max(_bits(self.__numerators) + _bits(other_denominators),
+                   _bits(other_numerators) + _bits(self.__denominators))
+        numerators, other_denominators = _widen(self.__numerators, other_denominators, bits)
+        other_numerators, denominators = _widen(other_numerators, self.__denominators, bits)
+        return numerators * other_denominators, other_numerators * denominators
+
+    def __eq__(self, other):
+        """
+        Оператор поэлементной проверки равенства.
+        Так как дроби несократимы, достаточно сравнить числители и знаменатели.
+
+        :param other: Массив той же длины, рациональное число (Rational) или целое число (int).
+        :return: Массив np.ndarray логических значений или ошибка неопределенности операции.
+        """
+
+        columns = RationalArray._columns(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        other_numerators, other_denominators = columns
+        self._check_length(other_numerators)
+        return (self.__numerators == other_numerators) & (self.__denominators == other_denominators)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        return ~result
+
+    def __lt__(self, other):
+        """
+        Операторы поэлементного сравнения (<, <=, >, >=) с массивом той же длины,
+        рациональным числом (Rational) или целым числом (int).
+
+        :return: Массив np.ndarray логических значений или ошибка неопределенности операции.
+        """
+
+        columns = self._compare(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        return np.asarray(columns[0] < columns[1], dtype=bool)
+
+    def __le__(self, other):
+        columns = self._compare(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        return np.asarray(columns[0] <= columns[1], dtype=bool)
+
+    def __gt__(self, other):
+        columns = self._compare(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        return np.asarray(columns[0] > columns[1], dtype=bool)
+
+    def __ge__(self, other):
+        columns = self._compare(other)
+        if columns is NotImplemented:
+            return NotImplemented
+        return np.asarray(columns[0] >= columns[1], dtype=bool)
+
+    __hash__ = None
+
+    def _reduce(self, operation, empty):
+        """
+        Внутренний метод свертки массива попарным (древовидным) применением операции:
+        на каждом шаге первая половина массива поэлементно объединяется со второй,
+        поэтому требуется лишь log2(n) векторизованных операций.
+        """
+
+        if len(self) == 0:
+            return empty
+        array = self
+        while len(array) > 1:
+            half = len(array) // 2
+            head = operation(array[:half], array[half:2 * half])
+            if len(array) % 2:
+                head = RationalArray.concatenate((head, array[-1:]))
+            array = head
+        return array[0]
+
+    def sum(self):
+        """
+        Метод суммирования элементов массива.
+
+        :return: Число типа Rational – сумма всех элементов (0 для пустого массива).
+        """
+
+        return self._reduce(RationalArray.__add__, Rational(0))
+
+    def prod(self):
+        """
+        Метод перемножения элементов массива.
+
+        :return: Число типа Rational – произведение всех элементов (1 для пустого массива).
+        """
+
+        return self._reduce(RationalArray.__mul__, Rational(1))
+
+    def min(self):
+        """
+        Метод поиска наименьшего элемента массива.
+
+        :return: Число типа Rational – наименьший элемент.
+        """
+
+        if len(self) == 0:
+            raise ValueError("min() of an empty RationalArray")
+        return self._reduce(lambda left, right: RationalArray._select(left, right, left <= right), None)
+
+    def max(self):
+        """
+        Метод поиска наибольшего элемента массива.
+
+        :return: Число типа Rational – наибольший элемент.
+        """
+
+        if len(self) == 0:
+            raise ValueError("max() of an empty RationalArray")
+        return self._reduce(lambda left, right: RationalArray._select(left, right, left >= right), None)
+
+    @staticmethod
+    def _select(left, right, mask):
+        numerators = np.where(mask, left.__numerators, right.__numerators)
+        denominators = np.where(mask, left.__denominators, right.__denominators)
+        return RationalArray._from_packed(_pack(numerators), _pack(denominators))
+
+    def __str__(self):
+        """
+        Оператор удобного представления массива рациональных чисел в виде объекта типа str
+        в формате "[числитель/знаменатель, ...]".
+        """
+
+        return "[" + ", ".join(f"{n}/{d}" for n, d in zip(self.__numerators, self.__denominators)) + "]"
+
+    def __repr__(self):
+        """
+        Оператор формального представления массива рациональных чисел в виде объекта типа str
+        в формате "RationalArray([Rational(числитель, знаменатель), ...])".
+        """
+
+        return "RationalArray([" + ", ".join(f"Rational({n}, {d})" for n, d in zip(self.__numerators, self.__denominators)) + "])"
@@ -0,0 +1,102 @@
+import unittest
+from fractions import Fraction
+from rational import Rational, localcontext
+from complex import Complex
+from accumulators import RationalAccumulator, ComplexAccumulator
+
+class TestRationalAccumulator(unittest.TestCase):
+
+    # Тесты накопления
+    def test_operations(self):
+        total = RationalAccumulator(Rational(1, 2))
+        total += Rational(1, 3)
+        total += 2
+        total -= Rational(1, 6)
+        self.assertEqual(total.value, Rational(8, 3))
+        total *= Rational(3, 4)
+        self.assertEqual(total.value, Rational(2))
+        total /= Rational(-4, 5)
+        self.assertEqual(total.value, Rational(-5, 2))
+        total += 0.25
+        self.assertEqual(total.value, Rational(-9, 4))
+
+    def test_in_place(self):
+        total = RationalAccumulator()
+        same = total
+        total += 1
+        total *= 3
+        self.assertIs(total, same)
+
+    def test_lazy_reduction_matches_fraction(self):
+        for reduce_bits in (1, 64, 1024):
+            total = RationalAccumulator(reduce_bits=reduce_bits)
+            expected = Fraction(0)
+            for k in range(1, 200):
+                total += Rational(k, k + 1)
+                total.add_product(Rational(1, k), Rational(-k, 3))
+                expected += Fraction(k, k + 1) - Fraction(1, 3)
+            self.assertEqual(total.value, Rational(expected.numerator, expected.denominator))
+        self.assertEqual(float(total), float(expected))
+
+    def test_value_respects_context(self):
+        total = RationalAccumulator(Rational(1, 3))
+        total += Rational(1, 1009)
+        with localcontext(max_denominator=10):
+            self.assertEqual(total.value, Rational(1, 3))
+        self.assertEqual(total.value, Rational(1012, 3027))
+
+    # Тесты обработки ошибок
+    def test_invalid_operations(self):
+        total = RationalAccumulator()
+        with self.assertRaises(TypeError):
+            total += "1"
+        with self.assertRaises(ZeroDivisionError):
+            total /= 0
+        with self.assertRaises(TypeError):
+            RationalAccumulator(Complex(1, 1))
+        with self.assertRaises(ValueError):
+            RationalAccumulator(reduce_bits=0)
+
+
+class TestComplexAccumulator(unittest.TestCase):
+
+    # Тесты накопления
+    def test_operations(self):
+        total = ComplexAccumulator(Complex(1, 2))
+        total += Complex(Rational(1, 2), Rational(-1, 3))
+        total -= Rational(1, 2)
+        self.assertEqual(total.value, Complex(1, Rational(5, 3)))
+        total *= Complex(0, 3)
+        self.assertEqual(total.value, Complex(-5, 3))
+        total /= Complex(-5, 3)
+        self.assertEqual(total.value, Complex(1, 0))
+        total /= Rational(-2, 3)
+        self.assertEqual(total.value, Complex(Rational(-3, 2), 0))
+        self.assertEqual(complex(total), complex(-1.5, 0))
+
+    def test_matches_immutable_arithmetic(self):
+        values = [Complex(Rational(k, 7), Rational(-1, k)) for k in range(1, 60)]
+        for reduce_bits in (1, 1024):
+            total = ComplexAccumulator(reduce_bits=reduce_bits)
+            product = ComplexAccumulator(1, reduce_bits=reduce_bits)
+            dot = ComplexAccumulator(reduce_bits=reduce_bits)
+            for value in values:
+                total += value
+                product *= value
+                dot.add_product(value, Rational(1, 3))
+            self.assertEqual(total.value, Complex.sum(values))
+            self.assertEqual(product.value, Complex.prod(values))
+            self.assertEqual(dot.value, Complex.sum(values) / 3)
+
+    # Тесты обработки ошибок
+    def test_invalid_operations(self):
+        total = ComplexAccumulator()
+        with self.assertRaises(TypeError):
+            total *= "1"
+        with self.assertRaises(ZeroDivisionError):
+            total /= Complex(0, 0)
+        with self.assertRaises(TypeError):
+            ComplexAccumulator([1])
+
+if __name__ == '__main__':
+    unittest.main()
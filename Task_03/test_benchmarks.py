@@ -0,0 +1,39 @@
+import unittest
+import json
+import os
+import tempfile
+from benchmarks import benchmark_cases, compare_results, run_benchmarks, main
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_cases_are_reproducible(self):
+        first = benchmark_cases(sizes=(9,))
+        second = benchmark_cases(sizes=(9,))
+        self.assertEqual(first.keys(), second.keys())
+        self.assertEqual(first["Rational.__add__[9]"](), second["Rational.__add__[9]"]())
+
+    def test_run_selected_cases(self):
+        report = run_benchmarks(sizes=(9,), names=["Rational.__add__"], min_time=0.001, repeat=1)
+        self.assertEqual(list(report["results"]), ["Rational.__add__[9]"])
+        self.assertGreater(report["results"]["Rational.__add__[9]"], 0)
+
+    def test_compare_results(self):
+        baseline = {"results": {"a": 1.0, "b": 1.0, "c": 1.0, "d": None}}
+        current = {"results": {"a": 1.05, "b": 1.5, "c": 3.0, "d": 1.0}}
+        regressions = compare_results(baseline, current, threshold=0.1)
+        self.assertEqual([name for name, _, _, _ in regressions], ["c", "b"])
+        self.assertEqual(compare_results(baseline, current, threshold=5), [])
+
+    def test_compare_command(self):
+        with tempfile.TemporaryDirectory() as directory:
+            baseline = os.path.join(directory, "baseline.json")
+            current = os.path.join(directory, "current.json")
+            with open(baseline, "w") as file:
+                json.dump({"results": {"a": 1.0}}, file)
+            with open(current, "w") as file:
+                json.dump({"results": {"a": 2.0}}, file)
+            self.assertEqual(main(["compare", baseline, current]), 1)
+            self.assertEqual(main(["compare", baseline, baseline]), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import io
+import os
+import tempfile
+from rational import Rational
+from complex import Complex
+from codec import encode, decode, Writer, Reader, TAG_RATIONAL, TAG_COMPLEX
+
+class TestCodec(unittest.TestCase):
+
+    # Тесты кодирования отдельных значений
+    def test_encode_rational(self):
+        self.assertEqual(bytes(encode(Rational(1, 2))), bytes([TAG_RATIONAL, 2, 2]))
+        self.assertEqual(bytes(encode(Rational(-1, 2))), bytes([TAG_RATIONAL, 1, 2]))
+        self.assertEqual(bytes(encode(Rational(64, 203))), bytes([TAG_RATIONAL, 0x80, 0x01, 0xcb, 0x01]))
+        self.assertEqual(bytes(encode(5)), bytes([TAG_RATIONAL, 10, 1]))
+
+    def test_encode_complex(self):
+        self.assertEqual(bytes(encode(Complex(Rational(1, 2), -3))), bytes([TAG_COMPLEX, 2, 2, 5, 1]))
+
+    def test_round_trip(self):
+        values = [Rational(0), Rational(-7, 3), Rational(2 ** 63, 3 ** 40), Rational(-(3 ** 5000), 2 ** 4000 + 1),
+                  Complex(Rational(1, 3), Rational(-(10 ** 300), 7)), Complex(0, 0)]
+        for value in values:
+            data = encode(value)
+            self.assertEqual(decode(data), (value, len(data)))
+
+    def test_varint_boundaries(self):
+        for numerator in (63, 64, 2 ** 55, 2 ** 127, 2 ** 255, 2 ** 256, 2 ** 1000 - 1):
+            for value in (Rational(numerator), Rational(-numerator, numerator + 2 if numerator % 2 else numerator + 1)):
+                self.assertEqual(decode(encode(value))[0], value)
+
+    def test_untrusted_values_are_normalized(self):
+        data = bytes([TAG_RATIONAL, 4, 4])
+        self.assertEqual(decode(data, trusted=False)[0], Rational(1, 2))
+        self.assertEqual(decode(data, trusted=False)[0].denominator, 2)
+        self.assertEqual(decode(data)[0].denominator, 2)
+        self.assertEqual(list(Reader(data)), [Rational(1, 2)])
+
+    # Тесты потоковой записи и чтения
+    def test_writer_reader(self):
+        values = [Rational(k, k + 100) for k in range(-50, 50)] + [Complex(k, Rational(1, k)) for k in range(1, 50)]
+        stream = io.BytesIO()
+        with Writer(stream, buffer_size=64) as writer:
+            writer.write_all(values)
+        self.assertEqual(writer.count, len(values))
+        self.assertEqual(list(Reader(stream.getvalue())), values)
+
+    def test_reader_is_lazy(self):
+        data = encode(Rational(1, 2)) + encode(Complex(0, 1)) + bytes([7])
+        values = Reader(memoryview(data)).iter_from()
+        self.assertEqual(next(values), (0, Rational(1, 2)))
+        self.assertEqual(next(values), (3, Complex(0, 1)))
+        with self.assertRaises(ValueError):
+            next(values)
+
+    def test_reader_mmap(self):
+        values = [Rational(3 ** 700, 2 ** 900), Complex(Rational(-1, 2), 5), Rational(0)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "values.bin")
+            with open(path, "wb") as file, Writer(file) as writer:
+                writer.write_all(values)
+            with Reader.open(path) as reader:
+                self.assertEqual(list(reader), values)
+            empty = os.path.join(directory, "empty.bin")
+            open(empty, "wb").close()
+            with Reader.open(empty) as reader:
+                self.assertEqual(list(reader), [])
+
+    # Тесты обработки ошибок
+    def test_invalid_data(self):
+        with self.assertRaises(ValueError):
+            decode(bytes([TAG_RATIONAL, 0x80]))
+        with self.assertRaises(ValueError):
+            decode(bytes([TAG_COMPLEX, 2, 2]))
+        with self.assertRaises(ValueError):
+            decode(bytes([TAG_RATIONAL]) + b"\x80" * 20)
+        with self.assertRaises(ValueError):
+            decode(bytes([9, 2, 2]))
+        with self.assertRaises(TypeError):
+            encode(0.5)
+
+    def test_zero_denominator(self):
+        for data in (bytes([TAG_RATIONAL, 2, 0]), bytes([TAG_COMPLEX, 2, 2, 2, 0x80, 0x00])):
+            for trusted in (False, True):
+                with self.assertRaises(ValueError):
+                    decode(data, trusted=trusted)
+        with self.assertRaises(ValueError):
+            list(Reader(encode(Rational(1, 2)) + bytes([TAG_RATIONAL, 4, 0])))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 from rational import Rational
 from complex import Complex
 import math
+import pickle
 
 class TestComplex(unittest.TestCase):
 
@@ -60,6 +61,23 @@ class TestComplex(unittest.TestCase):
         with self.assertRaises(ZeroDivisionError):
             Complex(3, 4) / 0
 
+    def test_reflected_operations(self):
+        c = Complex(1, 2)
+        self.assertEqual(2 + c, Complex(3, 2))
+        self.assertEqual(Rational(1, 2) - c, Complex(Rational(-1, 2), -2))
+        self.assertEqual(3 * c, Complex(3, 6))
+        self.assertEqual(Rational(1, 2) * c, Complex(Rational(1, 2), 1))
+        self.assertEqual(5 / c, Complex(1, -2))
+        self.assertEqual(0.5 + c, Complex(Rational(3, 2), 2))
+        self.assertEqual(sum([Complex(1, 2), Complex(Rational(1, 2), -1)]), Complex(Rational(3, 2), 1))
+        with self.assertRaises(ZeroDivisionError):
+            1 / Complex(0, 0)
+
+    def test_scalar_operations_reuse_parts(self):
+        c = Complex(Rational(1, 2), Rational(1, 3))
+        self.assertIs((c + 1).imaginary, c.imaginary)
+        self.assertIs((c - Rational(1, 2)).imaginary, c.imaginary)
+
     # Тесты операций с присваиванием
     def test_iadd(self):
         c = Complex(1, 2)
@@ -75,6 +93,26 @@ class TestComplex(unittest.TestCase):
         c *= 3
         self.assertEqual(c, Complex(-6, 3))
 
+    # Тесты суммирования и перемножения последовательностей
+    def test_sum(self):
+        values = [Complex(Rational(1, k), Rational(-1, k + 1)) for k in range(1, 6)]
+        self.assertEqual(Complex.sum(values), Complex(Rational(137, 60), Rational(-29, 20)))
+        self.assertEqual(Complex.sum([Complex(1, 2), Rational(1, 2), 3]), Complex(Rational(9, 2), 2))
+        self.assertEqual(Complex.sum([]), Complex(0, 0))
+
+    def test_prod(self):
+        self.assertEqual(Complex.prod([Complex(0, 1)] * 4), Complex(1, 0))
+        values = [Complex(Rational(1, 2), Rational(1, 3)), Complex(2, -1), Rational(3, 4), 2]
+        expected = Complex(Rational(1, 2), Rational(1, 3)) * Complex(2, -1) * Rational(3, 4) * 2
+        self.assertEqual(Complex.prod(values), expected)
+        self.assertEqual(Complex.prod([]), Complex(1, 0))
+
+    def test_sum_prod_invalid(self):
+        with self.assertRaises(TypeError):
+            Complex.sum([Complex(1, 2), 0.5])
+        with self.assertRaises(TypeError):
+            Complex.prod([1j])
+
     # Тесты операций сравнения
     def test_eq(self):
         self.assertEqual(Complex(2, 0), 2)
@@ -83,6 +121,28 @@ class TestComplex(unittest.TestCase):
         with self.assertRaises(TypeError):
             Complex(1, 2) == "invalid"
 
+    def test_eq_builtin_complex(self):
+        self.assertEqual(Complex(Rational(3, 2), -2), complex(1.5, -2))
+        self.assertNotEqual(Complex(1, 2), complex(1, 3))
+
+    # Тесты хеширования и интернирования
+    def test_hash_consistent_with_builtins(self):
+        self.assertEqual(hash(Complex(Rational(3, 2), Rational(5, 2))), hash(complex(1.5, 2.5)))
+        self.assertEqual(hash(Complex(0, -1)), hash(-1j))
+        self.assertEqual(hash(Complex(2, 0)), hash(2))
+        self.assertEqual(hash(Complex(Rational(1, 3), 0)), hash(Rational(1, 3)))
+
+    def test_hashable_collections(self):
+        values = {Complex(1, 2): "a", Complex(Rational(1, 2), 0): "b"}
+        self.assertEqual(values[Complex(Rational(2, 2), Rational(4, 2))], "a")
+        self.assertEqual(values[Rational(1, 2)], "b")
+        self.assertEqual(len({Complex(0, 1), Complex(0, 1), Complex(1, 0)}), 2)
+
+    def test_interned(self):
+        self.assertIs(Complex.interned(0, 1), Complex.interned(0, 1))
+        self.assertIs(Complex.interned(Rational(1, 2)), Complex.interned(Rational(1, 2), 0))
+        self.assertEqual(Complex.interned(0, -1), Complex(0, -1))
+
     # Тесты операций взятия модуля и аргумента
     def test_abs(self):
         self.assertAlmostEqual(abs(Complex(3, 4)), 5.0)
@@ -94,6 +154,45 @@ class TestComplex(unittest.TestCase):
         self.assertAlmostEqual(Complex(-1, 0).arg(), math.pi)
         self.assertAlmostEqual(Complex(0, 5).arg(), math.pi/2)
 
+    def test_abs_arg_large_parts(self):
+        c = Complex(Rational(3 * 10 ** 400, 7), Rational(4 * 10 ** 400, 7))
+        self.assertAlmostEqual(c.arg(), math.atan2(4, 3))
+        self.assertAlmostEqual(abs(c / 10 ** 400), 5 / 7)
+        with self.assertRaises(OverflowError):
+            abs(c)
+        c = Complex(Rational(3 * 10 ** 500 + 1, 10 ** 500), Rational(4 * 7 ** 600, 7 ** 600))
+        self.assertAlmostEqual(abs(c), 5.0)
+        self.assertAlmostEqual(abs(Complex(Rational(3, 10 ** 200), Rational(4, 10 ** 200))), 5e-200)
+        self.assertAlmostEqual(Complex(Rational(1, 10 ** 200), Rational(-1, 10 ** 200)).arg(), -math.pi / 4)
+
+    def test_abs_exact(self):
+        self.assertEqual(Complex(3, 4).abs_exact(), Rational(5))
+        self.assertEqual(Complex(Rational(5, 13), Rational(-12, 13)).abs_exact(), Rational(1))
+        self.assertEqual(Complex(Rational(3, 10 ** 300), Rational(4, 10 ** 300)).abs_exact(), Rational(5, 10 ** 300))
+        self.assertIsNone(Complex(1, 1).abs_exact())
+
+    def test_abs_digits(self):
+        self.assertEqual(Complex(1, 1).abs(30), Rational(1414213562373095048801688724209, 10 ** 30))
+        self.assertEqual(Complex(3, 4).abs(5), Rational(5))
+        self.assertEqual(Complex(-2, -3).abs(), abs(Complex(-2, -3)))
+        with self.assertRaises(ValueError):
+            Complex(1, 1).abs(-1)
+
+    def test_arg_digits(self):
+        pi = Rational(314159265358979323846264338327950288419716939937511, 10 ** 50)
+        self.assertEqual(Complex(-1, 0).arg(50), pi)
+        self.assertEqual(Complex(0, -3).arg(20), -Rational(157079632679489661923, 10 ** 20))
+        self.assertEqual(Complex(1, 1).arg(20), Rational(78539816339744830962, 10 ** 20))
+        self.assertEqual(Complex(0, 0).arg(10), Rational(0))
+        for c in (Complex(Rational(7, 3), Rational(-2, 11)), Complex(-5, 2), Complex(Rational(-1, 9), -40)):
+            self.assertAlmostEqual(float(c.arg(30)), c.arg(), places=14)
+        with self.assertRaises(ValueError):
+            Complex(1, 1).arg(2.5)
+
+    def test_complex_conversion(self):
+        self.assertEqual(complex(Complex(Rational(1, 2), -3)), complex(0.5, -3))
+        self.assertEqual(complex(Complex(Rational(10 ** 400 + 1, 10 ** 400), 0)), complex(1, 0))
+
     # Тесты возведения в натуральную степень
     def test_power(self):
         c = Complex(1, 1)
@@ -103,12 +202,56 @@ class TestComplex(unittest.TestCase):
         c_zero = Complex(0, 0)
         self.assertEqual(c_zero.power(5), Complex(0, 0))
 
+    def test_power_exact_high(self):
+        c = Complex(1, 1)
+        self.assertEqual(c.power(100), Complex(-2 ** 50, 0))
+        self.assertEqual(Complex(3, 4).power(0), Complex(1, 0))
+        self.assertEqual(Complex(Rational(1, 2), Rational(-1, 3)).power(2), Complex(Rational(5, 36), Rational(-1, 3)))
+
+    def test_power_negative(self):
+        self.assertEqual(Complex(1, 1).power(-2), Complex(0, Rational(-1, 2)))
+        self.assertEqual(Complex(0, 2).power(-1), Complex(0, Rational(-1, 2)))
+        with self.assertRaises(ZeroDivisionError):
+            Complex(0, 0).power(-1)
+
+    def test_power_approximate(self):
+        self.assertEqual(Complex(1, 1).power(3, approximate=True), Complex(-2, 2))
+        self.assertEqual(Complex(-2, -3).power(2, approximate=True), Complex(-5, 12))
+
+    def test_powers(self):
+        z = Complex(Rational(1, 2), Rational(-2, 3))
+        self.assertEqual(list(z.powers(12)), [z.power(k) for k in range(13)])
+        self.assertEqual(list(Complex(0, 1).powers(4)), [Complex(1, 0), Complex(0, 1), Complex(-1, 0), Complex(0, -1),
+                                                         Complex(1, 0)])
+        self.assertEqual(list(z.powers(0)), [Complex(1, 0)])
+
     def test_invalid_power(self):
         c = Complex(1, 1)
-        with self.assertRaises(ValueError):
-            c.power(-2)
         with self.assertRaises(ValueError):
             c.power(2.5)
+        with self.assertRaises(ValueError):
+            c.power("2")
+        with self.assertRaises(ValueError):
+            c.powers(-1)
+
+    # Тесты неизменяемости
+    def test_immutable(self):
+        c = Complex(1, 2)
+        with self.assertRaises(AttributeError):
+            c.real = Rational(5)
+        with self.assertRaises(AttributeError):
+            c.extra = 1
+        with self.assertRaises(AttributeError):
+            c._real = Rational(5)
+        with self.assertRaises(AttributeError):
+            del c._imaginary
+        self.assertEqual(-c, Complex(-1, -2))
+        self.assertEqual(pickle.loads(pickle.dumps(c)), c)
+        self.assertEqual(c, Complex(1, 2))
+
+    def test_from_parts(self):
+        c = Complex._from_parts(Rational(1, 2), Rational(3, 4))
+        self.assertEqual(c, Complex(Rational(1, 2), Rational(3, 4)))
 
     # Тесты представления в виде строки
     def test_str(self):
@@ -0,0 +1,123 @@
+import unittest
+import math
+import numpy as np
+from rational import Rational
+from complex import Complex
+from complex_array import ComplexArray
+from rational_array import RationalArray
+
+class TestComplexArray(unittest.TestCase):
+
+    # Тесты инициализации
+    def test_initialization_valid(self):
+        a = ComplexArray([Complex(1, 2), Rational(1, 2), 3])
+        self.assertEqual(len(a), 3)
+        self.assertEqual(a.to_list(), [Complex(1, 2), Complex(Rational(1, 2), 0), Complex(3, 0)])
+
+    def test_from_parts(self):
+        a = ComplexArray.from_parts([1, Rational(1, 2)], RationalArray([3, 4]))
+        self.assertEqual(a.to_list(), [Complex(1, 3), Complex(Rational(1, 2), 4)])
+        self.assertEqual(ComplexArray.from_parts([1, 2]).to_list(), [Complex(1, 0), Complex(2, 0)])
+        with self.assertRaises(ValueError):
+            ComplexArray.from_parts([1, 2], [1])
+
+    def test_invalid_type_initialization(self):
+        with self.assertRaises(TypeError):
+            ComplexArray([Complex(1, 2), "1"])
+
+    # Тесты арифметических операций
+    def test_add_sub(self):
+        a = ComplexArray([Complex(1, 2), Complex(3, 4)])
+        b = ComplexArray([Complex(5, 6), Complex(7, 8)])
+        self.assertEqual((a + b).to_list(), [Complex(6, 8), Complex(10, 12)])
+        self.assertEqual((a - b).to_list(), [Complex(-4, -4), Complex(-4, -4)])
+        self.assertEqual((a + 1).to_list(), [Complex(2, 2), Complex(4, 4)])
+        self.assertEqual((1 - a).to_list(), [Complex(0, -2), Complex(-2, -4)])
+
+    def test_add_denominator_overflow(self):
+        a = ComplexArray([Complex(Rational(1, 2 ** 40), Rational(1, 3 ** 25))])
+        b = ComplexArray([Complex(Rational(1, 3 ** 25), Rational(-1, 2 ** 40))])
+        self.assertEqual((a + b).to_list(), [Complex(Rational(1, 2 ** 40) + Rational(1, 3 ** 25),
+                                                     Rational(1, 3 ** 25) - Rational(1, 2 ** 40))])
+        self.assertEqual((a - b).to_list(), [Complex(Rational(1, 2 ** 40) - Rational(1, 3 ** 25),
+                                                     Rational(1, 3 ** 25) + Rational(1, 2 ** 40))])
+
+    def test_mul(self):
+        a = ComplexArray([Complex(1, 2), Complex(Rational(1, 2), Rational(-1, 3))])
+        b = ComplexArray([Complex(3, 4), Complex(Rational(2, 5), 7)])
+        expected = [x * y for x, y in zip(a, b)]
+        self.assertEqual((a * b).to_list(), expected)
+        self.assertEqual((a * Complex(0, 1)).to_list(), [Complex(-2, 1), Complex(Rational(1, 3), Rational(1, 2))])
+        self.assertEqual((2 * a).to_list(), [Complex(2, 4), Complex(1, Rational(-2, 3))])
+
+    def test_mul_large_values(self):
+        # Целые тройки не помещаются в int64 – вычисления переходят к длинной арифметике
+        a = ComplexArray([Complex(Rational(2 ** 40 + 1, 3 ** 20), Rational(-5, 2 ** 33)), Complex(Rational(10 ** 30, 7), 1)])
+        b = ComplexArray([Complex(Rational(7, 3 ** 19), Rational(2 ** 35, 11)), Complex(Rational(1, 10 ** 20), -3)])
+        self.assertEqual((a * b).to_list(), [x * y for x, y in zip(a, b)])
+        with self.assertRaises(ValueError):
+            a * ComplexArray([Complex(1, 2), Complex(3, 4), Complex(5, 6)])
+
+    def test_truediv(self):
+        a = ComplexArray([Complex(1, 1), Complex(4, 0), Complex(1, 2)])
+        b = ComplexArray([Complex(1, 1), Complex(2, 0), Complex(3, 4)])
+        self.assertEqual((a / b).to_list(), [Complex(1, 0), Complex(2, 0), Complex(Rational(11, 25), Rational(2, 25))])
+        self.assertEqual((1 / ComplexArray([Complex(0, 2)])).to_list(), [Complex(0, Rational(-1, 2))])
+
+    def test_div_by_zero(self):
+        with self.assertRaises(ZeroDivisionError):
+            ComplexArray([Complex(1, 1), Complex(1, 1)]) / ComplexArray([Complex(1, 0), Complex(0, 0)])
+        with self.assertRaises(ZeroDivisionError):
+            ComplexArray([Complex(1, 1)]) / 0
+
+    def test_conjugate_neg(self):
+        a = ComplexArray([Complex(1, 2), Complex(-3, -4)])
+        self.assertEqual(a.conjugate().to_list(), [Complex(1, -2), Complex(-3, 4)])
+        self.assertEqual((-a).to_list(), [Complex(-1, -2), Complex(3, 4)])
+
+    # Тесты операций сравнения
+    def test_eq(self):
+        a = ComplexArray([Complex(1, 2), Complex(3, 4)])
+        self.assertEqual(list(a == ComplexArray([Complex(1, 2), Complex(3, 5)])), [True, False])
+        self.assertEqual(list(a != Complex(3, 4)), [True, False])
+
+    # Тесты операций взятия модуля и аргумента
+    def test_abs_arg(self):
+        a = ComplexArray([Complex(3, 4), Complex(0, 0), Complex(-1, 0), Complex(1, 1)])
+        np.testing.assert_allclose(abs(a), [5.0, 0.0, 1.0, math.sqrt(2)])
+        np.testing.assert_allclose(a.arg(), [math.atan2(4, 3), 0.0, math.pi, math.pi / 4])
+
+    # Тесты свертки
+    def test_sum_prod(self):
+        values = [Complex(1, 1), Complex(Rational(1, 2), -1), Complex(0, 3), Complex(2, Rational(1, 3)), Complex(-1, 2)]
+        a = ComplexArray(values)
+        expected_sum = Complex(0, 0)
+        expected_prod = Complex(1, 0)
+        for value in values:
+            expected_sum = expected_sum + value
+            expected_prod = expected_prod * value
+        self.assertEqual(a.sum(), expected_sum)
+        self.assertEqual(a.prod(), expected_prod)
+        self.assertEqual(ComplexArray().prod(), Complex(1, 0))
+
+    # Тесты индексации и представления в виде строки
+    def test_indexing(self):
+        a = ComplexArray([Complex(1, 2), Complex(3, 4), Complex(5, 6)])
+        self.assertEqual(a[1], Complex(3, 4))
+        self.assertEqual(a[1:].to_list(), [Complex(3, 4), Complex(5, 6)])
+
+    def test_str(self):
+        a = ComplexArray([Complex(1, 2)])
+        self.assertEqual(str(a), "[(1/1) + (2/1)i]")
+        self.assertEqual(repr(a), "ComplexArray([Complex(Rational(1, 1), Rational(2, 1))])")
+
+    # Тесты обработки ошибок
+    def test_invalid_operations(self):
+        a = ComplexArray([Complex(1, 2)])
+        with self.assertRaises(TypeError):
+            a + "invalid"
+        with self.assertRaises(TypeError):
+            a * [1, 2]
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from rational import Rational, localcontext
+from complex import Complex
+from convolution import convolve, _integer_convolve, _schoolbook
+
+
+def naive(left, right):
+    result = []
+    for k in range(len(left) + len(right) - 1):
+        terms = [left[i] * right[k - i] for i in range(len(left)) if 0 <= k - i < len(right)]
+        result.append(sum(terms[1:], terms[0]))
+    return result
+
+
+class TestConvolution(unittest.TestCase):
+
+    # Тесты свертки целых чисел
+    def test_integer_convolve(self):
+        left = [(-3) ** k * (k + 1) for k in range(50)]
+        right = [2 ** (3 * k) - 7 if k % 3 else -(5 ** k) for k in range(37)]
+        self.assertEqual(_integer_convolve(left, right), _schoolbook(left, right))
+        self.assertEqual(_integer_convolve([0] * 20, [1] * 20), [0] * 39)
+        self.assertEqual(_integer_convolve([-1] * 20, [1] * 20), _schoolbook([-1] * 20, [1] * 20))
+
+    # Тесты свертки рациональных и комплексных последовательностей
+    def test_convolve_rational(self):
+        left = [Rational(k, k + 2) for k in range(25)]
+        right = [Rational(-1, k + 1) for k in range(20)] + [3]
+        self.assertEqual(convolve(left, right), naive(left, right))
+        self.assertEqual(convolve([Rational(1, 2)], [2, 4]), [Rational(1), Rational(2)])
+
+    def test_convolve_complex(self):
+        left = [Complex(Rational(k, 7), Rational(-1, k + 1)) for k in range(30)]
+        right = [Complex(k, 1) if k % 2 else Rational(k, 3) for k in range(18)]
+        result = convolve(left, right)
+        self.assertEqual(result, naive(left, right))
+        self.assertTrue(all(isinstance(value, Complex) for value in result))
+        self.assertEqual(convolve([Complex(0, 1)], [Complex(0, 1), 1]), [Complex(-1, 0), Complex(0, 1)])
+
+    def test_convolve_respects_context(self):
+        left = [Rational(1, 3), Rational(1, 1009)]
+        with localcontext(max_denominator=10):
+            self.assertEqual(convolve(left, [1]), [Rational(1, 3), Rational(0)])
+
+    # Тесты обработки ошибок
+    def test_invalid_input(self):
+        self.assertEqual(convolve([], [1, 2]), [])
+        with self.assertRaises(TypeError):
+            convolve([1.5], [1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+import decimal
+from decimal import Decimal
+from fractions import Fraction
+import numpy as np
+from rational import Rational, localcontext
+from complex import Complex
+from rational_array import RationalArray
+from complex_array import ComplexArray
+import interop
+
+class TestInterop(unittest.TestCase):
+
+    # Тесты преобразования Fraction, float, complex и Decimal
+    def test_fractions(self):
+        fractions = [Fraction(-3, 4), Fraction(10, 5), Fraction(0)]
+        values = interop.from_fractions(fractions + [7])
+        self.assertEqual(values, [Rational(-3, 4), Rational(2), Rational(0), Rational(7)])
+        self.assertEqual(interop.to_fractions(values), fractions + [Fraction(7)])
+        with localcontext(max_denominator=10):
+            self.assertEqual(interop.from_fractions([Fraction(1012, 3027)]), [Rational(1, 3)])
+
+    def test_floats_are_exact(self):
+        values = [0.1, -2.5, 1e300, 5e-324]
+        result = interop.from_floats(values)
+        self.assertEqual([(r.numerator, r.denominator) for r in result], [v.as_integer_ratio() for v in values])
+        with self.assertRaises(ValueError):
+            interop.from_floats([float("nan")])
+
+    def test_complexes(self):
+        values = interop.from_complexes([1 + 0.5j, -0.25j, 3])
+        self.assertEqual(values, [Complex(1, Rational(1, 2)), Complex(0, Rational(-1, 4)), Complex(3, 0)])
+        self.assertEqual(interop.to_complexes(values + [Rational(1, 4)]), [1 + 0.5j, -0.25j, 3 + 0j, 0.25 + 0j])
+
+    def test_decimals(self):
+        self.assertEqual(interop.from_decimals([Decimal("2.50"), Decimal("-0.125"), 4]),
+                         [Rational(5, 2), Rational(-1, 8), Rational(4)])
+        context = decimal.Context(prec=5)
+        self.assertEqual(interop.to_decimals([Rational(1, 3), Rational(-7, 8), 2], context),
+                         [Decimal("0.33333"), Decimal("-0.875"), Decimal(2)])
+
+    # Тесты преобразования массивов NumPy
+    def test_float64(self):
+        array = np.array([0.1, -2.5, 0.0, 2.0 ** 60, 3 * 2.0 ** -40])
+        result = interop.from_float64(array)
+        self.assertIsInstance(result, RationalArray)
+        self.assertEqual(result.to_list(), [Rational(*value.as_integer_ratio()) for value in array.tolist()])
+        self.assertEqual(result.dtype, np.int64)
+        np.testing.assert_array_equal(interop.to_float64(result), array)
+        wide = interop.from_float64([1e300, 5e-324])
+        self.assertEqual(wide.to_list(), [Rational(*value.as_integer_ratio()) for value in (1e300, 5e-324)])
+        with self.assertRaises(ValueError):
+            interop.from_float64([np.inf])
+
+    def test_complex128(self):
+        array = np.array([1 + 2j, -0.25j, 3.5])
+        result = interop.from_complex128(array)
+        self.assertIsInstance(result, ComplexArray)
+        self.assertEqual(result.to_list(), [Complex(1, 2), Complex(0, Rational(-1, 4)), Complex(Rational(7, 2), 0)])
+        np.testing.assert_array_equal(interop.to_complex128(result), array)
+        np.testing.assert_array_equal(interop.to_complex128(result.to_list()), array)
+
+    def test_int64_pairs(self):
+        numerators, denominators = interop.to_int64_pairs([Rational(1, 3), Rational(-5, 2), 4])
+        np.testing.assert_array_equal(numerators, [1, -5, 4])
+        np.testing.assert_array_equal(denominators, [3, 2, 1])
+        self.assertEqual(interop.from_int64_pairs(numerators, denominators, normalized=True).to_list(),
+                         [Rational(1, 3), Rational(-5, 2), Rational(4)])
+        self.assertEqual(interop.from_int64_pairs(np.array([2, 3]), np.array([4, -6])).to_list(),
+                         [Rational(1, 2), Rational(-1, 2)])
+        with self.assertRaises(OverflowError):
+            interop.to_int64_pairs([Rational(2 ** 80, 3)])
+
+    # Тесты обработки ошибок
+    def test_invalid_values(self):
+        with self.assertRaises(TypeError):
+            interop.from_fractions([0.5])
+        with self.assertRaises(TypeError):
+            interop.to_fractions([Complex(1, 1)])
+        with self.assertRaises(TypeError):
+            interop.from_decimals([0.5])
+        with self.assertRaises(ValueError):
+            interop.from_float64(np.zeros((2, 2)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+from rational import Rational
+from complex import Complex
+from matrix import Matrix
+
+class TestMatrix(unittest.TestCase):
+
+    # Тесты инициализации
+    def test_initialization_valid(self):
+        m = Matrix([[1, Rational(1, 2)], [0.5, 3]])
+        self.assertEqual(m.shape, (2, 2))
+        self.assertEqual(m[0, 1], Rational(1, 2))
+        self.assertEqual(m[1, 0], Rational(1, 2))
+        self.assertFalse(m.is_complex)
+        self.assertTrue(Matrix([[1, Complex(0, 1)]]).is_complex)
+
+    def test_invalid_initialization(self):
+        with self.assertRaises(ValueError):
+            Matrix([])
+        with self.assertRaises(ValueError):
+            Matrix([[1, 2], [3]])
+        with self.assertRaises(TypeError):
+            Matrix([["1"]])
+
+    # Тесты определителя
+    def test_determinant(self):
+        self.assertEqual(Matrix([[1, 2], [3, 4]]).determinant(), Rational(-2))
+        self.assertEqual(Matrix([[Rational(1, 2), Rational(1, 3)], [Rational(1, 4), Rational(1, 5)]]).determinant(),
+                         Rational(1, 60))
+        self.assertEqual(Matrix([[0, 1, 2], [1, 0, 3], [4, -3, 8]]).determinant(), Rational(-2))
+        self.assertEqual(Matrix([[1, 2], [2, 4]]).determinant(), Rational(0))
+
+    def test_determinant_hilbert(self):
+        size = 6
+        hilbert = Matrix([[Rational(1, i + j + 1) for j in range(size)] for i in range(size)])
+        self.assertEqual(hilbert.determinant(), Rational(1, 186313420339200000))
+
+    def test_determinant_complex(self):
+        m = Matrix([[Complex(1, 1), Complex(0, 2)], [Complex(Rational(1, 2), 0), Complex(3, -1)]])
+        self.assertEqual(m.determinant(), Complex(4, 1))
+
+    def test_determinant_not_square(self):
+        with self.assertRaises(ValueError):
+            Matrix([[1, 2, 3], [4, 5, 6]]).determinant()
+
+    # Тесты ранга и ступенчатого вида
+    def test_rank(self):
+        self.assertEqual(Matrix([[1, 2], [3, 4]]).rank(), 2)
+        self.assertEqual(Matrix([[1, 2, 3], [2, 4, 6], [1, 0, 1]]).rank(), 2)
+        self.assertEqual(Matrix([[0, 0], [0, 0]]).rank(), 0)
+
+    def test_rref(self):
+        m = Matrix([[1, 2, 1, 4], [2, 4, 0, 6], [1, 2, 2, 5]])
+        expected = Matrix([[1, 2, 0, 3], [0, 0, 1, 1], [0, 0, 0, 0]])
+        self.assertEqual(m.rref(), expected)
+        m = Matrix([[2, 1], [Rational(1, 3), 1]])
+        self.assertEqual(m.rref(), Matrix.identity(2))
+
+    # Тесты решения систем и обратной матрицы
+    def test_solve_vector(self):
+        m = Matrix([[2, 1, -1], [-3, -1, 2], [-2, 1, 2]])
+        self.assertEqual(m.solve([8, -11, -3]), [Rational(2), Rational(3), Rational(-1)])
+        m = Matrix([[Rational(1, 2), Rational(1, 3)], [1, -1]])
+        self.assertEqual(m.solve([1, Rational(1, 2)]), [Rational(7, 5), Rational(9, 10)])
+
+    def test_solve_complex(self):
+        m = Matrix([[Complex(1, 1), 2], [Complex(0, 1), Complex(1, -1)]])
+        x = [Complex(1, 2), Complex(Rational(1, 2), -1)]
+        b = [m[0, 0] * x[0] + m[0, 1] * x[1], m[1, 0] * x[0] + m[1, 1] * x[1]]
+        self.assertEqual(m.solve(b), x)
+
+    def test_solve_singular(self):
+        with self.assertRaises(ValueError):
+            Matrix([[1, 2], [2, 4]]).solve([1, 2])
+
+    def test_inverse(self):
+        m = Matrix([[4, 7], [2, 6]])
+        self.assertEqual(m.inverse(), Matrix([[Rational(3, 5), Rational(-7, 10)], [Rational(-1, 5), Rational(2, 5)]]))
+        m = Matrix([[Rational(1, i + j + 1) for j in range(4)] for i in range(4)])
+        self.assertEqual(m * m.inverse(), Matrix.identity(4))
+
+    def test_inverse_complex(self):
+        m = Matrix([[Complex(0, 1), 1], [1, Complex(0, 1)]])
+        self.assertEqual(m * m.inverse(), Matrix.identity(2))
+
+    # Тесты умножения
+    def test_mul(self):
+        m = Matrix([[1, 2], [3, 4]])
+        self.assertEqual(m * Matrix([[0, 1], [1, 0]]), Matrix([[2, 1], [4, 3]]))
+        self.assertEqual(m * Rational(1, 2), Matrix([[Rational(1, 2), 1], [Rational(3, 2), 2]]))
+        with self.assertRaises(ValueError):
+            m * Matrix([[1, 2, 3]])
+
+    # Тесты представления в виде строки
+    def test_str(self):
+        m = Matrix([[1, Rational(1, 2)]])
+        self.assertEqual(str(m), "[1/1, 1/2]")
+        self.assertEqual(repr(m), "Matrix([[Rational(1, 1), Rational(1, 2)]])")
+
+if __name__ == '__main__':
+    unittest.main()
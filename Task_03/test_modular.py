@@ -0,0 +1,71 @@
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from rational import Rational
+from complex import Complex
+from matrix import Matrix
+from modular import crt, rational_reconstruction, modular_determinant, modular_solve, modular_prod
+
+class TestModular(unittest.TestCase):
+
+    # Тесты китайской теоремы об остатках и восстановления дробей
+    def test_crt(self):
+        self.assertEqual(crt([2, 3, 2], [3, 5, 7]), (23, 105))
+        with self.assertRaises(ValueError):
+            crt([1, 2], [3])
+
+    def test_rational_reconstruction(self):
+        modulus = 1000003
+        self.assertEqual(rational_reconstruction(3 * pow(7, -1, modulus) % modulus, modulus), (3, 7))
+        self.assertEqual(rational_reconstruction(-5 * pow(11, -1, modulus) % modulus, modulus), (-5, 11))
+        # Модуль слишком мал для дроби 4115/18107: восстанавливается другая дробь с тем же вычетом
+        self.assertNotEqual(rational_reconstruction(4115 * pow(18107, -1, modulus) % modulus, modulus), (4115, 18107))
+        modulus *= 1000033
+        self.assertEqual(rational_reconstruction(4115 * pow(18107, -1, modulus) % modulus, modulus), (4115, 18107))
+        self.assertIsNone(rational_reconstruction(2, 5))
+
+    # Тесты многомодульных вычислений
+    def test_determinant(self):
+        hilbert = Matrix([[Rational(1, i + j + 1) for j in range(8)] for i in range(8)])
+        self.assertEqual(modular_determinant(hilbert), hilbert.determinant())
+        m = Matrix([[2 ** 100 + 1, 3 ** 70], [-(5 ** 40), 7]])
+        self.assertEqual(modular_determinant(m), m.determinant())
+        self.assertEqual(modular_determinant(Matrix([[1, 2], [2, 4]])), Rational(0))
+
+    def test_determinant_complex(self):
+        m = Matrix([[Complex(1, 1), Complex(0, 2), Rational(1, 3)],
+                    [Complex(Rational(1, 2), 0), Complex(3, -1), 4],
+                    [Complex(0, Rational(-5, 7)), 1, Complex(2, 2)]])
+        self.assertEqual(modular_determinant(m), m.determinant())
+
+    def test_solve(self):
+        m = Matrix([[Rational(1, i + j + 1) for j in range(6)] for i in range(6)])
+        right_side = [Rational(k, 3) for k in range(6)]
+        self.assertEqual(modular_solve(m, right_side), m.solve(right_side))
+        self.assertEqual(modular_solve(m, Matrix.identity(6)), m.inverse())
+        c = Matrix([[Complex(1, 2), 3], [Rational(1, 2), Complex(0, -1)]])
+        self.assertEqual(modular_solve(c, [1, Complex(0, 1)]), c.solve([1, Complex(0, 1)]))
+
+    def test_prod(self):
+        values = [Complex(Rational(k, 7), Rational(-1, k)) for k in range(1, 40)]
+        self.assertEqual(modular_prod(values), Complex.prod(values))
+        rationals = [Rational(k, k + 2) for k in range(1, 50)]
+        self.assertEqual(modular_prod(rationals), Rational.prod(rationals))
+        self.assertEqual(modular_prod([]), Rational(1))
+
+    def test_executor(self):
+        m = Matrix([[Rational(i * j + 1, i + j + 1) + i for j in range(6)] for i in range(6)])
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(modular_determinant(m, workers=2, executor=executor), m.determinant())
+            self.assertEqual(modular_solve(m, [1] * 6, executor=executor), m.solve([1] * 6))
+
+    # Тесты обработки ошибок
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            modular_solve(Matrix([[1, 2], [2, 4]]), [1, 1])
+        with self.assertRaises(ValueError):
+            modular_determinant(Matrix([[1, 2]]))
+        with self.assertRaises(ValueError):
+            modular_prod([1], workers=0)
+
+if __name__ == '__main__':
+    unittest.main()
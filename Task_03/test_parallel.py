@@ -0,0 +1,72 @@
+import unittest
+import operator
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from rational import Rational, localcontext
+from complex import Complex
+from parallel import parallel_sum, parallel_prod, parallel_dot, parallel_map
+
+class TestParallel(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+        cls.rationals = [Rational(k, k + 1) for k in range(1, 60)]
+        cls.complexes = [Complex(Rational(1, k), Rational(-k, 3)) for k in range(1, 40)]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    # Тесты параллельных сверток
+    def test_sum(self):
+        self.assertEqual(parallel_sum(self.rationals, executor=self.executor), Rational.sum(self.rationals))
+        self.assertEqual(parallel_sum(self.complexes, workers=3, executor=self.executor), Complex.sum(self.complexes))
+        self.assertEqual(parallel_sum([1, Rational(1, 2), Complex(0, 1)], executor=self.executor),
+                         Complex(Rational(3, 2), 1))
+
+    def test_prod(self):
+        self.assertEqual(parallel_prod(self.rationals, executor=self.executor), Rational(1, 60))
+        self.assertEqual(parallel_prod(self.complexes, executor=self.executor), Complex.prod(self.complexes))
+
+    def test_dot(self):
+        expected = Rational.sum([a * b for a, b in zip(self.rationals, reversed(self.rationals))])
+        self.assertEqual(parallel_dot(self.rationals, self.rationals[::-1], executor=self.executor), expected)
+        expected = Complex.sum([a * b for a, b in zip(self.complexes, self.rationals)])
+        self.assertEqual(parallel_dot(self.complexes, self.rationals[:39], executor=self.executor), expected)
+        with self.assertRaises(ValueError):
+            parallel_dot([1, 2], [1], executor=self.executor)
+
+    def test_context_is_passed_to_workers(self):
+        add_third = functools.partial(operator.add, Rational(1, 3))
+        with localcontext(max_denominator=10):
+            self.assertEqual(parallel_map(add_third, [Rational(1, 1009)], executor=self.executor), [Rational(1, 3)])
+            result = parallel_sum(self.rationals, executor=self.executor)
+        self.assertLessEqual(result.denominator, 10)
+
+    def test_map(self):
+        self.assertEqual(parallel_map(operator.neg, self.rationals, executor=self.executor),
+                         [-value for value in self.rationals])
+        self.assertEqual(parallel_map(abs, self.complexes[:5], executor=self.executor),
+                         [abs(value) for value in self.complexes[:5]])
+
+    # Тесты последовательного выполнения и крайних случаев
+    def test_serial_fallback(self):
+        self.assertEqual(parallel_sum(self.rationals), Rational.sum(self.rationals))
+        self.assertEqual(parallel_prod(self.complexes, workers=1), Complex.prod(self.complexes))
+        self.assertEqual(parallel_map(operator.neg, [Rational(1, 2), 3]), [Rational(-1, 2), -3])
+
+    def test_empty(self):
+        self.assertEqual(parallel_sum([]), Rational(0))
+        self.assertEqual(parallel_prod([]), Rational(1))
+        self.assertEqual(parallel_dot([], []), Rational(0))
+        self.assertEqual(parallel_map(operator.neg, []), [])
+
+    def test_invalid_values(self):
+        with self.assertRaises(TypeError):
+            parallel_sum([Rational(1, 2), 0.5])
+        with self.assertRaises(ValueError):
+            parallel_sum([1], workers=0)
+
+if __name__ == '__main__':
+    unittest.main()
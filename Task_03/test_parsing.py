@@ -0,0 +1,64 @@
+import unittest
+import io
+from rational import Rational
+from complex import Complex
+from parsing import parse, parse_rational, parse_complex, read_values
+
+class TestParsing(unittest.TestCase):
+
+    # Тесты разбора рациональных чисел
+    def test_parse_fraction(self):
+        self.assertEqual(parse_rational("1/2"), Rational(1, 2))
+        self.assertEqual(parse_rational(" -6/4 "), Rational(-3, 2))
+        self.assertEqual(parse_rational("+5"), Rational(5))
+        self.assertEqual(parse_rational(str(Rational(-7, 3))), Rational(-7, 3))
+
+    def test_parse_decimal_is_exact(self):
+        self.assertEqual(parse_rational("2.3333"), Rational(23333, 10000))
+        self.assertEqual(parse_rational("0.1"), Rational(1, 10))
+        self.assertEqual(parse_rational("-.5"), Rational(-1, 2))
+        self.assertEqual(parse_rational("1.5e-3"), Rational(3, 2000))
+        self.assertEqual(parse_rational("12E3"), Rational(12000))
+        self.assertEqual(parse_rational("0.12345678901234567890123"), Rational(12345678901234567890123, 10 ** 23))
+
+    def test_parse_long_numbers(self):
+        digits = "9" * 10000
+        value = parse_rational(digits + "/7")
+        self.assertEqual(value, Rational(10 ** 10000 - 1, 7))
+        self.assertEqual(parse_rational("1." + "0" * 5000 + "1"), Rational(10 ** 5001 + 1, 10 ** 5001))
+
+    # Тесты разбора комплексных чисел
+    def test_parse_complex(self):
+        self.assertEqual(parse_complex("(1/2) + (-3/1)i"), Complex(Rational(1, 2), -3))
+        self.assertEqual(parse_complex(str(Complex(Rational(-2, 7), Rational(5, 3)))), Complex(Rational(-2, 7), Rational(5, 3)))
+        self.assertEqual(parse_complex("(0.5)+(2.25)i"), Complex(Rational(1, 2), Rational(9, 4)))
+        self.assertEqual(parse_complex("3/4"), Complex(Rational(3, 4), 0))
+
+    def test_parse(self):
+        self.assertIsInstance(parse("1/3"), Rational)
+        self.assertIsInstance(parse("(1/3) + (0/1)i"), Complex)
+
+    # Тесты потокового чтения
+    def test_read_values(self):
+        values = [Rational(k, 7) for k in range(-20, 20)] + [Complex(Rational(1, 3), Rational(-k, 2)) for k in range(10)]
+        text = "\n".join(str(value) for value in values) + "\n\n"
+        self.assertEqual(list(read_values(io.StringIO(text), chunk_size=7)), values)
+        self.assertEqual(list(read_values(io.BytesIO(b"1/2\n0.25"), chunk_size=3)), [Rational(1, 2), Rational(1, 4)])
+        self.assertEqual(list(read_values(io.StringIO(""))), [])
+
+    # Тесты обработки ошибок
+    def test_invalid_strings(self):
+        for text in ("", "abc", "-", ".", "1/0", "1/-2", "1.2.3", "1/2/3", "(1/2) + (1/3)"):
+            with self.assertRaises(ValueError):
+                parse(text)
+        with self.assertRaises(ValueError):
+            list(read_values(io.StringIO("1/2\nx\n")))
+
+    def test_exponent_limit(self):
+        for text in ("1e999999999", "1e-999999999", "-.5E1000000"):
+            with self.assertRaises(ValueError):
+                parse_rational(text)
+        self.assertEqual(parse_rational("1e-999999"), Rational(1, 10 ** 999999))
+
+if __name__ == '__main__':
+    unittest.main()
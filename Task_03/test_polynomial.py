@@ -0,0 +1,148 @@
+import unittest
+from rational import Rational
+from complex import Complex
+from polynomial import Polynomial
+from rational_array import RationalArray
+from complex_array import ComplexArray
+from convolution import convolve
+
+class TestPolynomial(unittest.TestCase):
+
+    # Тесты инициализации
+    def test_initialization_valid(self):
+        p = Polynomial([1, Rational(1, 2), 0.25, 0])
+        self.assertEqual(p.degree, 2)
+        self.assertEqual(p.coefficients(), [Rational(1), Rational(1, 2), Rational(1, 4)])
+        self.assertFalse(p.is_complex)
+        self.assertTrue(Polynomial([1, Complex(0, 1)]).is_complex)
+        self.assertFalse(Polynomial([Complex(1, 0)]).is_complex)
+
+    def test_zero_polynomial(self):
+        p = Polynomial()
+        self.assertEqual(p.degree, -1)
+        self.assertEqual(p(Rational(3, 7)), Rational(0))
+        self.assertEqual(str(p), "0")
+
+    def test_invalid_initialization(self):
+        with self.assertRaises(TypeError):
+            Polynomial(["1"])
+
+    # Тесты вычисления значений
+    def test_evaluate(self):
+        p = Polynomial([Rational(1, 2), -3, Rational(2, 3)])
+        self.assertEqual(p(0), Rational(1, 2))
+        self.assertEqual(p(Rational(3, 2)), Rational(-5, 2))
+        self.assertEqual(p.evaluate(-1), Rational(25, 6))
+
+    def test_evaluate_complex(self):
+        p = Polynomial([1, 0, 1])
+        self.assertEqual(p(Complex(0, 1)), Complex(0, 0))
+        q = Polynomial([Complex(0, 1), Rational(1, 2)])
+        self.assertEqual(q(Rational(2)), Complex(1, 1))
+        self.assertEqual(q(Complex(Rational(1, 3), Rational(1, 2))), Complex(Rational(1, 6), Rational(5, 4)))
+
+    def test_evaluate_many(self):
+        p = Polynomial([Rational(1, 2), -3, Rational(2, 3)])
+        points = [Rational(k, 7) for k in range(-20, 20)]
+        values = p.evaluate_many(points)
+        self.assertIsInstance(values, RationalArray)
+        self.assertEqual(values.to_list(), [p(point) for point in points])
+
+    def test_evaluate_many_large_values(self):
+        p = Polynomial([Rational(1, 3)] * 12)
+        points = RationalArray([Rational(10 ** 6 + k, 999983) for k in range(10)])
+        self.assertEqual(p.evaluate_many(points).to_list(), [p(point) for point in points])
+
+    def test_evaluate_many_denominator_overflow(self):
+        # Точки и числители малы, но знаменатель результата не помещается в int64
+        p = Polynomial([Rational(1, 3 ** 26)] * 2)
+        points = [Rational(1, 5 ** 13)]
+        self.assertEqual(p.evaluate_many(points).to_list(), [p(point) for point in points])
+        q = Polynomial([Rational(1, 2 ** 40)] * 2)
+        points = [Rational(1, 2 ** 30), Rational(-3, 2 ** 30)]
+        self.assertEqual(q.evaluate_many(points).to_list(), [q(point) for point in points])
+        r = Polynomial([Complex(Rational(1, 2 ** 40), Rational(1, 3 ** 26))] * 2)
+        points = [Complex(Rational(1, 2 ** 30), 1)]
+        self.assertEqual(r.evaluate_many(points).to_list(), [r(point) for point in points])
+
+    def test_evaluate_many_complex(self):
+        p = Polynomial([Complex(1, -1), 0, Rational(1, 2)])
+        points = ComplexArray([Complex(Rational(1, 2), Rational(1, 3)), Complex(2, 0), Complex(0, -1)])
+        values = p.evaluate_many(points)
+        self.assertIsInstance(values, ComplexArray)
+        self.assertEqual(values.to_list(), [p(point) for point in points])
+        self.assertEqual(Polynomial([1, 1]).evaluate_many([Complex(0, 1), 2]).to_list(), [Complex(1, 1), Complex(3, 0)])
+
+    # Тесты арифметических операций
+    def test_add_sub(self):
+        p = Polynomial([1, Rational(1, 2)])
+        q = Polynomial([Rational(1, 3), 0, 1])
+        self.assertEqual(p + q, Polynomial([Rational(4, 3), Rational(1, 2), 1]))
+        self.assertEqual(p - p, Polynomial())
+        self.assertEqual(p + 1, Polynomial([2, Rational(1, 2)]))
+        self.assertEqual(1 - p, Polynomial([0, Rational(-1, 2)]))
+
+    def test_mul(self):
+        p = Polynomial([1, 1])
+        q = Polynomial([-1, 1])
+        self.assertEqual(p * q, Polynomial([-1, 0, 1]))
+        self.assertEqual(p * Rational(1, 2), Polynomial([Rational(1, 2), Rational(1, 2)]))
+        self.assertEqual(Polynomial([Complex(0, 1), 1]) * Polynomial([Complex(0, -1), 1]), Polynomial([1, 0, 1]))
+
+    def test_mul_long(self):
+        left = [Complex(Rational(k, 3), -k) for k in range(40)]
+        right = [Rational((-1) ** k, k + 1) for k in range(30)]
+        self.assertEqual(Polynomial(left) * Polynomial(right), Polynomial(convolve(left, right)))
+        self.assertEqual(Polynomial(right) * Polynomial(right), Polynomial(convolve(right, right)))
+
+    def test_divmod(self):
+        a = Polynomial([-4, 0, -2, 1])
+        b = Polynomial([-3, 1])
+        quotient, remainder = divmod(a, b)
+        self.assertEqual(quotient, Polynomial([3, 1, 1]))
+        self.assertEqual(remainder, Polynomial([5]))
+        self.assertEqual(a // b, quotient)
+        self.assertEqual(a % b, remainder)
+
+    def test_divmod_rational(self):
+        a = Polynomial([Rational(1, 2), Rational(2, 3), Rational(-1, 5), Rational(3, 4)])
+        b = Polynomial([Rational(1, 7), Rational(-2, 3)])
+        quotient, remainder = divmod(a, b)
+        self.assertEqual(quotient * b + remainder, a)
+        self.assertLess(remainder.degree, b.degree)
+
+    def test_divmod_complex(self):
+        a = Polynomial([1, 0, 1])
+        b = Polynomial([Complex(0, -1), 1])
+        self.assertEqual(divmod(a, b), (Polynomial([Complex(0, 1), 1]), Polynomial()))
+        c = Polynomial([Complex(1, 2), Rational(1, 2), Complex(0, 3)])
+        d = Polynomial([Complex(2, -1), Complex(Rational(1, 2), 1)])
+        quotient, remainder = divmod(c, d)
+        self.assertEqual(quotient * d + remainder, c)
+
+    def test_div_by_zero(self):
+        with self.assertRaises(ZeroDivisionError):
+            divmod(Polynomial([1, 2]), Polynomial())
+
+    def test_derivative(self):
+        p = Polynomial([5, Rational(1, 2), 3, Rational(1, 3)])
+        self.assertEqual(p.derivative(), Polynomial([Rational(1, 2), 6, 1]))
+        self.assertEqual(Polynomial([7]).derivative(), Polynomial())
+
+    # Тесты представления в виде строки
+    def test_str(self):
+        p = Polynomial([Rational(-1, 2), 0, 3])
+        self.assertEqual(str(p), "(3/1)x^2 + (-1/2)")
+        self.assertEqual(str(Polynomial([0, 1])), "(1/1)x")
+        self.assertEqual(repr(Polynomial([1, Rational(1, 2)])), "Polynomial([Rational(1, 1), Rational(1, 2)])")
+
+    # Тесты обработки ошибок
+    def test_invalid_operations(self):
+        p = Polynomial([1, 2])
+        with self.assertRaises(TypeError):
+            p + "invalid"
+        with self.assertRaises(TypeError):
+            p * [1, 2]
+
+if __name__ == '__main__':
+    unittest.main()
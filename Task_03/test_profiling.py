@@ -0,0 +1,53 @@
+import unittest
+import rational
+from rational import Rational
+from complex import Complex
+from profiling import profile_arithmetic
+
+class TestProfiling(unittest.TestCase):
+
+    # Тесты счетчиков
+    def test_counters(self):
+        a = Rational(2 ** 100 + 1, 3)
+        with profile_arithmetic() as profile:
+            Rational(6, 4)
+            a * a
+        self.assertEqual(profile.constructions["Rational"], 2)
+        self.assertEqual(profile.operations["Rational.__mul__"], 1)
+        self.assertEqual(profile.operand_bits["Rational.__mul__"], {128: 1})
+        self.assertEqual(profile.reductions, 1)
+        self.assertEqual(profile.gcd_calls, 2)
+
+    def test_complex_operations(self):
+        with profile_arithmetic() as profile:
+            Complex(1, 2) * Complex(Rational(1, 3), 5)
+        self.assertEqual(profile.operations["Complex.__mul__"], 1)
+        self.assertGreaterEqual(profile.constructions["Complex"], 3)
+        self.assertGreater(profile.operations["Rational.__mul__"], 0)
+
+    def test_call_sites(self):
+        with profile_arithmetic(track_call_sites=True) as profile:
+            Rational(2 ** 70, 3) + 1
+        site, bits = next(iter(profile.call_sites.items()))
+        self.assertIn(__file__, site)
+        self.assertEqual(bits, 71)
+        self.assertIn("Rational.__add__", profile.report())
+
+    # Тесты включения и отключения профилирования
+    def test_originals_are_restored(self):
+        methods = dict(vars(Rational)), dict(vars(Complex)), rational._gcd
+        with self.assertRaises(ValueError):
+            with profile_arithmetic():
+                self.assertIsNot(vars(Rational)["__add__"], methods[0]["__add__"])
+                Rational(1, 0)
+        self.assertEqual((dict(vars(Rational)), dict(vars(Complex)), rational._gcd), methods)
+        self.assertEqual(Rational(1, 2) + Rational(1, 3), Rational(5, 6))
+
+    def test_nested_profiling(self):
+        with profile_arithmetic():
+            with self.assertRaises(RuntimeError):
+                with profile_arithmetic():
+                    pass
+
+if __name__ == '__main__':
+    unittest.main()
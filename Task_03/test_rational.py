@@ -1,5 +1,9 @@
 import unittest
-from rational import Rational
+from fractions import Fraction
+import threading
+import pickle
+import copy
+from rational import Rational, ArithmeticContext, FLOAT_SIMPLEST, getcontext, setcontext, localcontext
 
 class TestRational(unittest.TestCase):
 
@@ -42,6 +46,51 @@ class TestRational(unittest.TestCase):
         self.assertEqual(r.numerator, 0)
         self.assertEqual(r.denominator, 1)
 
+    # Тесты приближения дробей
+    def test_reducedfraction_exact(self):
+        self.assertEqual(Rational.reducedfraction(123456, 789012), (10288, 65751))
+        self.assertEqual(Rational.reducedfraction(3, -6), (-1, 2))
+
+    def test_reducedfraction_max_denominator(self):
+        self.assertEqual(Rational.reducedfraction(5254124505271789, 2251799813685248, max_denominator=10000), (23333, 10000))
+        self.assertEqual(Rational.reducedfraction(314159265358979, 10 ** 14, max_denominator=1000), (355, 113))
+        self.assertEqual(Rational.reducedfraction(-314159265358979, 10 ** 14, max_denominator=100), (-311, 99))
+
+    def test_reducedfraction_large_operands(self):
+        numerator, denominator = 3 ** 5000, 2 ** 7000 + 1
+        expected = Fraction(numerator, denominator).limit_denominator(10 ** 12)
+        self.assertEqual(Rational.reducedfraction(numerator, denominator, max_denominator=10 ** 12),
+                         (expected.numerator, expected.denominator))
+
+    def test_reducedfraction_max_bits(self):
+        numerator, denominator = Rational.reducedfraction(10 ** 40 + 7, 3 * 10 ** 38, max_bits=16)
+        self.assertLess(abs(numerator), 2 ** 16)
+        self.assertLess(denominator, 2 ** 16)
+        self.assertAlmostEqual(numerator / denominator, (10 ** 40 + 7) / (3 * 10 ** 38), places=6)
+        with self.assertRaises(OverflowError):
+            Rational.reducedfraction(2 ** 20, 1, max_bits=8)
+
+    def test_reducedfraction_max_bits_is_nearest(self):
+        # Для |x| > 1 ищется ближайшая дробь с ограниченными числителем и знаменателем (не через обратную дробь)
+        limit = 2 ** 5 - 1
+        box = [Fraction(p, q) for p in range(-limit, limit + 1) for q in range(1, limit + 1)]
+        for numerator, denominator in ((1669, 685), (-1669, 685), (9999, 1000), (31, 33), (-123457, 4001)):
+            result = Fraction(*Rational.reducedfraction(numerator, denominator, max_bits=5))
+            x = Fraction(numerator, denominator)
+            self.assertEqual(abs(result - x), min(abs(f - x) for f in box))
+        self.assertEqual(Rational.reducedfraction(1669, 685, max_bits=5), (17, 7))
+
+    def test_max_bits_context_overflow(self):
+        with localcontext(max_bits=4):
+            self.assertEqual(Rational(3) * Rational(5), Rational(15))
+            with self.assertRaises(OverflowError):
+                Rational(4) * Rational(5)
+
+    def test_mixed_length_operands_stay_exact(self):
+        r = Rational(1, 3) * Rational(1, 100003)
+        self.assertEqual(r, Rational(1, 300009))
+        self.assertEqual(Rational(10 ** 6 + 1, 2) + Rational(1, 2), Rational(500001))
+
     # Тесты арифметических операций
     def test_add(self):
         r1 = Rational(1, 2)
@@ -74,6 +123,91 @@ class TestRational(unittest.TestCase):
         with self.assertRaises(ZeroDivisionError):
             r / 0
 
+    def test_reflected_operations(self):
+        r = Rational(2, 3)
+        self.assertEqual(2 + r, Rational(8, 3))
+        self.assertEqual(1 - r, Rational(1, 3))
+        self.assertEqual(-3 * r, Rational(-2))
+        self.assertEqual(4 / r, Rational(6))
+        self.assertEqual(-1 / Rational(-3, 5), Rational(5, 3))
+        self.assertEqual(sum([Rational(1, 2), Rational(1, 3), Rational(1, 6)]), Rational(1))
+        with self.assertRaises(ZeroDivisionError):
+            1 / Rational(0)
+
+    def test_integer_operations_stay_normalized(self):
+        r = Rational(5, 6)
+        for result, expected in ((r * 4, (10, 3)), (r * -3, (-5, 2)), (r / -10, (-1, 12)), (r * 0, (0, 1)),
+                                 (-10 / r, (-12, 1)), (r - 1, (-1, 6)), (0 / r, (0, 1))):
+            self.assertEqual((result.numerator, result.denominator), expected)
+
+    # Тесты возведения в степень
+    def test_pow(self):
+        self.assertEqual(Rational(2, 3) ** 3, Rational(8, 27))
+        self.assertEqual(Rational(-2, 3) ** -3, Rational(-27, 8))
+        self.assertEqual(Rational(5, 7) ** 0, Rational(1))
+        self.assertEqual(Rational(0) ** 5, Rational(0))
+        result = Rational(-6, 35) ** 40
+        self.assertEqual((result.numerator, result.denominator), (6 ** 40, 35 ** 40))
+        with self.assertRaises(ZeroDivisionError):
+            Rational(0) ** -1
+        with self.assertRaises(TypeError):
+            Rational(1, 2) ** Rational(1, 2)
+
+    def test_powers(self):
+        r = Rational(-3, 4)
+        expected = [Fraction(-3, 4) ** k for k in range(6)]
+        self.assertEqual(list(r.powers(5)), [Rational(value.numerator, value.denominator) for value in expected])
+        self.assertEqual(list(Rational(0).powers(2)), [Rational(1), Rational(0), Rational(0)])
+        with localcontext(max_denominator=100):
+            self.assertEqual(list(Rational(1, 3).powers(5))[-1], Rational(0, 1))
+        with self.assertRaises(ValueError):
+            Rational(1, 2).powers(-1)
+
+    # Тесты цепных дробей и приближений
+    def test_continued_fraction(self):
+        self.assertEqual(Rational(415, 93).continued_fraction(), [4, 2, 6, 7])
+        self.assertEqual(Rational(-7, 3).continued_fraction(), [-3, 1, 2])
+        self.assertEqual(Rational(5).continued_fraction(), [5])
+        for r in (Rational(415, 93), Rational(-7, 3), Rational(0), Rational(2 ** 100 + 1, 3 ** 50)):
+            self.assertEqual(Rational.from_continued_fraction(r.continued_fraction()), r)
+        self.assertEqual(Rational.from_continued_fraction(iter([1, 1, 1, 1, 1])), Rational(8, 5))
+
+    def test_convergents(self):
+        self.assertEqual(list(Rational(415, 93).convergents()),
+                         [Rational(4), Rational(9, 2), Rational(58, 13), Rational(415, 93)])
+        pi = Rational(3141592653589793, 10 ** 15)
+        convergents = pi.convergents()
+        self.assertEqual([next(convergents) for _ in range(4)],
+                         [Rational(3), Rational(22, 7), Rational(333, 106), Rational(355, 113)])
+
+    def test_limit_denominator(self):
+        pi = Rational(3141592653589793, 10 ** 15)
+        self.assertEqual(pi.limit_denominator(100), Rational(311, 99))
+        self.assertEqual(pi.limit_denominator(1000), Rational(355, 113))
+        self.assertEqual(Rational(1, 3).limit_denominator(3), Rational(1, 3))
+        with self.assertRaises(ValueError):
+            pi.limit_denominator(0)
+
+    def test_simplest_between(self):
+        self.assertEqual(Rational.simplest_between(Rational(3, 10), Rational(1, 3)), Rational(1, 3))
+        self.assertEqual(Rational.simplest_between(Rational(31, 100), Rational(8, 25)), Rational(5, 16))
+        self.assertEqual(Rational.simplest_between(Rational(-8, 25), Rational(-31, 100)), Rational(-5, 16))
+        self.assertEqual(Rational.simplest_between(Rational(-1, 2), 3), Rational(0))
+        self.assertEqual(Rational.simplest_between(Rational(7, 3), Rational(7, 3)), Rational(7, 3))
+        self.assertEqual(Rational.simplest_between(Rational(5, 2), 4), Rational(3))
+
+    def test_continued_fraction_invalid(self):
+        with self.assertRaises(ValueError):
+            Rational.from_continued_fraction([])
+        with self.assertRaises(ValueError):
+            Rational.from_continued_fraction([1, 0, 2])
+        with self.assertRaises(TypeError):
+            Rational.from_continued_fraction([1, 2.5])
+        with self.assertRaises(ValueError):
+            Rational.simplest_between(1, Rational(1, 2))
+        with self.assertRaises(TypeError):
+            Rational.simplest_between(0.5, 1)
+
     # Тесты операций с присваиванием
     def test_iadd(self):
         r = Rational(1, 2)
@@ -89,6 +223,26 @@ class TestRational(unittest.TestCase):
         r *= 4
         self.assertEqual(r, Rational(2, 1))
 
+    # Тесты суммирования и перемножения последовательностей
+    def test_sum(self):
+        values = [Rational(1, k) for k in range(1, 11)]
+        self.assertEqual(Rational.sum(values), Rational(7381, 2520))
+        self.assertEqual(Rational.sum([Rational(1, 2), 3, Rational(-1, 2)]), Rational(3))
+        self.assertEqual(Rational.sum(Rational(k, 6) for k in range(6)), Rational(5, 2))
+        self.assertEqual(Rational.sum([]), Rational(0))
+
+    def test_prod(self):
+        values = [Rational(k, k + 1) for k in range(1, 20)]
+        self.assertEqual(Rational.prod(values), Rational(1, 20))
+        self.assertEqual(Rational.prod([Rational(-2, 3), 3]), Rational(-2))
+        self.assertEqual(Rational.prod([]), Rational(1))
+
+    def test_sum_prod_invalid(self):
+        with self.assertRaises(TypeError):
+            Rational.sum([Rational(1, 2), 0.5])
+        with self.assertRaises(TypeError):
+            Rational.prod(["1"])
+
     # Тесты операций сравнения
     def test_eq(self):
         self.assertEqual(Rational(2, 1), 2)
@@ -100,6 +254,114 @@ class TestRational(unittest.TestCase):
         self.assertEqual(Rational(1, 2), 0.5)
         self.assertEqual(Rational(3, 2), 1.5)
 
+    def test_ordering(self):
+        self.assertLess(Rational(1, 3), Rational(1, 2))
+        self.assertLessEqual(Rational(2, 4), Rational(1, 2))
+        self.assertGreater(Rational(-1, 3), Rational(-1, 2))
+        self.assertGreaterEqual(Rational(7, 2), 3)
+        self.assertLess(-1, Rational(-1, 2))
+        self.assertEqual(max([Rational(1, 3), Rational(2, 5), Rational(-7, 2)]), Rational(2, 5))
+
+    def test_ordering_close_large_values(self):
+        a = Rational(3 ** 500, 7 ** 300)
+        b = Rational(3 ** 500 + 1, 7 ** 300)
+        self.assertLess(a, b)
+        self.assertGreater(b, a)
+        self.assertLess(Rational(2 ** 3000, 3 ** 1500), Rational(2 ** 3000 + 1, 3 ** 1500))
+        self.assertGreater(Rational(2 ** 2000 + 1, 2 ** 2000 - 1), 1)
+
+    def test_ordering_with_float_is_exact(self):
+        self.assertGreater(Rational(1, 3), 1 / 3)
+        self.assertLess(Rational(1, 10), 0.1)
+        self.assertLessEqual(Rational(5, 2), 2.5)
+        self.assertLess(Rational(10 ** 400), float("inf"))
+        self.assertFalse(Rational(1) < float("nan"))
+        self.assertFalse(Rational(1) >= float("nan"))
+
+    def test_sort_key(self):
+        values = [Rational(3 ** 200 + k, 2 ** 310) for k in (3, -1, 2)] + [Rational(-1, 2), Rational(0), 7, 0.25]
+        expected = [Rational(-1, 2), Rational(0), 0.25, 7] + [Rational(3 ** 200 + k, 2 ** 310) for k in (-1, 2, 3)]
+        self.assertEqual(sorted(values, key=Rational.sort_key), expected)
+        self.assertEqual(sorted(values[:3]), expected[4:])
+        with self.assertRaises(TypeError):
+            Rational.sort_key("1")
+
+    def test_sort_key_outside_float_range(self):
+        huge, negative_huge = Rational(10 ** 400, 3), Rational(-(10 ** 400) - 1, 3)
+        tiny, negative_tiny = Rational(1, 10 ** 400), Rational(-1, 10 ** 400)
+        values = [Rational(1), huge, negative_tiny, Rational(10 ** 400 + 1, 3), tiny, negative_huge, 0,
+                  Rational(2, 10 ** 400)]
+        expected = [negative_huge, negative_tiny, 0, tiny, Rational(2, 10 ** 400), Rational(1), huge,
+                    Rational(10 ** 400 + 1, 3)]
+        self.assertEqual(sorted(values, key=Rational.sort_key), expected)
+        self.assertEqual(min(values, key=Rational.sort_key), negative_huge)
+        self.assertEqual(max(values, key=Rational.sort_key), Rational(10 ** 400 + 1, 3))
+        self.assertEqual(min([tiny, negative_tiny, Rational(2, 10 ** 400)], key=Rational.sort_key), negative_tiny)
+
+    def test_ordering_invalid(self):
+        with self.assertRaises(TypeError):
+            Rational(1, 2) < "1"
+        with self.assertRaises(TypeError):
+            Rational(1, 2) >= [1]
+
+    # Тесты хеширования и интернирования
+    def test_hash_consistent_with_builtins(self):
+        self.assertEqual(hash(Rational(3)), hash(3))
+        self.assertEqual(hash(Rational(-1)), hash(-1))
+        self.assertEqual(hash(Rational(1, 2)), hash(0.5))
+        self.assertEqual(hash(Rational(-7, 3)), hash(Fraction(-7, 3)))
+        self.assertEqual(hash(Rational(10 ** 30, 7)), hash(Fraction(10 ** 30, 7)))
+
+    def test_hashable_collections(self):
+        values = {Rational(1, 2): "half", Rational(2): "two"}
+        self.assertEqual(values[Rational(2, 4)], "half")
+        self.assertEqual(values[2], "two")
+        self.assertEqual(len({Rational(1, 3), Rational(2, 6), Rational(-1, 3)}), 2)
+
+    def test_equality_with_float_is_exact(self):
+        self.assertNotEqual(Rational(1, 3), 0.3333)
+        self.assertNotEqual(Rational(1), float("nan"))
+        self.assertNotEqual(Rational(1), float("inf"))
+
+    def test_interned(self):
+        self.assertIs(Rational.interned(0), Rational.interned(0))
+        self.assertIs(Rational.interned(1, 2), Rational.interned(1, 2))
+        self.assertEqual(Rational.interned(-2, 4), Rational(-1, 2))
+        self.assertIsNot(Rational.interned(10 ** 20), Rational.interned(10 ** 20))
+
+    def test_intern_cache_eviction(self):
+        try:
+            Rational.set_intern_cache_size(2)
+            zero = Rational.interned(0)
+            one = Rational.interned(1)
+            self.assertIs(Rational.interned(0), zero)
+            Rational.interned(-1)  # вытесняет 1 – самое давно использованное значение
+            self.assertIs(Rational.interned(0), zero)
+            self.assertIsNot(Rational.interned(1), one)
+        finally:
+            Rational.set_intern_cache_size(256)
+
+    def test_intern_cache_threads(self):
+        # Маленький кэш постоянно вытесняет значения; параллельные запросы не должны приводить к KeyError
+        errors = []
+        def worker(offset):
+            try:
+                for k in range(2000):
+                    value = (k + offset) % 5
+                    self.assertEqual(Rational.interned(value, 3), Rational(value, 3))
+            except Exception as error:
+                errors.append(error)
+        try:
+            Rational.set_intern_cache_size(2)
+            threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            Rational.set_intern_cache_size(256)
+        self.assertEqual(errors, [])
+
     # Тесты крайних случаев
     def test_large_numbers(self):
         r = Rational(123456, 789012)
@@ -112,6 +374,115 @@ class TestRational(unittest.TestCase):
         self.assertEqual(r1 + r2, Rational(-23, 20))
         self.assertEqual(r1 * r2, Rational(3, 10))
 
+    # Тесты преобразования в вещественные числа
+    def test_float_conversion(self):
+        self.assertEqual(float(Rational(1, 3)), 1 / 3)
+        self.assertEqual(float(Rational(-7, 2)), -3.5)
+        self.assertEqual(float(Rational(10 ** 400 + 1, 10 ** 399)), 10.0)
+        self.assertEqual(float(Rational(1, 10 ** 400)), 0.0)
+        with self.assertRaises(OverflowError):
+            float(Rational(10 ** 400, 3))
+
+    def test_to_float_batch(self):
+        self.assertEqual(Rational.to_float([Rational(1, 4), 3, 0.5, Rational(3 ** 700, 3 ** 699)]), [0.25, 3.0, 0.5, 3.0])
+        self.assertEqual(Rational.to_float(Rational(k, 2) for k in range(3)), [0.0, 0.5, 1.0])
+        with self.assertRaises(TypeError):
+            Rational.to_float(["1"])
+
+    # Тесты неизменяемости
+    def test_immutable(self):
+        r = Rational(3, 4)
+        with self.assertRaises(AttributeError):
+            r.numerator = 5
+        with self.assertRaises(AttributeError):
+            r.extra = 1
+        self.assertFalse(hasattr(r, "__dict__"))
+        with self.assertRaises(AttributeError):
+            r._numerator = 5
+        with self.assertRaises(AttributeError):
+            del r._denominator
+        self.assertEqual(r, Rational(3, 4))
+        self.assertEqual(pickle.loads(pickle.dumps(r)), r)
+        self.assertEqual(copy.deepcopy(r), r)
+
+    def test_neg_returns_new_object(self):
+        r = Rational(3, 4)
+        self.assertEqual(-r, Rational(-3, 4))
+        self.assertEqual(r, Rational(3, 4))
+
+    def test_from_normalized(self):
+        r = Rational._from_normalized(3, 4)
+        self.assertEqual(r, Rational(3, 4))
+        self.assertIsInstance(r, Rational)
+
+    # Тесты контекста арифметики
+    def test_default_context_is_exact(self):
+        self.assertTrue(getcontext().exact)
+        self.assertEqual(Rational(1, 3) + Rational(1, 1009), Rational(1012, 3027))
+
+    def test_localcontext_max_denominator(self):
+        with localcontext(max_denominator=100) as context:
+            self.assertFalse(context.exact)
+            self.assertEqual(Rational(1, 3) + Rational(1, 1009), Rational(1, 3))
+            self.assertEqual(Rational(1, 3) + 1 / Rational(1009), Rational(1, 3))
+        self.assertEqual(getcontext(), ArithmeticContext())
+        self.assertEqual(Rational(1, 3) + Rational(1, 1009), Rational(1012, 3027))
+
+    def test_localcontext_max_bits(self):
+        with localcontext(max_bits=8):
+            r = Rational(1, 3) + Rational(1, 1009)
+            self.assertLess(r.denominator, 2 ** 8)
+            self.assertEqual(r, Rational(85, 254))
+            self.assertLessEqual(Rational.sum([Rational(1, k) for k in range(1, 20)]).denominator.bit_length(), 8)
+
+    def test_float_digits(self):
+        with localcontext(float_digits=1):
+            self.assertEqual(Rational(0.33), Rational(1, 3))
+        with localcontext(float_digits=None):
+            self.assertEqual(Rational(0.1), Rational(*(0.1).as_integer_ratio()))
+        self.assertEqual(Rational(2.3333), Rational(23333, 10000))
+
+    def test_float_simplest(self):
+        self.assertEqual(getcontext().float_digits, FLOAT_SIMPLEST)
+        self.assertEqual(Rational(0.1), Rational(1, 10))
+        self.assertEqual(Rational(1 / 3), Rational(1, 3))
+        self.assertEqual(Rational(-1e-7), Rational(-1, 10 ** 7))
+        self.assertEqual(Rational(2.0 ** 70), Rational(2 ** 70))
+        for value in (3.141592653589793, 0.1 + 0.2, 1e-300, 123456.789, 2.0 ** -1022, 5e-324):
+            r = Rational(value)
+            self.assertEqual(float(r), value)
+            self.assertLessEqual(r.denominator, value.as_integer_ratio()[1])
+
+    def test_context_is_thread_local(self):
+        results = []
+        def worker():
+            results.append((getcontext().exact, Rational(1, 3) + Rational(1, 1009)))
+        with localcontext(max_denominator=10):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+        self.assertEqual(results, [(True, Rational(1012, 3027))])
+
+    def test_setcontext(self):
+        previous = getcontext()
+        try:
+            setcontext(ArithmeticContext(max_denominator=7))
+            self.assertEqual(Rational(1, 2) + Rational(1, 100), Rational(1, 2))
+        finally:
+            setcontext(previous)
+        with self.assertRaises(TypeError):
+            setcontext(None)
+
+    def test_invalid_context(self):
+        with self.assertRaises(ValueError):
+            ArithmeticContext(max_denominator=0)
+        with self.assertRaises(ValueError):
+            ArithmeticContext(max_bits=0)
+        with self.assertRaises(ValueError):
+            ArithmeticContext(float_digits=-1)
+        with self.assertRaises(TypeError):
+            getcontext().copy(precision=3)
+
     # Тесты представления в виде строки
     def test_str(self):
         self.assertEqual(str(Rational(3, 4)), "3/4")
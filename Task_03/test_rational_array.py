@@ -0,0 +1,155 @@
+import unittest
+import numpy as np
+from rational import Rational
+from rational_array import RationalArray
+
+class TestRationalArray(unittest.TestCase):
+
+    # Тесты инициализации
+    def test_initialization_valid(self):
+        a = RationalArray([Rational(1, 2), Rational(-6, 9), 3])
+        self.assertEqual(len(a), 3)
+        self.assertEqual(a.to_list(), [Rational(1, 2), Rational(-2, 3), Rational(3)])
+        self.assertEqual(a.dtype, np.int64)
+
+    def test_from_columns(self):
+        a = RationalArray.from_columns([4, 3, 0], [8, -6, 5])
+        self.assertEqual(list(a.numerators), [1, -1, 0])
+        self.assertEqual(list(a.denominators), [2, 2, 1])
+
+    def test_from_columns_zero_denominator(self):
+        with self.assertRaises(ValueError):
+            RationalArray.from_columns([1, 2], [1, 0])
+
+    def test_invalid_type_initialization(self):
+        with self.assertRaises(TypeError):
+            RationalArray([Rational(1, 2), "1/2"])
+        with self.assertRaises(TypeError):
+            RationalArray.from_columns([1.5, 2], [1, 1])
+
+    # Тесты арифметических операций
+    def test_add(self):
+        a = RationalArray([Rational(1, 2), Rational(1, 3)])
+        b = RationalArray([Rational(1, 3), Rational(2, 3)])
+        self.assertEqual((a + b).to_list(), [Rational(5, 6), Rational(1)])
+        self.assertEqual((a + 1).to_list(), [Rational(3, 2), Rational(4, 3)])
+        self.assertEqual((1 + a).to_list(), [Rational(3, 2), Rational(4, 3)])
+
+    def test_sub(self):
+        a = RationalArray([Rational(3, 4), Rational(1, 2)])
+        self.assertEqual((a - Rational(1, 4)).to_list(), [Rational(1, 2), Rational(1, 4)])
+        self.assertEqual((1 - a).to_list(), [Rational(1, 4), Rational(1, 2)])
+
+    def test_mul(self):
+        a = RationalArray([Rational(2, 3), Rational(-3, 4)])
+        b = RationalArray([Rational(3, 4), Rational(4, 3)])
+        self.assertEqual((a * b).to_list(), [Rational(1, 2), Rational(-1)])
+        self.assertEqual((3 * a).to_list(), [Rational(2), Rational(-9, 4)])
+
+    def test_truediv(self):
+        a = RationalArray([Rational(3, 4), Rational(1, 2)])
+        b = RationalArray([Rational(1, 2), Rational(-1, 4)])
+        self.assertEqual((a / b).to_list(), [Rational(3, 2), Rational(-2)])
+        self.assertEqual((1 / b).to_list(), [Rational(2), Rational(-4)])
+
+    def test_div_by_zero(self):
+        a = RationalArray([Rational(3, 4), Rational(1, 2)])
+        with self.assertRaises(ZeroDivisionError):
+            a / RationalArray([1, 0])
+        with self.assertRaises(ZeroDivisionError):
+            a / 0
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            RationalArray([1, 2]) + RationalArray([1, 2, 3])
+
+    # Тесты перехода к длинной арифметике
+    def test_overflow_promotion(self):
+        big = 2 ** 40 + 1
+        a = RationalArray.from_columns([big, 1], [3, big])
+        product = a * a
+        self.assertEqual(product.dtype, object)
+        self.assertEqual(product[0], Rational(big * big, 9))
+        self.assertEqual(product[1], Rational(1, big * big))
+
+    def test_add_denominator_overflow(self):
+        # Числители малы, но произведение знаменателей не помещается в int64
+        a = RationalArray([Rational(1, 2 ** 40), Rational(3, 7)])
+        b = RationalArray([Rational(1, 3 ** 25), Rational(-1, 5 ** 27)])
+        self.assertEqual((a + b).to_list(), [Rational(1, 2 ** 40) + Rational(1, 3 ** 25),
+                                             Rational(3, 7) - Rational(1, 5 ** 27)])
+        self.assertEqual((a - b).to_list(), [Rational(1, 2 ** 40) - Rational(1, 3 ** 25),
+                                             Rational(3, 7) + Rational(1, 5 ** 27)])
+        values = [Rational(1, 2 ** 40), Rational(1, 3 ** 25), Rational(1, 5 ** 20)]
+        self.assertEqual(RationalArray(values).sum(), Rational.sum(values))
+
+    def test_demotion_after_reduction(self):
+        big = 2 ** 40 + 1
+        a = RationalArray.from_columns([big], [3])
+        self.assertEqual((a * a / a).dtype, np.int64)
+        self.assertEqual((a * a / a)[0], Rational(big, 3))
+
+    def test_bigint_columns(self):
+        huge = 10 ** 30
+        a = RationalArray([Rational(huge, 7), Rational(1, huge)])
+        self.assertEqual(a.dtype, object)
+        self.assertEqual((a + a).to_list(), [Rational(2 * huge, 7), Rational(2, huge)])
+
+    # Тесты операций сравнения
+    def test_comparisons(self):
+        a = RationalArray([Rational(1, 2), Rational(1, 3), Rational(-1, 2)])
+        b = RationalArray([Rational(2, 4), Rational(1, 2), Rational(-2, 3)])
+        self.assertEqual(list(a == b), [True, False, False])
+        self.assertEqual(list(a != b), [False, True, True])
+        self.assertEqual(list(a < b), [False, True, False])
+        self.assertEqual(list(a <= b), [True, True, False])
+        self.assertEqual(list(a > b), [False, False, True])
+        self.assertEqual(list(a >= Rational(1, 3)), [True, True, False])
+
+    # Тесты свертки
+    def test_sum_prod(self):
+        a = RationalArray([Rational(1, k) for k in range(1, 12)])
+        self.assertEqual(a.sum(), Rational(83711, 27720))
+        self.assertEqual(a.prod(), Rational(1, 39916800))
+        self.assertEqual(RationalArray().sum(), Rational(0))
+        self.assertEqual(RationalArray().prod(), Rational(1))
+
+    def test_min_max(self):
+        a = RationalArray([Rational(1, 3), Rational(-5, 2), Rational(7, 2), Rational(1, 2), 0])
+        self.assertEqual(a.min(), Rational(-5, 2))
+        self.assertEqual(a.max(), Rational(7, 2))
+        with self.assertRaises(ValueError):
+            RationalArray().min()
+
+    def test_concatenate(self):
+        a = RationalArray([Rational(1, 2)])
+        b = RationalArray([Rational(10 ** 30, 7), 3])
+        self.assertEqual(RationalArray.concatenate((a, b)).to_list(), [Rational(1, 2), Rational(10 ** 30, 7), Rational(3)])
+
+    def test_to_float(self):
+        a = RationalArray([Rational(1, 2), Rational(-1, 3), Rational(10 ** 30, 7)])
+        self.assertEqual(list(a.to_float()), [0.5, -1 / 3, 10 ** 30 / 7])
+        self.assertEqual(list(Rational.to_float(a)), [0.5, -1 / 3, 10 ** 30 / 7])
+
+    # Тесты индексации и представления в виде строки
+    def test_indexing(self):
+        a = RationalArray([Rational(1, 2), Rational(2, 3), Rational(3, 4)])
+        self.assertEqual(a[1], Rational(2, 3))
+        self.assertEqual(a[-1], Rational(3, 4))
+        self.assertEqual(a[1:].to_list(), [Rational(2, 3), Rational(3, 4)])
+
+    def test_str(self):
+        a = RationalArray([Rational(1, 2), 3])
+        self.assertEqual(str(a), "[1/2, 3/1]")
+        self.assertEqual(repr(a), "RationalArray([Rational(1, 2), Rational(3, 1)])")
+
+    # Тесты обработки ошибок
+    def test_invalid_operations(self):
+        a = RationalArray([Rational(1, 2)])
+        with self.assertRaises(TypeError):
+            a + "invalid"
+        with self.assertRaises(TypeError):
+            a * [1, 2]
+
+if __name__ == '__main__':
+    unittest.main()